@@ -0,0 +1,105 @@
+"""
+Fetch concurrency/backoff benchmark against the local stand-in Steam Market server.
+
+Every configuration fetches the same synthetic names from a fresh stand-in server
+with the same latency and 429 pattern, so results are repeatable and need no network.
+
+Usage (from the repository root):
+    python benchmarks/bench_fetch.py [--items 200] [--workers 1 4 8] [--rates 5 20]
+        [--latency 0.05] [--jitter 0.02] [--burst-every 50] [--burst-length 5]
+        [--retry-after 1] [--max-per-second 0] [--output bench_fetch.json]
+    python benchmarks/bench_fetch.py --serve [--port 8765] [...]   ← run the server only
+        (then INVENTORY_PRICE_URL=http://127.0.0.1:8765/market/priceoverview/ python src/main.py)
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from market import fetch_engine  # noqa: E402
+from market.price_client import PriceClient  # noqa: E402
+from market.rate_limiter import DEFAULT_BURST, AdaptiveRateLimiter  # noqa: E402
+from market.stand_in_server import StandInConfig, StandInServer  # noqa: E402
+from utils import helpers  # noqa: E402
+from utils.metrics import METRICS  # noqa: E402
+
+
+def build_config(args):
+    return StandInConfig(latency=args.latency, jitter=args.jitter, burst_every=args.burst_every,
+                         burst_length=args.burst_length, max_per_second=args.max_per_second,
+                         retry_after=args.retry_after, seed=args.seed)
+
+
+def run_case(args, workers, rate):
+    items = [{"market_hash_name": f"Synthetic Item {i}", "appid": 730} for i in range(args.items)]
+    METRICS.reset()
+    with StandInServer(build_config(args)) as server:
+        client = PriceClient(AdaptiveRateLimiter(rate, DEFAULT_BURST), pool_size=workers, base_url=server.url)
+        start = time.perf_counter()
+        try:
+            prices = fetch_engine.fetch_prices(items, max_workers=workers, client=client,
+                                               on_result=lambda *result: None)
+        finally:
+            client.close()
+        seconds = time.perf_counter() - start
+
+    metrics = METRICS.as_dict()
+    return {
+        "workers": workers,
+        "rate": rate,
+        "seconds": seconds,
+        "items": len(items),
+        "priced": sum(1 for price in prices.values() if price),
+        "requests": server.state.requests,
+        "throttled": server.state.throttled,
+        "rate_limit_wait_seconds": metrics["durations_seconds"].get("rate_limit_wait_seconds", 0.0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark price fetching against a local stand-in server")
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--rates", type=float, nargs="+", default=[5.0, 20.0])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--burst-every", type=int, default=50)
+    parser.add_argument("--burst-length", type=int, default=5)
+    parser.add_argument("--max-per-second", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_fetch.json")
+    parser.add_argument("--serve", action="store_true", help="only run the stand-in server")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.serve:
+        server = StandInServer(build_config(args), port=args.port).start()
+        print(f"Stand-in priceoverview server at {server.url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+        return
+
+    helpers.set_log_level("quiet")
+    results = []
+    for rate in args.rates:
+        for workers in args.workers:
+            result = run_case(args, workers, rate)
+            results.append(result)
+            print(f"rate {rate:6.1f}/s  workers {workers:3d}: {result['seconds']:8.2f}s  "
+                  f"{result['requests']} requests, {result['throttled']} throttled, "
+                  f"waited {result['rate_limit_wait_seconds']:.1f}s")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"config": vars(args), "results": results}, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
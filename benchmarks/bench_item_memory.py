@@ -0,0 +1,55 @@
+"""
+Memory benchmark: merged per-asset dicts vs compact Items.
+
+Usage (from the repository root):
+    python benchmarks/bench_item_memory.py [asset_count] [description_count]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from inventory import inventory_fetcher  # noqa: E402
+from synthetic_inventory import generate_inventory  # noqa: E402
+
+
+def legacy_parse(raw):
+    """The previous parse_inventory: every asset gets its own merged copy."""
+    desc_map = {(d.get("classid"), d.get("instanceid")): d for d in raw["descriptions"]}
+    merged = []
+    for asset in raw["assets"]:
+        desc = desc_map.get((asset.get("classid"), asset.get("instanceid")), {})
+        item = {**asset, **desc}
+        item["marketable"] = inventory_fetcher.is_marketable(desc)
+        item["category"] = inventory_fetcher.categorize_item(desc)
+        merged.append(item)
+    return merged
+
+
+def measure(parse, raw):
+    tracemalloc.start()
+    items = parse(raw)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(items), retained, peak
+
+
+def main():
+    asset_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    description_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    raw = generate_inventory(asset_count, description_count)
+
+    print(f"{asset_count} assets, {description_count} descriptions")
+    results = {}
+    for label, parse in (("merged dicts", legacy_parse), ("compact items", inventory_fetcher.parse_inventory)):
+        count, retained, peak = measure(parse, raw)
+        results[label] = retained
+        print(f"{label:>14}: {count} items, retained {retained / 1e6:8.2f} MB, peak {peak / 1e6:8.2f} MB")
+
+    ratio = results["merged dicts"] / max(results["compact items"], 1)
+    print(f"Compact items use {ratio:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark suite for the inventory pipeline on synthetic exports.
+
+Times each stage and records its peak traced memory, then writes machine-readable
+JSON so runs from different commits can be compared.
+
+Usage (from the repository root):
+    python benchmarks/run_benchmarks.py [--sizes 1000 100000 1000000] [--repeat 3]
+        [--output bench_results.json] [--compare previous.json]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from filtering import filter_manager  # noqa: E402
+from inventory import inventory_fetcher  # noqa: E402
+from market import price_fetcher  # noqa: E402
+from queue_manager_pkg import queue_manager  # noqa: E402
+from synthetic_inventory import generate_inventory  # noqa: E402
+from utils import helpers  # noqa: E402
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+PRICE_STRINGS = ("$0.03", "CDN$ 5.44", "$1,234.56", "12,34€", "", None)
+
+
+# -----------------------------
+# Measurement
+# -----------------------------
+def measure(func, repeat):
+    """Best wall time over `repeat` runs, plus peak traced memory of one extra run."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def build_cases(size):
+    """Return [(name, callable)] for one inventory size. Inputs are prepared up front."""
+    raw = generate_inventory(size, max_stack=3)
+    items = inventory_fetcher.parse_inventory(raw)
+    descriptions = raw["descriptions"]
+    queue = queue_manager.build_listing_queue(items)
+    table = filter_manager.build_table(items)  # built once; a plain list without NumPy
+    price_strings = [PRICE_STRINGS[i % len(PRICE_STRINGS)] for i in range(size)]
+    export_path = os.path.join(tempfile.gettempdir(), f"bench_queue_{size}.json")
+    jsonl_path = export_path + "l"
+
+    def classify_uncached():
+        inventory_fetcher.classify_type.cache_clear()
+        for desc in descriptions:
+            inventory_fetcher.categorize_item(desc)
+
+    return [
+        ("parse_inventory", lambda: inventory_fetcher.parse_inventory(raw)),
+        ("categorize_item", classify_uncached),
+        ("detect_category", lambda: [filter_manager.detect_category(item) for item in items]),
+        ("apply_filters", lambda: filter_manager.apply_filters(items, ["weapon skin", "case"], 0.5, 50.0)),
+        ("apply_filters_all", lambda: filter_manager.apply_filters(items)),
+        ("apply_filters_top25", lambda: filter_manager.apply_filters(items, limit=25)),
+        ("build_table", lambda: filter_manager.build_table(items)),
+        ("table_filters", lambda: filter_manager.apply_filters(table, ["weapon skin", "case"], 0.5, 50.0)),
+        ("table_filters_all", lambda: filter_manager.apply_filters(table)),
+        ("table_filters_top25", lambda: filter_manager.apply_filters(table, limit=25)),
+        ("summarize", lambda: filter_manager.summarize(items)),
+        ("build_listing_queue", lambda: queue_manager.build_listing_queue(items)),
+        ("export_queue", lambda: queue_manager.export_queue(queue, export_path)),
+        ("stream_queue_jsonl", lambda: queue_manager.export_queue(queue_manager.iter_listing_queue(items), jsonl_path)),
+        ("clean_steam_price", lambda: [price_fetcher.clean_steam_price(p) for p in price_strings]),
+    ], (export_path, jsonl_path)
+
+
+def run_suite(sizes, repeat):
+    results = []
+    for size in sizes:
+        print(f"== {size} items")
+        cases, export_paths = build_cases(size)
+        for name, func in cases:
+            stats = measure(func, repeat)
+            results.append({"benchmark": name, "size": size, **stats})
+            print(f"{name:>20}: {stats['seconds'] * 1000:10.2f} ms  peak {stats['peak_bytes'] / 1e6:9.2f} MB")
+        for export_path in export_paths:
+            if os.path.exists(export_path):
+                os.remove(export_path)
+    return results
+
+
+# -----------------------------
+# Output
+# -----------------------------
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["benchmark"], r["size"]): r for r in json.load(f)["results"]}
+    print(f"\n== Compared with {baseline_path}")
+    for result in results:
+        old = baseline.get((result["benchmark"], result["size"]))
+        if not old or not old["seconds"]:
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        flag = "  <-- slower" if ratio > 1.10 else ""
+        print(f"{result['benchmark']:>20} @ {result['size']:>8}: {ratio:6.2f}x time{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the inventory pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", default=None, help="previous results JSON to compare against")
+    args = parser.parse_args()
+
+    # Stage functions log through helpers; keep the terminal for the results table
+    helpers.set_log_level("quiet")
+
+    results = run_suite(args.sizes, args.repeat)
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
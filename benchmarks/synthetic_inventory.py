@@ -0,0 +1,99 @@
+"""
+Synthetic Steam inventory export generator.
+
+Usage (from the repository root):
+    python benchmarks/synthetic_inventory.py OUTPUT.json [--assets N] [--descriptions N]
+        [--max-stack N] [--seed N] [--assets-first]
+"""
+import argparse
+import json
+import random
+
+# Steam `type` strings and how often they appear, roughly like a CS2 inventory
+DEFAULT_TYPE_WEIGHTS = {
+    "Mil-Spec Grade Rifle": 20,
+    "Restricted Pistol": 15,
+    "Classified SMG": 8,
+    "Covert Sniper Rifle": 3,
+    "Base Grade Container": 20,
+    "High Grade Sticker": 15,
+    "Base Grade Key": 4,
+    "★ Covert Knife": 2,
+    "★ Extraordinary Gloves": 1,
+    "Base Grade Graffiti": 7,
+    "High Grade Music Kit": 5,
+}
+
+ICON_URL = "-9a81dlWLwJ2UUGcVs_nsVtzdOEdtWwKGZZLQHTxDZ7I56KU0Zwwo4NUX4oFJZEHLbXH5ApeO4YmlhxYQknCRvCo04DEVlxkKgpot7HxfDhjxszJemkV09-5lpKKqPrxN7LEmyVQ7MEpiLuSrYmnjQO3-UdsZGHyd4_Bd1RvNQ7T_FDrw-_ng5Pu75iY1zI97bhLsvQz"
+
+
+def generate_inventory(asset_count, description_count=None, max_stack=1, type_weights=None,
+                       seed=0, assets_first=False, with_prices=True):
+    """
+    Build a raw Steam inventory export dict.
+    - asset_count: number of entries in `assets`
+    - description_count: distinct (classid, instanceid) pairs, default asset_count // 50
+    - max_stack: amounts are drawn from 1..max_stack (stacked items such as cases)
+    - type_weights: {type string: relative frequency}
+    - assets_first: put `assets` before `descriptions` in the dict (and so in the file)
+    - with_prices: add a recommended_price to each description
+    """
+    rng = random.Random(seed)
+    description_count = description_count or max(1, asset_count // 50)
+    weights = type_weights or DEFAULT_TYPE_WEIGHTS
+    types = list(weights)
+    type_choices = rng.choices(types, weights=[weights[t] for t in types], k=description_count)
+
+    descriptions = []
+    for i, type_name in enumerate(type_choices):
+        desc = {
+            "appid": 730,
+            "classid": str(1000000 + i),
+            "instanceid": str(rng.choice((0, 0, 0, 188530139))),
+            "market_hash_name": f"Synthetic {type_name.split()[-1]} {i} (Field-Tested)",
+            "type": type_name,
+            "marketable": 0 if rng.random() < 0.05 else 1,
+            "icon_url": ICON_URL,
+            "descriptions": [{"type": "html", "value": "Exterior: Field-Tested"}],
+            "tags": [{"category": "Type", "internal_name": type_name.split()[-1]}],
+        }
+        if with_prices:
+            desc["recommended_price"] = round(rng.lognormvariate(0, 1.5), 2)
+        descriptions.append(desc)
+
+    assets = []
+    for i in range(asset_count):
+        desc = descriptions[rng.randrange(description_count)]
+        assets.append({
+            "appid": 730,
+            "contextid": "2",
+            "assetid": str(30000000000 + i),
+            "classid": desc["classid"],
+            "instanceid": desc["instanceid"],
+            "amount": str(rng.randint(1, max_stack)),
+        })
+
+    if assets_first:
+        return {"assets": assets, "descriptions": descriptions, "total_inventory_count": asset_count}
+    return {"descriptions": descriptions, "assets": assets, "total_inventory_count": asset_count}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic Steam inventory export")
+    parser.add_argument("output")
+    parser.add_argument("--assets", type=int, default=10_000)
+    parser.add_argument("--descriptions", type=int, default=None)
+    parser.add_argument("--max-stack", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--assets-first", action="store_true")
+    args = parser.parse_args()
+
+    raw = generate_inventory(args.assets, args.descriptions, args.max_stack,
+                             seed=args.seed, assets_first=args.assets_first)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(raw, f)
+    print(f"Wrote {len(raw['assets'])} assets / {len(raw['descriptions'])} descriptions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
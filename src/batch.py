@@ -0,0 +1,165 @@
+"""
+Batch valuation of many account exports: exports are parsed and classified in parallel
+worker processes, every market_hash_name is priced once for all accounts, then each
+account and the combined inventory are valued.
+
+Usage (from src/):
+    python batch.py EXPORT_OR_DIR [EXPORT_OR_DIR ...] [--workers N] [--prices json|cache|live|dump]
+        [--dump PATH] [--rate R] [--currency USD|CAD] [--format text|json|csv] [--output PATH] [--quiet]
+
+Example:
+    python batch.py exports/ --prices cache --format json --output valuation.json
+
+Exports split into pages (more_items/last_assetid) go in one subdirectory per account.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+
+from cli import build_provider
+from inventory import accounts as account_batch, export_pages, inventory_stream
+from inventory.incremental import STATE_SUFFIX
+from main import report_metrics
+from market import price_history, price_providers
+from market.exchange_rates import CURRENCY_IDS, format_money
+from market.rate_limiter import DEFAULT_RATE
+from utils.helpers import flush_logs, info, set_log_level, set_output_stream, warn
+from utils.metrics import METRICS
+
+
+# -----------------------------
+# Arguments
+# -----------------------------
+def is_account_export(path):
+    """A file, or a folder whose first page, with an assets/descriptions top level."""
+    pages = export_pages.page_files(path)
+    return bool(pages) and inventory_stream.is_inventory_export(pages[0])
+
+
+def expand_exports(paths):
+    """
+    Exports in the order given. A directory contributes its *.json files, sorted, and
+    each of its subdirectories as one account exported in several pages. Other JSON
+    found there (incremental state, exchange rates, price dumps, cassettes) is skipped.
+    """
+    exports = []
+    for path in paths:
+        if os.path.isdir(path):
+            # "*/" matches the subdirectories, each one account's export pages
+            found = glob.glob(os.path.join(path, "*.json")) + glob.glob(os.path.join(path, "*", ""))
+            for export in sorted(found):
+                if export.endswith(STATE_SUFFIX):
+                    continue
+                if is_account_export(export):
+                    exports.append(export)
+                else:
+                    info(f"Skipping {export}: not an inventory export")
+        else:
+            exports.append(path)
+    seen = set()
+    return [path for path in exports if not (path in seen or seen.add(path))]
+
+
+# -----------------------------
+# Output
+# -----------------------------
+def write_report(valuation, currency, args, out):
+    accounts = valuation["accounts"]
+    combined = valuation["combined"]
+    if args.format == "json":
+        json.dump({"currency": currency, **valuation}, out, indent=2)
+        out.write("\n")
+    elif args.format == "csv":
+        writer = csv.writer(out)
+        writer.writerow(("account", "assets", "items", "units", "value", "share", "non_marketable_units"))
+        for name, summary in accounts.items():
+            writer.writerow((name, summary["assets"], summary["items"], summary["units"],
+                             f"{summary['value']:.2f}", f"{summary['share']:.4f}",
+                             summary["non_marketable"]["units"]))
+        writer.writerow(("combined", combined["assets"], combined["items"], combined["units"],
+                         f"{combined['value']:.2f}", "1.0000" if combined["value"] else "0.0000",
+                         combined["non_marketable"]["units"]))
+    else:
+        width = max([len(name) for name in accounts] + [len("combined")])
+        out.write(f"\n{'account':<{width}}  {'assets':>8}  {'items':>7}  {'units':>8}  {'value':>14}  share\n")
+        for name, summary in sorted(accounts.items(), key=lambda entry: entry[1]["value"], reverse=True):
+            out.write(f"{name:<{width}}  {summary['assets']:>8}  {summary['items']:>7}  {summary['units']:>8}  "
+                      f"{format_money(summary['value'], currency):>14}  {summary['share']:6.1%}\n")
+        out.write(f"{'combined':<{width}}  {combined['assets']:>8}  {combined['items']:>7}  {combined['units']:>8}  "
+                  f"{format_money(combined['value'], currency):>14}\n")
+        if combined["non_marketable"]["items"]:
+            out.write(f"Not valued (not marketable): {combined['non_marketable']['items']} items, "
+                      f"{combined['non_marketable']['units']} units\n")
+        out.write("\nCombined by category:\n")
+        for category, totals in sorted(combined["by_category"].items(), key=lambda entry: entry[1]["value"],
+                                       reverse=True):
+            out.write(f"  {category:<12} {totals['units']:>8} units  {format_money(totals['value'], currency):>14}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Value many Steam inventory exports with one shared pricing step")
+    parser.add_argument("exports", nargs="+", help="inventory JSON exports, or directories of them")
+    parser.add_argument("--workers", type=int, default=None, help="parse processes (default: one per CPU core)")
+    parser.add_argument("--prices", choices=("json", "cache", "live", "dump"), default="json")
+    parser.add_argument("--dump", help="price dump file for --prices dump")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="requests per second for --prices live")
+    parser.add_argument("--currency", choices=("USD", "CAD"), default="USD")
+    parser.add_argument("--format", choices=("text", "json", "csv"), default="text")
+    parser.add_argument("--output", help="write the report here instead of stdout")
+    parser.add_argument("--quiet", action="store_true", help="only print warnings and the report")
+    args = parser.parse_args(argv)
+
+    if args.quiet:
+        set_log_level("quiet")
+    if not args.output and args.format != "text":
+        # The report owns stdout; progress, warnings and metrics go to stderr
+        set_output_stream(sys.stderr)
+
+    paths = expand_exports(args.exports)
+    if not paths:
+        parser.error("no inventory exports found")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    with METRICS.stage("load"):
+        accounts = account_batch.load_accounts(paths, args.workers)
+    if not accounts:
+        warn("No account could be loaded. Exiting.")
+        return 1
+    shared = account_batch.merge_holdings(accounts)
+    per_account_items = sum(len(account["holdings"]) for account in accounts)
+    info(f"Loaded {len(accounts)} accounts: {per_account_items} holdings, {len(shared)} unique names")
+
+    currency_id = CURRENCY_IDS[args.currency]
+    provider = build_provider(args, parser)
+    marketable_items = [item for item in shared if item["marketable"]]
+    with METRICS.stage("pricing"):
+        priced = price_providers.apply_prices_safely(provider, marketable_items, currency_id)
+        account_batch.apply_shared_prices(accounts, shared)
+    info(f"Priced {priced} of {len(marketable_items)} unique items from {provider.name}")
+    price_history.record_prices(marketable_items, currency_id)
+
+    with METRICS.stage("output"):
+        valuation = account_batch.value_accounts(accounts)
+        flush_logs()
+        if args.output:
+            try:
+                with open(args.output, "w", encoding="utf-8", newline="") as f:
+                    write_report(valuation, args.currency, args, f)
+            except OSError as e:
+                warn(f"Could not write report: {e}")
+                return 1
+            info(f"Valuation of {len(accounts)} accounts written to {args.output}")
+        else:
+            write_report(valuation, args.currency, args, sys.stdout)
+
+    if not args.quiet:
+        report_metrics()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Non-interactive inventory report: price an export once, then evaluate any number of
+named filter views over it in a single pass.
+
+Usage (from src/):
+    python cli.py EXPORT.json|PAGES_DIR|PAGE.json... [--prices json|cache|live|dump] [--dump PATH] [--currency USD|CAD]
+        [--view NAME=EXPRESSION ...] [--views-file views.json] [--sort price|name|value]
+        [--top N] [--format text|json|csv] [--output PATH] [--quiet]
+
+Example:
+    python cli.py inventory.json --view 'knives=category in (knife, gloves) and price > 50' \\
+        --view 'doppler=name ~ "Doppler"' --view 'cheap=price < 0.10' --sort value --top 5
+"""
+import argparse
+import csv
+import json
+import sys
+
+from filtering import filter_manager
+from filtering.filter_expr import FilterSyntaxError, compile_filter
+from main import load_holdings, report_metrics
+from market import price_history, price_providers
+from market.exchange_rates import CURRENCY_IDS
+from market.rate_limiter import DEFAULT_RATE
+from utils.helpers import flush_logs, info, set_log_level, set_output_stream, warn
+from utils.metrics import METRICS
+
+
+# -----------------------------
+# Arguments
+# -----------------------------
+def parse_views(args, parser):
+    """Collect NAME=EXPRESSION views from --view and --views-file, compiled up front."""
+    views = {}
+    if args.views_file:
+        with open(args.views_file, "r", encoding="utf-8") as f:
+            views.update(json.load(f))
+    for view in args.view or []:
+        name, separator, expression = view.partition("=")
+        if not separator or not name.strip():
+            parser.error(f"--view needs NAME=EXPRESSION, got {view!r}")
+        views[name.strip()] = expression
+    if not views:
+        views["all"] = ""
+
+    compiled = {}
+    for name, expression in views.items():
+        try:
+            compiled[name] = compile_filter(expression)
+        except FilterSyntaxError as e:
+            parser.error(f"view {name!r}: {e}")
+    return compiled
+
+
+def build_provider(args, parser):
+    if args.prices == "cache":
+        return price_providers.CachePriceProvider()
+    if args.prices == "dump":
+        if not args.dump:
+            parser.error("--prices dump needs --dump PATH")
+        return price_providers.DumpFilePriceProvider(args.dump)
+    if args.prices == "live":
+        return price_providers.LiveSteamProvider(rate=args.rate)
+    return price_providers.JsonPriceProvider()
+
+
+# -----------------------------
+# Output
+# -----------------------------
+def write_report(results, args, out):
+    if args.format == "json":
+        json.dump({name: result.as_dict(args.top) for name, result in results.items()}, out, indent=2)
+        out.write("\n")
+    elif args.format == "csv":
+        writer = csv.writer(out)
+        writer.writerow(("view", "market_hash_name", "category", "quantity", "recommended_price"))
+        for name, result in results.items():
+            for row in result.as_dict(args.top)["items"]:
+                writer.writerow((name, row["market_hash_name"], row["category"], row["quantity"],
+                                 f"{row['recommended_price'] or 0:.2f}"))
+    else:
+        for name, result in results.items():
+            data = result.as_dict(args.top)
+            out.write(f"\n== {name}: {data['count']} items, {data['quantity']} units, "
+                      f"${data['value']:.2f}  [{data['expression'] or 'everything'}]\n")
+            for row in data["items"]:
+                out.write(f"{row['market_hash_name']} x{row['quantity']} - ${row['recommended_price'] or 0:.2f}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate filter views over a Steam inventory export")
+    parser.add_argument("export", nargs="+",
+                        help="Steam inventory JSON export, a folder of export pages, or several page files")
+    parser.add_argument("--prices", choices=("json", "cache", "live", "dump"), default="json")
+    parser.add_argument("--dump", help="price dump file for --prices dump")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="requests per second for --prices live")
+    parser.add_argument("--currency", choices=("USD", "CAD"), default="USD")
+    parser.add_argument("--view", action="append", metavar="NAME=EXPRESSION")
+    parser.add_argument("--views-file", help="JSON object of {name: expression}")
+    parser.add_argument("--sort", choices=("price", "name", "value"), default="value")
+    parser.add_argument("--top", type=int, default=None, help="items listed per view (default: all)")
+    parser.add_argument("--format", choices=("text", "json", "csv"), default="text")
+    parser.add_argument("--output", help="write the report here instead of stdout")
+    parser.add_argument("--quiet", action="store_true", help="only print warnings and the report")
+    args = parser.parse_args(argv)
+
+    if args.quiet:
+        set_log_level("quiet")
+    if not args.output and args.format != "text":
+        # The report owns stdout; progress, warnings and metrics go to stderr
+        set_output_stream(sys.stderr)
+    views = parse_views(args, parser)
+
+    _, holdings = load_holdings(args.export[0] if len(args.export) == 1 else args.export)
+    if not holdings:
+        return 1
+
+    currency_id = CURRENCY_IDS[args.currency]
+    provider = build_provider(args, parser)
+    marketable_items = [item for item in holdings if item.get("marketable", True)]
+    with METRICS.stage("pricing"):
+        priced = price_providers.apply_prices_safely(provider, marketable_items, currency_id)
+    info(f"Priced {priced} of {len(marketable_items)} items from {provider.name}")
+    price_history.record_prices(marketable_items, currency_id)
+
+    with METRICS.stage("filtering"):
+        results = filter_manager.evaluate_views(holdings, views, args.sort)
+
+    flush_logs()
+    if args.output:
+        try:
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                write_report(results, args, f)
+        except OSError as e:
+            warn(f"Could not write report: {e}")
+            return 1
+        info(f"Report for {len(results)} views written to {args.output}")
+    else:
+        write_report(results, args, sys.stdout)
+
+    if not args.quiet:
+        report_metrics()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# Fields an expression can test; callers compute them once per row (see filter_manager.evaluate_views)
+FIELDS = ("category", "price", "name", "quantity", "value", "type")
+NUMERIC_FIELDS = {"price", "quantity", "value"}
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?)
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>==|!=|<=|>=|<|>|~|=|\(|\)|,)
+      | (?P<word>[A-Za-z_][\w\-]*)
+    )""", re.VERBOSE)
+
+_KEYWORDS = {"and", "or", "not", "in"}
+
+
+class FilterSyntaxError(ValueError):
+    """Raised for an expression that cannot be parsed, with the offending position."""
+
+
+# -----------------------------
+# Tokenizer
+# -----------------------------
+def _tokenize(text: str) -> List[Tuple[str, Any, int]]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match or match.end() == position:
+            bad = len(text) - len(text[position:].lstrip())  # point past the whitespace at the character
+            raise FilterSyntaxError(f"Unexpected character at {bad}: {text[bad:bad + 10]!r}")
+        kind = match.lastgroup
+        raw = match.group(kind)
+        start = match.start(kind)
+        if kind == "number":
+            tokens.append(("value", float(raw), start))
+        elif kind == "string":
+            tokens.append(("value", re.sub(r"\\(.)", r"\1", raw[1:-1]), start))
+        elif kind == "word" and raw.lower() in _KEYWORDS:
+            tokens.append(("keyword", raw.lower(), start))
+        elif kind == "word":
+            tokens.append(("word", raw, start))
+        else:
+            tokens.append(("op", "==" if raw == "=" else raw, start))
+        position = match.end()
+    tokens.append(("end", None, len(text)))
+    return tokens
+
+
+# -----------------------------
+# Parser / compiler
+# -----------------------------
+class _Parser:
+    """
+    Recursive-descent parser that compiles straight to closures:
+        expr       := and_expr ("or" and_expr)*
+        and_expr   := not_expr ("and" not_expr)*
+        not_expr   := "not" not_expr | "(" expr ")" | comparison
+        comparison := field op value | field ["not"] "in" "(" value ("," value)* ")"
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.index = 0
+        self.fields: Set[str] = set()
+
+    def peek(self) -> Tuple[str, Any, int]:
+        return self.tokens[self.index]
+
+    def take(self) -> Tuple[str, Any, int]:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def expect(self, kind: str, value: Any = None) -> Tuple[str, Any, int]:
+        token = self.take()
+        if token[0] != kind or (value is not None and token[1] != value):
+            wanted = value or kind
+            raise FilterSyntaxError(f"Expected {wanted!r} at {token[2]} in {self.text!r}")
+        return token
+
+    def parse(self) -> Callable[[Dict[str, Any]], bool]:
+        predicate = self.parse_or()
+        self.expect("end")
+        return predicate
+
+    def parse_or(self):
+        parts = [self.parse_and()]
+        while self.peek()[:2] == ("keyword", "or"):
+            self.take()
+            parts.append(self.parse_and())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda row: any(part(row) for part in parts)
+
+    def parse_and(self):
+        parts = [self.parse_not()]
+        while self.peek()[:2] == ("keyword", "and"):
+            self.take()
+            parts.append(self.parse_not())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda row: all(part(row) for part in parts)
+
+    def parse_not(self):
+        token = self.peek()
+        if token[:2] == ("keyword", "not"):
+            self.take()
+            inner = self.parse_not()
+            return lambda row: not inner(row)
+        if token[:2] == ("op", "("):
+            self.take()
+            inner = self.parse_or()
+            self.expect("op", ")")
+            return inner
+        return self.parse_comparison()
+
+    def parse_value(self, field: str):
+        kind, value, position = self.take()
+        if kind not in ("value", "word"):
+            raise FilterSyntaxError(f"Expected a value at {position} in {self.text!r}")
+        if field in NUMERIC_FIELDS:
+            if not isinstance(value, float):
+                raise FilterSyntaxError(f"{field} needs a number at {position} in {self.text!r}")
+            return value
+        return str(value if not isinstance(value, float) else f"{value:g}").lower()
+
+    def parse_comparison(self):
+        _, field, position = self.expect("word")
+        field = field.lower()
+        if field not in FIELDS:
+            raise FilterSyntaxError(f"Unknown field {field!r} at {position}; use one of {', '.join(FIELDS)}")
+        self.fields.add(field)
+
+        negate = False
+        if self.peek()[:2] == ("keyword", "not"):
+            self.take()
+            negate = True
+            self.expect("keyword", "in")
+            op = "in"
+        elif self.peek()[:2] == ("keyword", "in"):
+            self.take()
+            op = "in"
+        else:
+            op = self.expect("op")[1]
+
+        if op == "in":
+            self.expect("op", "(")
+            values = [self.parse_value(field)]
+            while self.peek()[:2] == ("op", ","):
+                self.take()
+                values.append(self.parse_value(field))
+            self.expect("op", ")")
+            allowed = frozenset(values)
+            if negate:
+                return lambda row: row[field] not in allowed
+            return lambda row: row[field] in allowed
+
+        value = self.parse_value(field)
+        if op == "~":
+            if field in NUMERIC_FIELDS:
+                raise FilterSyntaxError(f"'~' (contains) needs a text field, not {field}")
+            return lambda row: value in row[field]
+        if op in ("<", "<=", ">", ">=") and field not in NUMERIC_FIELDS:
+            raise FilterSyntaxError(f"{op!r} needs a numeric field (price, quantity, value), not {field}")
+        comparisons = {
+            "==": lambda row: row[field] == value,
+            "!=": lambda row: row[field] != value,
+            "<": lambda row: row[field] < value,
+            "<=": lambda row: row[field] <= value,
+            ">": lambda row: row[field] > value,
+            ">=": lambda row: row[field] >= value,
+        }
+        if op not in comparisons:
+            raise FilterSyntaxError(f"Unexpected {op!r} at {position} in {self.text!r}")
+        return comparisons[op]
+
+
+class CompiledFilter:
+    """
+    A filter expression compiled once into a predicate over row fields, e.g.
+        category in (Knife, Gloves) and price > 50 and name ~ "Doppler"
+    Text comparisons are case-insensitive; `~` means "contains". `fields` lists the
+    row fields the predicate reads, so callers only compute those.
+    """
+
+    def __init__(self, text: str):
+        self.text = text.strip()
+        if not self.text:
+            self.predicate = lambda row: True
+            self.fields = frozenset()
+            return
+        parser = _Parser(self.text)
+        self.predicate = parser.parse()
+        self.fields = frozenset(parser.fields)
+
+    def __call__(self, row: Dict[str, Any]) -> bool:
+        return self.predicate(row)
+
+    def __repr__(self) -> str:
+        return f"CompiledFilter({self.text!r})"
+
+
+def compile_filter(text: Optional[str]) -> CompiledFilter:
+    """Compile an expression; blank text matches everything."""
+    return CompiledFilter(text or "")
@@ -1,4 +1,12 @@
-from utils.helpers import prompt_sort_key
+from filtering.filter_expr import CompiledFilter, compile_filter
+from filtering.stats import CategoryStats, RunningStats, bottom_n
+from inventory.categories import classify_type
+from utils.helpers import ask, prompt_sort_key
+
+try:
+    from filtering.inventory_table import InventoryTable
+except ImportError:  # NumPy not installed: fall back to the per-item loops below
+    InventoryTable = None
 
 # -----------------------------
 # Detect item category
@@ -7,30 +15,47 @@ def detect_category(item):
     """
     Returns a simple category string for an inventory item.
     Example categories: 'case', 'weapon skin', 'other'
+    Uses the category resolved at parse time when present.
     """
-    item_type = item.get("type", "").lower()
-    if "case" in item_type:
-        return "case"
-    elif "skin" in item_type or "weapon" in item_type:
-        return "weapon skin"
-    else:
-        return "other"
+    return item.get("category") or classify_type(item.get("type", ""))
 
 
 # -----------------------------
 # Apply filters
 # -----------------------------
-def apply_filters(inventory, categories=None, min_price=None, max_price=None, sort_key="price"):
+def apply_filters(inventory, categories=None, min_price=None, max_price=None, sort_key="price", limit=None):
     """
     Filters the inventory based on:
     - categories: list of allowed categories, or None for all
     - min_price: minimum price (inclusive)
     - max_price: maximum price (inclusive)
     - sort_key: "price" or "name"
+    - limit: keep only the first `limit` items in sort order, selected with a heap
+      instead of sorting everything
     Returns a new list of filtered and sorted items.
+    `inventory` may also be an InventoryTable (see build_table), which filters vectorized.
     """
-    filtered = []
+    if InventoryTable is not None and isinstance(inventory, InventoryTable):
+        return inventory.take(inventory.select(categories, min_price, max_price, sort_key, limit))
+
+    filtered = list(_iter_matching(inventory, categories, min_price, max_price))
+
+    # Sort
+    sort_keys = {
+        "price": lambda x: x.get("recommended_price", 0.0),
+        "name": lambda x: x.get("market_hash_name", "").lower(),
+    }
+    if sort_key in sort_keys:
+        if limit is not None:
+            return bottom_n(filtered, limit, key=sort_keys[sort_key])
+        filtered.sort(key=sort_keys[sort_key])
+    elif limit is not None:
+        return filtered[:limit]
+
+    return filtered
+
 
+def _iter_matching(inventory, categories=None, min_price=None, max_price=None):
     for item in inventory:
         if not item.get("marketable", True):
             continue
@@ -45,22 +70,134 @@ def apply_filters(inventory, categories=None, min_price=None, max_price=None, so
         if max_price is not None and price > max_price:
             continue
 
-        filtered.append(item)
+        yield item
+
+
+# -----------------------------
+# Named views in one pass
+# -----------------------------
+class ViewResult:
+    """Items matched by one view, with their total quantity and value."""
+
+    def __init__(self, name, expression):
+        self.name = name
+        self.expression = expression
+        self.items = []
+        self.totals = RunningStats()
+
+    def as_dict(self, limit=None):
+        items = self.items if limit is None else self.items[:limit]
+        return {
+            "expression": self.expression,
+            "count": len(self.items),
+            "quantity": self.totals.count,
+            "value": round(self.totals.total, 2),
+            "items": [
+                {"market_hash_name": item.get("market_hash_name"), "category": detect_category(item),
+                 "quantity": item.get("quantity", 1), "recommended_price": item.get("recommended_price", 0.0)}
+                for item in items
+            ],
+        }
+
+
+def evaluate_views(inventory, views, sort_key="price"):
+    """
+    Evaluate many named filter views in a single pass over the inventory.
+    `views` maps a name to an expression string or CompiledFilter (see filter_expr).
+    Each marketable item is classified once and its fields computed once, then
+    tested against every view. Returns {name: ViewResult}, items sorted by sort_key.
+    """
+    compiled = {name: view if isinstance(view, CompiledFilter) else compile_filter(view)
+                for name, view in views.items()}
+    results = {name: ViewResult(name, view.text) for name, view in compiled.items()}
+    fields = frozenset().union(*(view.fields for view in compiled.values()))
+    checks = [(view.predicate, results[name]) for name, view in compiled.items()]
+    rows = inventory.rows if InventoryTable is not None and isinstance(inventory, InventoryTable) else inventory
+
+    for item in rows:
+        if not item.get("marketable", True):
+            continue
+        price = item.get("recommended_price") or 0.0
+        quantity = item.get("quantity", 1)
+        row = {"price": price, "quantity": quantity}
+        if "category" in fields:
+            row["category"] = detect_category(item)
+        if "name" in fields:
+            row["name"] = item.get("market_hash_name", "").lower()
+        if "value" in fields:
+            row["value"] = price * quantity
+        if "type" in fields:
+            row["type"] = item.get("type", "").lower()
+        for predicate, result in checks:
+            if predicate(row):
+                result.items.append(item)
+                result.totals.add(price, quantity)
 
-    # Sort
     if sort_key == "price":
-        filtered.sort(key=lambda x: x.get("recommended_price", 0.0))
+        for result in results.values():
+            result.items.sort(key=lambda x: x.get("recommended_price") or 0.0)
     elif sort_key == "name":
-        filtered.sort(key=lambda x: x.get("market_hash_name", "").lower())
+        for result in results.values():
+            result.items.sort(key=lambda x: x.get("market_hash_name", "").lower())
+    elif sort_key == "value":
+        for result in results.values():
+            result.items.sort(key=lambda x: (x.get("recommended_price") or 0.0) * x.get("quantity", 1), reverse=True)
+    return results
 
-    return filtered
+
+# -----------------------------
+# Columnar fast path
+# -----------------------------
+def build_table(items):
+    """
+    Build an InventoryTable once so repeated filtering, counting and totals are vectorized.
+    Returns the items as a plain list when NumPy is unavailable.
+    """
+    if InventoryTable is None:
+        return list(items)
+    return InventoryTable(items, detect_category)
+
+
+def count_categories(inventory):
+    """Units held per category among marketable items."""
+    if InventoryTable is not None and isinstance(inventory, InventoryTable):
+        return inventory.category_counts()
+
+    counts = {}
+    for item in inventory:
+        if item.get("marketable", True):
+            cat = detect_category(item)
+            counts[cat] = counts.get(cat, 0) + item.get("quantity", 1)
+    return counts
+
+
+def filter_with_totals(inventory, categories=None, min_price=None, max_price=None, sort_key="price"):
+    """
+    Same filtering as apply_filters, but also returns the total value
+    (price x quantity) and total quantity of the matching items.
+    Returns (items, total_value, total_quantity).
+    """
+    if InventoryTable is not None and isinstance(inventory, InventoryTable):
+        indices = inventory.select(categories, min_price, max_price, sort_key)
+        return inventory.take(indices), inventory.total_value(indices), inventory.total_quantity(indices)
+
+    filtered = apply_filters(inventory, categories, min_price, max_price, sort_key)
+    totals = RunningStats()
+    for item in filtered:
+        totals.add(item.get("recommended_price", 0.0), item.get("quantity", 1))
+    return filtered, totals.total, totals.count
+
+
+def summarize(items):
+    """Per-category price statistics (count, sum, min, max, mean, percentiles) in one pass."""
+    return CategoryStats(detect_category).add_all(items)
 
 
 # -----------------------------
 # Sort prompt (no game option)
 # -----------------------------
 def prompt_sort_key(allow_game=False):
-    key = input(f"Sort by (price/name{'/game' if allow_game else ''}) [price]: ").strip().lower()
+    key = ask(f"Sort by (price/name{'/game' if allow_game else ''}) [price]: ").strip().lower()
     if key not in ("price", "name") and (allow_game and key != "game"):
         return "price"
     return key
@@ -0,0 +1,107 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+# -----------------------------
+# Columnar inventory table
+# -----------------------------
+class InventoryTable:
+    """
+    Column-oriented view of inventory rows (items or holdings) for fast re-filtering.
+    Prices, quantities and marketable flags are NumPy arrays; categories and names are
+    integer-coded. Build it once, then filter/sort/aggregate without touching the rows.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], category_of):
+        self.rows: List[Dict[str, Any]] = list(rows)
+        n = len(self.rows)
+
+        self.categories: List[str] = []
+        category_codes: Dict[str, int] = {}
+        self.category = np.empty(n, dtype=np.int32)
+        self.price = np.empty(n, dtype=np.float64)
+        self.quantity = np.empty(n, dtype=np.int64)
+        self.marketable = np.empty(n, dtype=bool)
+        lowered_names = []
+
+        for i, row in enumerate(self.rows):
+            category = category_of(row)
+            code = category_codes.get(category)
+            if code is None:
+                code = category_codes[category] = len(self.categories)
+                self.categories.append(category)
+            self.category[i] = code
+            self.price[i] = row.get("recommended_price") or 0.0
+            self.quantity[i] = row.get("quantity", 1)
+            self.marketable[i] = bool(row.get("marketable", True))
+            lowered_names.append(row.get("market_hash_name", "").lower())
+
+        self._category_codes = category_codes
+        # Rank of each row in case-insensitive name order, so name sorts are integer sorts
+        self.name_rank = np.empty(n, dtype=np.int64)
+        self.name_rank[np.argsort(np.array(lowered_names, dtype=object), kind="stable")] = np.arange(n)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def set_prices(self, price_map: Dict[str, float]) -> None:
+        """Update the price column (and rows) from a {market_hash_name: price} map."""
+        for i, row in enumerate(self.rows):
+            name = row.get("market_hash_name")
+            if name in price_map:
+                row["recommended_price"] = price_map[name]
+                self.price[i] = price_map[name] or 0.0
+
+    def mask(self, categories: Optional[Sequence[str]] = None,
+             min_price: Optional[float] = None, max_price: Optional[float] = None) -> np.ndarray:
+        selected = self.marketable.copy()
+        if categories:
+            codes = [self._category_codes[c] for c in categories if c in self._category_codes]
+            selected &= np.isin(self.category, codes)
+        if min_price is not None:
+            selected &= self.price >= min_price
+        if max_price is not None:
+            selected &= self.price <= max_price
+        return selected
+
+    def select(self, categories: Optional[Sequence[str]] = None,
+               min_price: Optional[float] = None, max_price: Optional[float] = None,
+               sort_key: str = "price", limit: Optional[int] = None) -> np.ndarray:
+        """
+        Return row indices matching the filters, sorted by price or name.
+        With `limit`, only the first `limit` are returned, partitioned out before sorting.
+        """
+        indices = np.flatnonzero(self.mask(categories, min_price, max_price))
+        keys = {"price": self.price, "name": self.name_rank}.get(sort_key)
+        if keys is None:
+            return indices if limit is None else indices[:limit]
+        if limit is not None and limit < len(indices):
+            indices = indices[np.argpartition(keys[indices], limit)[:limit]]
+        return indices[np.argsort(keys[indices], kind="stable")]
+
+    def take(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        rows = self.rows
+        return [rows[i] for i in indices.tolist()]
+
+    def category_counts(self) -> Dict[str, int]:
+        """Units held per category among marketable rows."""
+        size = len(self.categories)
+        codes = self.category[self.marketable]
+        present = np.bincount(codes, minlength=size) > 0
+        counts = np.bincount(codes, weights=self.quantity[self.marketable], minlength=size)
+        return {
+            category: int(counts[code])
+            for code, category in enumerate(self.categories)
+            if present[code]
+        }
+
+    def total_value(self, indices: Optional[np.ndarray] = None) -> float:
+        if indices is None:
+            return float(np.dot(self.price, self.quantity))
+        return float(np.dot(self.price[indices], self.quantity[indices]))
+
+    def total_quantity(self, indices: Optional[np.ndarray] = None) -> int:
+        if indices is None:
+            return int(self.quantity.sum())
+        return int(self.quantity[indices].sum())
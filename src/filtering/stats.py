@@ -0,0 +1,130 @@
+import heapq
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Percentiles are accurate to within this relative error
+PERCENTILE_ACCURACY = 0.01
+ALL = "all"
+
+
+def item_price(item: Dict[str, Any]) -> float:
+    return item.get("recommended_price") or 0.0
+
+
+def item_value(item: Dict[str, Any]) -> float:
+    """Price times quantity held."""
+    return (item.get("recommended_price") or 0.0) * item.get("quantity", 1)
+
+
+# -----------------------------
+# Single-pass statistics
+# -----------------------------
+class RunningStats:
+    """
+    Count, sum, min, max and mean of a stream of values in one pass, plus approximate
+    percentiles from a log-bucketed histogram (relative error PERCENTILE_ACCURACY,
+    memory bounded by the value range rather than the number of values).
+    `weight` counts a value several times, e.g. a unit price held `quantity` times.
+    """
+
+    def __init__(self, accuracy: float = PERCENTILE_ACCURACY):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._bucket_of: Dict[float, int] = {}  # prices repeat a lot; skip the log for seen values
+        self._non_positive = 0
+
+    def add(self, value: float, weight: int = 1) -> None:
+        if weight <= 0:
+            return
+        self.count += weight
+        self.total += value * weight
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if value > 0:
+            bucket = self._bucket_of.get(value)
+            if bucket is None:
+                bucket = self._bucket_of[value] = math.ceil(math.log(value) / self._log_gamma)
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + weight
+        else:
+            self._non_positive += weight
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Approximate q-th percentile (0-100), clamped to the observed min/max."""
+        if not self.count:
+            return None
+        rank = q / 100 * (self.count - 1)
+        seen = self._non_positive
+        if rank < seen:
+            return self.min
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(b-1), gamma^b] in relative terms
+                estimate = 2 * self._gamma ** bucket / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count, "sum": self.total, "min": self.min, "max": self.max, "mean": self.mean,
+            "p50": self.percentile(50), "p90": self.percentile(90), "p99": self.percentile(99),
+        }
+
+
+class CategoryStats:
+    """
+    RunningStats of unit prices (weighted by quantity) overall and per category,
+    filled in a single pass. `stats.total` of a group is its total value.
+    """
+
+    def __init__(self, category_of: Callable[[Dict[str, Any]], str],
+                 value_of: Callable[[Dict[str, Any]], float] = item_price):
+        self.category_of = category_of
+        self.value_of = value_of
+        self.overall = RunningStats()
+        self.by_category: Dict[str, RunningStats] = {}
+
+    def add(self, item: Dict[str, Any]) -> None:
+        value = self.value_of(item)
+        quantity = item.get("quantity", 1)
+        self.overall.add(value, quantity)
+        category = self.category_of(item)
+        stats = self.by_category.get(category)
+        if stats is None:
+            stats = self.by_category[category] = RunningStats()
+        stats.add(value, quantity)
+
+    def add_all(self, items: Iterable[Dict[str, Any]]) -> "CategoryStats":
+        for item in items:
+            self.add(item)
+        return self
+
+    def as_dict(self) -> Dict[str, Dict[str, Optional[float]]]:
+        return {ALL: self.overall.as_dict(),
+                **{category: stats.as_dict() for category, stats in sorted(self.by_category.items())}}
+
+
+# -----------------------------
+# Top-N selection
+# -----------------------------
+def top_n(items: Iterable[Dict[str, Any]], n: int, key: Callable[[Dict[str, Any]], Any] = item_value
+          ) -> List[Dict[str, Any]]:
+    """The n items with the largest key, largest first, via a bounded heap (O(len * log n))."""
+    return heapq.nlargest(n, items, key=key)
+
+
+def bottom_n(items: Iterable[Dict[str, Any]], n: int, key: Callable[[Dict[str, Any]], Any] = item_value
+             ) -> List[Dict[str, Any]]:
+    """The n items with the smallest key, smallest first, via a bounded heap."""
+    return heapq.nsmallest(n, items, key=key)
@@ -0,0 +1,97 @@
+"""
+Questions about the recorded price history (every pricing run appends to it).
+
+Usage (from src/):
+    python history.py value EXPORT [--at WHEN] [--currency USD|CAD]
+    python history.py movers [--since WHEN] [--export EXPORT] [--top N] [--currency USD|CAD]
+    python history.py item NAME [--currency USD|CAD]
+
+WHEN is a date/time (2026-10-01, 2026-10-01T12:00) or an age (7d, 12h, 30m); default 7d ago.
+"""
+import argparse
+import re
+import sys
+import time
+from datetime import datetime
+
+from main import load_holdings
+from market.exchange_rates import CURRENCY_IDS, format_money
+from market.price_history import DEFAULT_HISTORY_DIR, PriceHistory
+from utils.helpers import set_log_level
+
+_AGE_RE = re.compile(r"^(\d+(?:\.\d+)?)([dhm])$")
+_AGE_SECONDS = {"d": 86400, "h": 3600, "m": 60}
+
+
+def parse_when(text):
+    """Unix time for an ISO date/time or an age such as 7d/12h/30m."""
+    match = _AGE_RE.match(text.strip())
+    if match:
+        return time.time() - float(match.group(1)) * _AGE_SECONDS[match.group(2)]
+    try:
+        return datetime.fromisoformat(text.strip()).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a date/time or an age like 7d, got {text!r}")
+
+
+def format_time(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the recorded price history")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_DIR, help="price history directory")
+    parser.add_argument("--currency", choices=("USD", "CAD"), default="USD")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    value = commands.add_parser("value", help="value of an export's holdings at a point in time")
+    value.add_argument("export", help="inventory export (file or folder of pages)")
+    value.add_argument("--at", type=parse_when, default=None, help="default: now")
+
+    movers = commands.add_parser("movers", help="biggest price moves since a point in time")
+    movers.add_argument("--since", type=parse_when, default=parse_when("7d"))
+    movers.add_argument("--export", help="only this export's holdings, ranked by value change")
+    movers.add_argument("--top", type=int, default=10)
+
+    item = commands.add_parser("item", help="every recorded price of one item")
+    item.add_argument("name", help="market_hash_name")
+    args = parser.parse_args(argv)
+
+    set_log_level("quiet")
+    currency_id = CURRENCY_IDS[args.currency]
+    holdings = None
+    export = getattr(args, "export", None)
+    if export:
+        _, holdings = load_holdings(export)
+        if not holdings:
+            return 1
+
+    with PriceHistory(args.history) as history:
+        if args.command == "value":
+            at = time.time() if args.at is None else args.at
+            total, priced = history.value_at(holdings, currency_id, at)
+            print(f"{format_time(at)}: {format_money(total, args.currency)} "
+                  f"({priced} of {len(holdings)} items had recorded prices)")
+        elif args.command == "movers":
+            quantities = ({holding["market_hash_name"]: holding.get("quantity", 1) for holding in holdings
+                           if holding.get("market_hash_name")} if holdings else None)
+            print(f"Biggest moves since {format_time(args.since)}:")
+            for move in history.movers(args.since, currency_id, args.top, quantities):
+                percent = f"{move['percent']:+.1f}%" if move["percent"] is not None else "n/a"
+                line = (f"  {move['market_hash_name']}: {format_money(move['then'], args.currency)} -> "
+                        f"{format_money(move['now'], args.currency)} ({percent})")
+                if quantities is not None:
+                    line += f", {move['value_change']:+.2f} for x{move['quantity']}"
+                print(line)
+        else:
+            points = history.history(args.name, currency_id)
+            if not points:
+                print(f"No recorded prices for {args.name!r}")
+                return 1
+            for timestamp, price in points:
+                print(f"{format_time(timestamp)}  {format_money(price, args.currency)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
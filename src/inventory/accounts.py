@@ -0,0 +1,202 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional
+
+from inventory import export_pages, inventory_stream, snapshot
+from inventory.categories import classify_type
+from inventory.holdings import group_holdings
+from utils.helpers import Progress, set_log_level, warn
+
+# Holding fields sent back from the parse workers; the rest stays in the worker process
+ACCOUNT_FIELDS = ("market_hash_name", "type", "category", "marketable", "appid",
+                  "recommended_price", "quantity", "asset_count")
+
+
+# -----------------------------
+# Per-account parsing (runs in worker processes)
+# -----------------------------
+def account_name(path: str) -> str:
+    """
+    Accounts are named after their export file or folder of export pages,
+    e.g. exports/alice.json -> alice, exports/bob/ -> bob.
+    """
+    return os.path.splitext(os.path.basename(path.rstrip("/\\")))[0]
+
+
+def parse_account(path: str) -> Dict[str, Any]:
+    """
+    Parse and classify one export into compact holdings:
+        {"account", "path", "assets", "holdings": [...], "error"}
+    Uses a valid binary snapshot when present and writes one otherwise, like a single run;
+    a folder of export pages is streamed page by page instead. Never raises, so one bad
+    export cannot take down the pool; `error` says what went wrong.
+    """
+    result = {"account": account_name(path), "path": path, "assets": 0, "holdings": [], "error": None}
+    items = None
+    if export_pages.is_paged(path):
+        try:
+            items = list(export_pages.iter_export(path))
+        except Exception as e:
+            result["error"] = f"Failed to load export pages: {e}"
+            return result
+    else:
+        try:
+            items = snapshot.load_snapshot(path)
+        except Exception:
+            pass
+    if items is None:
+        try:
+            items = list(inventory_stream.iter_inventory_file(path))
+        except Exception as e:
+            result["error"] = f"Failed to load JSON: {e}"
+            return result
+        try:
+            snapshot.write_snapshot(path, items)
+        except OSError:
+            pass
+
+    rows = []
+    for holding in group_holdings(items):
+        row = {field: holding.get(field) for field in ACCOUNT_FIELDS}
+        row["category"] = row["category"] or classify_type(row["type"] or "")
+        row["marketable"] = row["marketable"] if row["marketable"] is not None else True
+        rows.append(row)
+    result["assets"] = sum(row["asset_count"] for row in rows)
+    result["holdings"] = rows
+    return result
+
+
+def _init_worker() -> None:
+    # Workers report through their results; only the parent prints progress
+    set_log_level("quiet")
+
+
+def load_accounts(paths: List[str], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Parse many exports in parallel across CPU cores (one process per core by default).
+    Results come back in the order of `paths`; failed exports are warned about and dropped.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(paths)
+
+    with Progress("Parsing exports", total=len(paths)) as progress:
+        if workers == 1:
+            for index, path in enumerate(paths):
+                results[index] = parse_account(path)
+                progress.update(1, results[index]["account"])
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = {pool.submit(parse_account, path): index for index, path in enumerate(paths)}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    results[index] = future.result()
+                    progress.update(1, results[index]["account"])
+
+    accounts = []
+    for account in results:
+        if account["error"]:
+            warn(f"{account['path']}: {account['error']}")
+        elif not account["holdings"]:
+            warn(f"{account['path']}: inventory is empty after parsing")
+        else:
+            accounts.append(account)
+    return accounts
+
+
+# -----------------------------
+# Shared pricing
+# -----------------------------
+def merge_holdings(accounts: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    One row per market_hash_name across all accounts, with quantities summed, so each
+    name is priced once (and live fetches rank names by their combined value).
+    A name is priced if it is marketable in any account.
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for account in accounts:
+        for row in account["holdings"]:
+            name = row["market_hash_name"]
+            if not name:
+                continue
+            shared = merged.get(name)
+            if shared is None:
+                merged[name] = dict(row)
+            else:
+                shared["quantity"] += row["quantity"]
+                shared["asset_count"] += row["asset_count"]
+                shared["marketable"] = shared["marketable"] or row["marketable"]
+    return list(merged.values())
+
+
+def apply_shared_prices(accounts: Iterable[Dict[str, Any]], shared: Iterable[Dict[str, Any]]) -> None:
+    """Copy the prices set on the merged rows back onto every account's holdings."""
+    prices = {row["market_hash_name"]: row.get("recommended_price") for row in shared}
+    for account in accounts:
+        for row in account["holdings"]:
+            if row["market_hash_name"] in prices:
+                row["recommended_price"] = prices[row["market_hash_name"]]
+
+
+# -----------------------------
+# Valuation
+# -----------------------------
+def value_holdings(rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Unique items, units and value, overall and by category, in one pass. Like a single
+    run, only marketable holdings are valued (the pricing step never prices the rest);
+    those are counted under "non_marketable" instead.
+    """
+    summary = {"items": 0, "units": 0, "value": 0.0, "by_category": {},
+               "non_marketable": {"items": 0, "units": 0}}
+    for row in rows:
+        if not row["marketable"]:
+            summary["non_marketable"]["items"] += 1
+            summary["non_marketable"]["units"] += row["quantity"]
+            continue
+        value = (row.get("recommended_price") or 0.0) * row["quantity"]
+        summary["items"] += 1
+        summary["units"] += row["quantity"]
+        summary["value"] += value
+        category = summary["by_category"].setdefault(row["category"], {"units": 0, "value": 0.0})
+        category["units"] += row["quantity"]
+        category["value"] += value
+    return summary
+
+
+def value_accounts(accounts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Per-account and combined valuations:
+        {"accounts": {name: {..., "share": fraction of combined value}}, "combined": {...}}
+    `combined` sums the accounts' units and values; its item counts count each
+    market_hash_name once.
+    """
+    combined = {"accounts": len(accounts), "assets": 0, "items": 0, "units": 0, "value": 0.0,
+                "by_category": {}, "non_marketable": {"items": 0, "units": 0}}
+    names = {True: set(), False: set()}
+    per_account = {}
+    for account in accounts:
+        summary = value_holdings(account["holdings"])
+        summary["assets"] = account["assets"]
+        summary["path"] = account["path"]
+        name = account["account"]
+        if name in per_account:
+            name = account["path"]
+        per_account[name] = summary
+
+        combined["assets"] += account["assets"]
+        combined["units"] += summary["units"]
+        combined["value"] += summary["value"]
+        combined["non_marketable"]["units"] += summary["non_marketable"]["units"]
+        for category, totals in summary["by_category"].items():
+            combined_category = combined["by_category"].setdefault(category, {"units": 0, "value": 0.0})
+            combined_category["units"] += totals["units"]
+            combined_category["value"] += totals["value"]
+        for index, row in enumerate(account["holdings"]):
+            # Holdings without a name cannot be matched across accounts
+            names[bool(row["marketable"])].add(row["market_hash_name"] or (account["path"], index))
+
+    combined["items"] = len(names[True])
+    combined["non_marketable"]["items"] = len(names[False] - names[True])
+    for summary in per_account.values():
+        summary["share"] = summary["value"] / combined["value"] if combined["value"] else 0.0
+    return {"accounts": per_account, "combined": combined}
@@ -0,0 +1,63 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+# -----------------------------
+# Category names
+# -----------------------------
+WEAPON_SKIN = "weapon skin"
+STICKER = "sticker"
+CASE = "case"
+KEY = "key"
+GLOVES = "gloves"
+KNIFE = "knife"
+OTHER = "other"
+
+# Ordered by priority: when a type matches several rules, the earliest rule wins.
+# Generic "weapon"/"skin" words come last so e.g. "Weapon Case" stays a case.
+CATEGORY_RULES = (
+    (WEAPON_SKIN, ("rifle", "sniper", "pistol", "smg", "shotgun", "machinegun")),
+    (STICKER, ("sticker",)),
+    (CASE, ("container", "case")),
+    (KEY, ("key",)),
+    (GLOVES, ("glove",)),
+    (KNIFE, ("knife",)),
+    (WEAPON_SKIN, ("weapon", "skin")),
+)
+
+CATEGORIES = (WEAPON_SKIN, STICKER, CASE, KEY, GLOVES, KNIFE, OTHER)
+
+
+# -----------------------------
+# Compiled matcher
+# -----------------------------
+def _compile_rules(rules):
+    """
+    Fold every rule into one alternation with a named group per rule. The lookahead
+    makes it match at every position, so overlapping keywords are never hidden.
+    """
+    parts = [
+        f"(?P<r{index}>{'|'.join(re.escape(word) for word in words)})"
+        for index, (_, words) in enumerate(rules)
+    ]
+    return re.compile(f"(?=(?:{'|'.join(parts)}))")
+
+
+_MATCHER = _compile_rules(CATEGORY_RULES)
+
+
+@lru_cache(maxsize=None)
+def classify_type(type_name: Optional[str]) -> str:
+    """
+    Map a Steam `type` string to a category. Memoized per distinct type string,
+    so classifying a whole inventory costs O(distinct types). A missing or
+    null type is OTHER.
+    """
+    best = None
+    for match in _MATCHER.finditer((type_name or "").lower()):
+        index = int(match.lastgroup[1:])
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return OTHER if best is None else CATEGORY_RULES[best][0]
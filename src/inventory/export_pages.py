@@ -0,0 +1,115 @@
+import os
+import re
+from typing import Any, Dict, Iterator, List, Sequence, Tuple, Union
+
+from inventory.inventory_stream import (DEFAULT_CHUNK_SIZE, STREAMED_KEYS, DescriptionIndex,
+                                        iter_top_level_arrays)
+from inventory.item_model import Item
+from utils.helpers import debug, warn
+
+# Top-level members linking one page of an export to the next
+PAGE_LINK_KEYS = ("more_items", "last_assetid")
+
+ExportSource = Union[str, Sequence[str]]
+
+
+# -----------------------------
+# Page discovery
+# -----------------------------
+def _natural_key(path: str):
+    """Sort page_2.json before page_10.json."""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r"(\d+)", os.path.basename(path))]
+
+
+def page_files(source: ExportSource) -> List[str]:
+    """
+    The page files of an export, in order. `source` is one export file, a directory
+    of page files (*.json, in natural filename order) or a list of page files (as given).
+    """
+    if isinstance(source, str):
+        if not os.path.isdir(source):
+            return [source]
+        return sorted(
+            (os.path.join(source, name) for name in os.listdir(source)
+             if name.endswith(".json") and os.path.isfile(os.path.join(source, name))),
+            key=_natural_key,
+        )
+    return list(source)
+
+
+def is_paged(source: ExportSource) -> bool:
+    """True unless the source is a single export file."""
+    return not isinstance(source, str) or os.path.isdir(source)
+
+
+def describe_source(source: ExportSource) -> str:
+    """A single path naming the export, for state/results files next to it."""
+    if isinstance(source, str):
+        return source.rstrip("/\\") or source
+    pages = list(source)
+    return os.path.dirname(os.path.abspath(pages[0])) if len(pages) > 1 else pages[0]
+
+
+# -----------------------------
+# Streaming across pages
+# -----------------------------
+def iter_export_arrays(source: ExportSource, chunk_size: int = DEFAULT_CHUNK_SIZE
+                       ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield ("assets" | "descriptions", raw element) across every page of an export,
+    reading each page once, front to back. Assets repeated at a page boundary are
+    yielded once, and so is each description however many pages repeat it.
+    Warns when the last page still announces more_items (the export is incomplete).
+    """
+    pages = page_files(source)
+    if not pages:
+        raise ValueError(f"No export pages found in {source}")
+
+    seen_assets = set()
+    seen_descriptions = set()
+    for number, path in enumerate(pages, 1):
+        links: Dict[str, Any] = {}
+        assets = duplicates = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for key, element in iter_top_level_arrays(f, STREAMED_KEYS, chunk_size, members=PAGE_LINK_KEYS):
+                if key in PAGE_LINK_KEYS:
+                    links[key] = element
+                elif key == "descriptions":
+                    ident = (element.get("classid"), element.get("instanceid"))
+                    if ident not in seen_descriptions:
+                        seen_descriptions.add(ident)
+                        yield key, element
+                else:
+                    asset_key = (element.get("appid"), element.get("contextid"), element.get("assetid"))
+                    if element.get("assetid") is not None:
+                        if asset_key in seen_assets:
+                            duplicates += 1
+                            continue
+                        seen_assets.add(asset_key)
+                    assets += 1
+                    yield key, element
+
+        debug(f"Page {number}/{len(pages)} {path}: {assets} assets, {duplicates} repeated, "
+              f"more_items={links.get('more_items', 0)}")
+        if number == len(pages) and links.get("more_items"):
+            warn(f"{path} says more items follow (last_assetid {links.get('last_assetid')}), "
+                 f"but it is the last page; the export looks incomplete")
+
+
+def iter_export(source: ExportSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Item]:
+    """
+    Stream merged items from a paged export through one global description index,
+    so an asset on page 1 is matched with a description that only arrives on page 3.
+    Assets whose description never arrives are yielded last with an empty description.
+    """
+    index = DescriptionIndex()
+    for key, element in iter_export_arrays(source, chunk_size):
+        if key == "descriptions":
+            yield from index.add_description(element)
+        else:
+            item = index.add_asset(element)
+            if item is not None:
+                yield item
+    if index.pending:
+        warn(f"{index.pending_count} assets have no description in any page")
+    yield from index.finish()
@@ -0,0 +1,52 @@
+from typing import Any, Dict, Iterable, List
+
+
+# -----------------------------
+# Holdings (stacked assets)
+# -----------------------------
+def group_holdings(items: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse parsed per-asset items into one holding per market_hash_name.
+    Each holding keeps the fields of the first asset seen, plus:
+    - quantity: total units held (sum of each asset's `amount`)
+    - asset_count: number of distinct assets
+    - assetids: every assetid grouped into the holding
+    Items without a market_hash_name are grouped by (classid, instanceid).
+    """
+    holdings: Dict[Any, Dict[str, Any]] = {}
+
+    for item in items:
+        key = item.get("market_hash_name") or (item.get("classid"), item.get("instanceid"))
+        amount = parse_amount(item.get("amount"))
+
+        holding = holdings.get(key)
+        if holding is None:
+            holding = dict(item)
+            holding["quantity"] = 0
+            holding["asset_count"] = 0
+            holding["assetids"] = []
+            holdings[key] = holding
+
+        holding["quantity"] += amount
+        holding["asset_count"] += 1
+        if item.get("assetid") is not None:
+            holding["assetids"].append(item.get("assetid"))
+
+    return list(holdings.values())
+
+
+def parse_amount(value: Any) -> int:
+    """Steam sends `amount` as an int or a numeric string; missing means 1."""
+    try:
+        return max(int(value), 0)
+    except (TypeError, ValueError):
+        return 1
+
+
+def total_quantity(holdings: Iterable[Dict[str, Any]]) -> int:
+    return sum(h.get("quantity", 1) for h in holdings)
+
+
+def total_value(holdings: Iterable[Dict[str, Any]]) -> float:
+    """Sum of price x quantity across holdings."""
+    return sum(h.get("recommended_price", 0.0) * h.get("quantity", 1) for h in holdings)
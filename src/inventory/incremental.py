@@ -0,0 +1,199 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from inventory.categories import OTHER
+from inventory.holdings import group_holdings, parse_amount
+from inventory.inventory_fetcher import EMPTY_DESCRIPTION, build_item, describe
+from inventory.export_pages import iter_export_arrays
+from market.price_providers import apply_prices_safely
+from utils.helpers import info, warn
+
+STATE_SUFFIX = ".state.json"
+STATE_VERSION = 2  # 2: total_value only counts marketable assets
+
+# Per-asset row stored in the state file
+_FIELDS = ("classid", "instanceid", "amount", "appid", "contextid",
+           "market_hash_name", "category", "marketable", "recommended_price")
+
+
+def state_path_for(source_path: str) -> str:
+    return source_path + STATE_SUFFIX
+
+
+def _state_row(item, prices: Dict[str, float]) -> Dict[str, Any]:
+    """
+    The stored row for one asset. Missing fields are left out rather than stored as
+    None, so rows behave like Items (`row.get("recommended_price", 0.0)` etc.).
+    """
+    row = {field: item.get(field) for field in _FIELDS}
+    row["recommended_price"] = prices.get(row["market_hash_name"], row["recommended_price"])
+    return {field: value for field, value in row.items() if value is not None}
+
+
+def _asset_key(asset: Dict[str, Any], seen: Dict[Tuple[Any, Any], int]) -> str:
+    """assetid when present; otherwise classid/instanceid plus an occurrence counter."""
+    assetid = asset.get("assetid")
+    if assetid is not None:
+        return str(assetid)
+    ident = (asset.get("classid"), asset.get("instanceid"))
+    seen[ident] = seen.get(ident, 0) + 1
+    return f"{ident[0]}/{ident[1]}#{seen[ident]}"
+
+
+# -----------------------------
+# Analysis state
+# -----------------------------
+class AnalysisState:
+    """
+    What the previous run knew: one row per asset (identity, name, category, price)
+    plus running totals that are updated by delta instead of recomputed. Like the
+    summary, value and category counts only cover marketable assets.
+    """
+
+    def __init__(self, currency: int = 1):
+        self.currency = currency
+        self.assets: Dict[str, Dict[str, Any]] = {}
+        self.total_value = 0.0
+        self.total_quantity = 0
+        self.category_counts: Dict[str, int] = {}
+
+    def _apply(self, row: Dict[str, Any], sign: int) -> None:
+        amount = row["amount"] * sign
+        self.total_quantity += amount
+        if row.get("marketable", True):
+            self.total_value += (row.get("recommended_price") or 0.0) * amount
+            category = row.get("category") or OTHER
+            self.category_counts[category] = self.category_counts.get(category, 0) + amount
+            if not self.category_counts[category]:
+                del self.category_counts[category]
+
+    def add(self, key: str, row: Dict[str, Any]) -> None:
+        self.remove(key)
+        self.assets[key] = row
+        self._apply(row, 1)
+
+    def remove(self, key: str) -> None:
+        row = self.assets.pop(key, None)
+        if row is not None:
+            self._apply(row, -1)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return [dict(row, assetid=key) for key, row in self.assets.items()]
+
+    def holdings(self) -> List[Dict[str, Any]]:
+        return group_holdings(self.rows())
+
+    def save(self, path: str) -> None:
+        data = {
+            "version": STATE_VERSION,
+            "currency": self.currency,
+            "total_value": self.total_value,
+            "total_quantity": self.total_quantity,
+            "category_counts": self.category_counts,
+            "assets": {key: [row.get(f) for f in _FIELDS] for key, row in self.assets.items()},
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["AnalysisState"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            warn(f"Could not read analysis state {path}: {e}")
+            return None
+        if data.get("version") != STATE_VERSION:
+            return None
+        state = cls(data.get("currency", 1))
+        state.assets = {
+            key: {field: value for field, value in zip(_FIELDS, values) if value is not None}
+            for key, values in data["assets"].items()
+        }
+        state.total_value = data["total_value"]
+        state.total_quantity = data["total_quantity"]
+        state.category_counts = data["category_counts"]
+        return state
+
+    @classmethod
+    def from_items(cls, items, currency: int = 1,
+                   prices: Optional[Dict[str, float]] = None) -> "AnalysisState":
+        """Build state after a full run; `prices` (by name) override the items' own prices."""
+        state = cls(currency)
+        prices = prices or {}
+        seen: Dict[Tuple[Any, Any], int] = {}
+        for item in items:
+            state.add(_asset_key(item, seen), _state_row(item, prices))
+        return state
+
+
+# -----------------------------
+# Diff + incremental update
+# -----------------------------
+def diff_export(source_path: str, state: AnalysisState):
+    """
+    Stream a new export (one file or its pages) and compare its assets with the state by asset key,
+    classid/instanceid and amount. Returns (changed_assets, removed_keys, descriptions)
+    where changed_assets holds (key, asset) for added or modified assets only and
+    descriptions holds the raw descriptions for those assets.
+    """
+    changed: List[Tuple[str, Dict[str, Any]]] = []
+    present = set()
+    raw_descriptions: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+    seen: Dict[Tuple[Any, Any], int] = {}
+
+    for kind, element in iter_export_arrays(source_path):
+        ident = (element.get("classid"), element.get("instanceid"))
+        if kind == "descriptions":
+            raw_descriptions[ident] = element
+            continue
+        key = _asset_key(element, seen)
+        present.add(key)
+        old = state.assets.get(key)
+        if (old is None or (old["classid"], old["instanceid"]) != ident
+                or old["amount"] != parse_amount(element.get("amount"))):
+            changed.append((key, element))
+
+    removed = [key for key in state.assets if key not in present]
+    needed = {(a.get("classid"), a.get("instanceid")) for _, a in changed}
+    descriptions = {ident: raw_descriptions[ident] for ident in needed if ident in raw_descriptions}
+    return changed, removed, descriptions
+
+
+def update_state(source_path: str, state: AnalysisState, provider, currency: int = 1) -> AnalysisState:
+    """
+    Bring `state` up to date with a new export. Only added or changed assets are
+    classified and priced (through `provider`, which is closed afterwards); totals
+    and category counts move by delta.
+    """
+    changed, removed, raw_descriptions = diff_export(source_path, state)
+    modified = sum(1 for key, _ in changed if key in state.assets)
+    unchanged = len(state.assets) - len(removed) - modified
+    info(f"Incremental update: {len(changed) - modified} added, {modified} changed, "
+         f"{len(removed)} removed, {unchanged} unchanged")
+
+    previous_value = state.total_value
+    for key in removed:
+        state.remove(key)
+
+    if changed:
+        descriptions = {ident: describe(d) for ident, d in raw_descriptions.items()}
+        new_items = [
+            (key, build_item(asset, descriptions.get((asset.get("classid"), asset.get("instanceid")),
+                                                     EMPTY_DESCRIPTION)))
+            for key, asset in changed
+        ]
+        new_holdings = group_holdings(item for _, item in new_items)
+        apply_prices_safely(provider, [h for h in new_holdings if h.get("marketable", True)], currency)
+        prices = {h.get("market_hash_name"): h.get("recommended_price") for h in new_holdings}
+
+        for key, item in new_items:
+            state.add(key, _state_row(item, prices))
+    else:
+        provider.close()
+
+    info(f"Inventory value: {state.total_value:.2f} ({state.total_value - previous_value:+.2f} since last run)")
+    return state
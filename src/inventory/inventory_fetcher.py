@@ -1,12 +1,16 @@
 from typing import Dict, Any, List
+from inventory.categories import classify_type
+from inventory.holdings import parse_amount
+from inventory.item_model import Description, Item
 
 # -----------------------------
 # Parsing
 # -----------------------------
-def parse_inventory(raw: Dict[str, Any]) -> List[Dict[str, Any]]:
+def parse_inventory(raw: Dict[str, Any]) -> List[Item]:
     """
     Merge assets + descriptions into item objects from JSON inventory file.
-    Attach normalized category for better UX filtering.
+    Each description is reduced once to a shared Description (with its normalized
+    category) and every asset becomes a compact Item pointing at it.
     """
     assets = raw.get("assets", [])
     descriptions = raw.get("descriptions", [])
@@ -14,22 +18,42 @@ def parse_inventory(raw: Dict[str, Any]) -> List[Dict[str, Any]]:
     desc_map = {}
     for d in descriptions:
         key = (d.get("classid"), d.get("instanceid"))
-        desc_map[key] = d
+        desc_map[key] = describe(d)
 
     merged = []
     for asset in assets:
         key = (asset.get("classid"), asset.get("instanceid"))
-        desc = desc_map.get(key, {})
+        merged.append(build_item(asset, desc_map.get(key, EMPTY_DESCRIPTION)))
 
-        item = {**asset, **desc}
-        item["marketable"] = is_marketable(desc)
-
-        # 🔥 Add normalized category
-        item["category"] = categorize_item(desc)
+    return merged
 
-        merged.append(item)
 
-    return merged
+def describe(desc: Dict[str, Any]) -> Description:
+    """Reduce a raw Steam description to the shared record items point at."""
+    return Description(
+        market_hash_name=desc.get("market_hash_name"),
+        type=desc.get("type", ""),
+        marketable=is_marketable(desc),
+        # 🔥 Add normalized category
+        category=categorize_item(desc),
+        recommended_price=desc.get("recommended_price"),
+    )
+
+
+def build_item(asset: Dict[str, Any], description: Description) -> Item:
+    """Create the compact Item for one asset."""
+    item = Item(
+        description,
+        assetid=asset.get("assetid"),
+        classid=asset.get("classid"),
+        instanceid=asset.get("instanceid"),
+        appid=asset.get("appid"),
+        contextid=asset.get("contextid"),
+        amount=parse_amount(asset.get("amount")),
+    )
+    if asset.get("recommended_price") is not None:
+        item.recommended_price = asset["recommended_price"]
+    return item
 
 
 def is_marketable(desc: Dict[str, Any]) -> bool:
@@ -43,36 +67,13 @@ def is_marketable(desc: Dict[str, Any]) -> bool:
 def categorize_item(desc: Dict[str, Any]) -> str:
     """
     Convert Steam 'type' field into logical sell categories.
+    Rules live in inventory.categories and are shared with filtering and pricing.
     """
-    type_name = desc.get("type", "").lower()
-
-    # Weapon skins
-    if any(word in type_name for word in [
-        "rifle", "sniper", "pistol", "smg", "shotgun"
-    ]):
-        return "Weapon Skin"
-
-    # Stickers
-    if "sticker" in type_name:
-        return "Sticker"
-
-    # Cases / containers
-    if "container" in type_name or "case" in type_name:
-        return "Case"
-
-    # Keys
-    if "key" in type_name:
-        return "Key"
-
-    # Gloves
-    if "glove" in type_name:
-        return "Gloves"
+    return classify_type(desc.get("type", ""))
 
-    # Knives
-    if "knife" in type_name:
-        return "Knife"
 
-    return "Other"
+# Shared by assets whose description is missing from the export
+EMPTY_DESCRIPTION = describe({})
 
 
 # -----------------------------
@@ -0,0 +1,219 @@
+import json
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+from inventory.inventory_fetcher import EMPTY_DESCRIPTION, build_item, describe
+from inventory.item_model import Description, Item
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+STREAMED_KEYS = ("assets", "descriptions")
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+# -----------------------------
+# Incremental JSON reader
+# -----------------------------
+class _JsonStream:
+    """
+    Minimal pull reader over a text file. Only the top-level object is walked by
+    hand; each array element (or other value) is decoded with raw_decode once
+    enough of it is buffered, so at most one element is held in memory at a time.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop consumed text so the buffer stays bounded
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at offset {self.pos}, found '{found or 'EOF'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value starting at the next non-whitespace character."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A value ending exactly at the buffer edge may be a truncated number
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_top_level_arrays(fp: IO[str], keys=STREAMED_KEYS,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE, members=()) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (key, element) for every element of the top-level arrays named in `keys`,
+    in file order. Top-level values named in `members` (e.g. the page links
+    more_items/last_assetid) are yielded whole as (key, value); others are discarded.
+    """
+    stream = _JsonStream(fp, chunk_size)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        key = stream.value()
+        stream.expect(":")
+
+        if key in keys and stream.peek() == "[":
+            stream.expect("[")
+            if stream.peek() != "]":
+                while True:
+                    yield key, stream.value()
+                    if stream.peek() != ",":
+                        break
+                    stream.expect(",")
+            stream.expect("]")
+        elif key in members:
+            yield key, stream.value()
+        else:
+            stream.value()
+
+        if stream.peek() != ",":
+            break
+        stream.expect(",")
+
+    stream.expect("}")
+
+
+def iter_top_level_members(fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """Yield (key, value) for each member of a top-level JSON object, one at a time."""
+    stream = _JsonStream(fp, chunk_size)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        yield key, stream.value()
+        if stream.peek() != ",":
+            break
+        stream.expect(",")
+
+    stream.expect("}")
+
+
+def is_inventory_export(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+    """
+    True if the file is a JSON object with an "assets" or "descriptions" array.
+    Stops at the first such array, so large exports are not read through.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            stream = _JsonStream(f, chunk_size)
+            stream.expect("{")
+            while stream.peek() == '"':
+                key = stream.value()
+                stream.expect(":")
+                if key in STREAMED_KEYS and stream.peek() == "[":
+                    return True
+                stream.value()
+                if stream.peek() != ",":
+                    break
+                stream.expect(",")
+    except (OSError, ValueError):
+        pass
+    return False
+
+
+# -----------------------------
+# Streaming parse
+# -----------------------------
+class DescriptionIndex:
+    """
+    Incremental (classid, instanceid) -> Description index that merges assets as
+    they stream in, across one export or many pages of one. Each description is
+    reduced once, however often pages repeat it; assets whose description has not
+    been seen yet wait in `pending` until it arrives.
+    """
+
+    def __init__(self):
+        self.descriptions: Dict[Tuple[Any, Any], Description] = {}
+        self.pending: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = {}
+
+    def add_description(self, raw: Dict[str, Any]) -> List[Item]:
+        """Index a raw description; returns the items for assets that were waiting on it."""
+        ident = (raw.get("classid"), raw.get("instanceid"))
+        if ident in self.descriptions:
+            return []
+        description = self.descriptions[ident] = describe(raw)
+        return [build_item(asset, description) for asset in self.pending.pop(ident, ())]
+
+    def add_asset(self, raw: Dict[str, Any]) -> Optional[Item]:
+        """The merged item, or None while the asset waits for its description."""
+        ident = (raw.get("classid"), raw.get("instanceid"))
+        description = self.descriptions.get(ident)
+        if description is None:
+            self.pending.setdefault(ident, []).append(raw)
+            return None
+        return build_item(raw, description)
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(assets) for assets in self.pending.values())
+
+    def finish(self) -> Iterator[Item]:
+        """Release assets whose description never arrived, with an empty description."""
+        pending, self.pending = self.pending, {}
+        for assets in pending.values():
+            for asset in assets:
+                yield build_item(asset, EMPTY_DESCRIPTION)
+
+
+def iter_inventory(fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Item]:
+    """
+    Streaming counterpart of inventory_fetcher.parse_inventory.
+    Yields merged items as soon as both an asset and its description have been read.
+    Assets that arrive before their description are held until it shows up;
+    any still unmatched at the end are yielded with an empty description.
+    """
+    index = DescriptionIndex()
+    for key, element in iter_top_level_arrays(fp, chunk_size=chunk_size):
+        if key == "descriptions":
+            yield from index.add_description(element)
+        else:
+            item = index.add_asset(element)
+            if item is not None:
+                yield item
+    yield from index.finish()
+
+
+def iter_inventory_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Item]:
+    """Open an inventory export and stream merged items from it."""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from iter_inventory(f, chunk_size)
@@ -0,0 +1,96 @@
+import sys
+from typing import Any, Dict, Iterator, Optional
+
+
+# -----------------------------
+# Shared description record
+# -----------------------------
+class Description:
+    """
+    The handful of description fields used downstream, stored once per
+    (classid, instanceid) and shared by every asset that references it.
+    Bulky fields (icon_url, tags, description blobs) are dropped.
+    """
+
+    __slots__ = ("market_hash_name", "type", "marketable", "category", "recommended_price")
+
+    def __init__(self, market_hash_name: Optional[str], type: Optional[str], marketable: bool,
+                 category: str, recommended_price: Optional[float] = None):
+        self.market_hash_name = sys.intern(market_hash_name) if market_hash_name else market_hash_name
+        self.type = sys.intern(type or "")  # exports may carry "type": null
+        self.marketable = marketable
+        self.category = sys.intern(category)
+        self.recommended_price = recommended_price
+
+
+# -----------------------------
+# Compact per-asset item
+# -----------------------------
+class Item:
+    """
+    One inventory asset. Asset-level fields live in slots; description fields are
+    read through the shared Description. Supports the dict-style access
+    (get, [], in, keys) used by filter_manager, queue_manager and workflow_runner.
+    """
+
+    __slots__ = ("assetid", "classid", "instanceid", "appid", "contextid", "amount",
+                 "description", "recommended_price", "lowest_price")
+
+    # Optional fields behave like missing dict keys while they are None
+    _OPTIONAL = ("assetid", "classid", "instanceid", "appid", "contextid",
+                 "recommended_price", "lowest_price")
+    _DESCRIBED = ("market_hash_name", "type", "marketable", "category")
+
+    def __init__(self, description: Description, assetid=None, classid=None, instanceid=None,
+                 appid=None, contextid=None, amount: int = 1):
+        self.description = description
+        self.assetid = assetid
+        self.classid = classid
+        self.instanceid = instanceid
+        self.appid = appid
+        self.contextid = contextid
+        self.amount = amount
+        self.recommended_price = description.recommended_price
+        self.lowest_price = None
+
+    def _lookup(self, key: str) -> Any:
+        if key in self._DESCRIBED:
+            value = getattr(self.description, key)
+        elif key in self.__slots__ and key != "description":
+            value = getattr(self, key)
+        else:
+            raise KeyError(key)
+        if value is None and (key in self._OPTIONAL or key == "market_hash_name"):
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self._lookup(key)
+        except KeyError:
+            return default
+
+    def __getitem__(self, key: str) -> Any:
+        return self._lookup(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._OPTIONAL:
+            raise KeyError(f"Item field '{key}' is read-only or unknown")
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self) -> Iterator[str]:
+        for key in self._DESCRIBED + self.__slots__:
+            if key != "description" and key in self:
+                yield key
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self[key] for key in self.keys()}
+
+    def __repr__(self) -> str:
+        return f"Item({self.get('market_hash_name')!r}, assetid={self.assetid!r}, amount={self.amount})"
+
+
+_MISSING = object()
@@ -0,0 +1,190 @@
+import gc
+import hashlib
+import math
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Sequence
+
+from inventory.categories import CATEGORY_RULES
+from inventory.item_model import Description, Item
+from utils.helpers import info, warn
+
+SNAPSHOT_SUFFIX = ".snapshot"
+MAGIC = b"SIVSNAP1"
+VERSION = 2
+NONE_INDEX = 0xFFFFFFFF
+# Stored categories are only valid for the rules that produced them
+RULES_DIGEST = hashlib.sha256(repr(CATEGORY_RULES).encode("utf-8")).digest()[:8]
+
+# magic, version, source size, source mtime_ns, source sha256, category rules digest,
+# string count, description count, item count
+_HEADER = struct.Struct("<8sHQq32s8sIII")
+# name, type, category (string indexes), recommended_price (NaN = None), marketable
+_DESCRIPTION = struct.Struct("<IIIdB")
+# description, assetid, classid, instanceid, contextid (string indexes), appid, amount,
+# recommended_price override (NaN = None)
+_ITEM = struct.Struct("<IIIIIIId")
+
+
+# -----------------------------
+# Source fingerprint
+# -----------------------------
+def _fingerprint(source_path: str):
+    stat = os.stat(source_path)
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return stat.st_size, stat.st_mtime_ns, digest.digest()
+
+
+def snapshot_path_for(source_path: str) -> str:
+    return source_path + SNAPSHOT_SUFFIX
+
+
+# -----------------------------
+# Writing
+# -----------------------------
+def write_snapshot(source_path: str, items: Sequence[Item], snapshot_path: Optional[str] = None) -> str:
+    """
+    Write parsed items (with categories resolved) to a binary snapshot tied to the
+    source file's size, mtime and SHA-256 and to the category rules. Prices are the
+    export's own: pricing runs after loading with the provider and currency chosen
+    for that run, so resolved prices are never stored here. Written atomically.
+    """
+    snapshot_path = snapshot_path or snapshot_path_for(source_path)
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def string_id(value) -> int:
+        if value is None:
+            return NONE_INDEX
+        value = str(value)
+        index = string_ids.get(value)
+        if index is None:
+            index = string_ids[value] = len(strings)
+            strings.append(value)
+        return index
+
+    def price(value) -> float:
+        return math.nan if value is None else float(value)
+
+    descriptions = bytearray()
+    description_ids: Dict[int, int] = {}
+    records = bytearray()
+
+    for item in items:
+        desc = item.description
+        desc_index = description_ids.get(id(desc))
+        if desc_index is None:
+            desc_index = description_ids[id(desc)] = len(description_ids)
+            descriptions += _DESCRIPTION.pack(
+                string_id(desc.market_hash_name), string_id(desc.type), string_id(desc.category),
+                price(desc.recommended_price), int(desc.marketable),
+            )
+        override = item.recommended_price if item.recommended_price != desc.recommended_price else None
+        records += _ITEM.pack(
+            desc_index, string_id(item.assetid), string_id(item.classid), string_id(item.instanceid),
+            string_id(item.contextid), NONE_INDEX if item.appid is None else int(item.appid),
+            item.amount, price(override),
+        )
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = [0]
+    for blob in encoded:
+        offsets.append(offsets[-1] + len(blob))
+
+    size, mtime_ns, digest = _fingerprint(source_path)
+    tmp_path = snapshot_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, size, mtime_ns, digest, RULES_DIGEST,
+                             len(strings), len(description_ids), len(items)))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.write(b"".join(encoded))
+        f.write(descriptions)
+        f.write(records)
+    os.replace(tmp_path, snapshot_path)
+    info(f"Wrote inventory snapshot {snapshot_path} ({len(items)} items)")
+    return snapshot_path
+
+
+# -----------------------------
+# Loading
+# -----------------------------
+def load_snapshot(source_path: str, snapshot_path: Optional[str] = None) -> Optional[List[Item]]:
+    """
+    Memory-map a snapshot and rebuild its Items, skipping JSON parsing entirely.
+    Returns None if there is no snapshot or it does not match the source file
+    or the current category rules.
+    """
+    snapshot_path = snapshot_path or snapshot_path_for(source_path)
+    if not os.path.exists(snapshot_path) or os.path.getsize(snapshot_path) < _HEADER.size:
+        return None
+
+    with open(snapshot_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        magic, version = struct.unpack_from("<8sH", mm, 0)
+        if magic != MAGIC or version != VERSION:
+            warn(f"Ignoring snapshot with unknown format: {snapshot_path}")
+            return None
+        _, _, size, mtime_ns, digest, rules, n_strings, n_descs, n_items = _HEADER.unpack_from(mm, 0)
+        if rules != RULES_DIGEST:
+            info(f"Snapshot was classified with other category rules: {snapshot_path}")
+            return None
+
+        stat = os.stat(source_path)
+        if stat.st_size != size or stat.st_mtime_ns != mtime_ns or _fingerprint(source_path)[2] != digest:
+            info(f"Snapshot is out of date: {snapshot_path}")
+            return None
+
+        # Many small allocations with no cycles: pausing the cyclic GC halves load time
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            items = _read_items(mm, n_strings, n_descs, n_items)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    info(f"Loaded {len(items)} items from snapshot {snapshot_path}")
+    return items
+
+
+def _read_items(mm, n_strings: int, n_descs: int, n_items: int) -> List[Item]:
+    pos = _HEADER.size
+    offsets = struct.unpack_from(f"<{n_strings + 1}Q", mm, pos)
+    pos += 8 * (n_strings + 1)
+    blob = mm[pos:pos + offsets[-1]]
+    pos += offsets[-1]
+    strings = [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(n_strings)]
+
+    def text(index):
+        return None if index == NONE_INDEX else strings[index]
+
+    def price(value):
+        return None if math.isnan(value) else value
+
+    desc_end = pos + n_descs * _DESCRIPTION.size
+    descriptions = [
+        Description(text(name), text(type_) or "", bool(marketable), text(category), price(recommended))
+        for name, type_, category, recommended, marketable
+        in _DESCRIPTION.iter_unpack(mm[pos:desc_end])
+    ]
+
+    items = []
+    for desc_index, assetid, classid, instanceid, contextid, appid, amount, override \
+            in _ITEM.iter_unpack(mm[desc_end:desc_end + n_items * _ITEM.size]):
+        item = Item(
+            descriptions[desc_index],
+            assetid=text(assetid),
+            classid=text(classid),
+            instanceid=text(instanceid),
+            appid=None if appid == NONE_INDEX else appid,
+            contextid=text(contextid),
+            amount=amount,
+        )
+        override = price(override)
+        if override is not None:
+            item.recommended_price = override
+        items.append(item)
+    return items
@@ -1,9 +1,24 @@
-import json
+import os
 import time
-from inventory import inventory_fetcher
-from market import price_fetcher
-from filtering import filter_manager
-from utils.helpers import info, warn, prompt_optional_float, prompt_sort_key
+from inventory import export_pages, incremental, inventory_stream, snapshot
+from inventory.holdings import group_holdings
+from market import cassette, exchange_rates, price_history, price_providers
+from market.rate_limiter import DEFAULT_RATE
+from filtering import filter_manager, stats
+from utils import output
+from utils.helpers import ask, echo, info, warn, prompt_optional_float, prompt_sort_key
+from utils.metrics import METRICS
+
+# Set to a .json or .prom path to also write the end-of-run metrics there
+METRICS_FILE_ENV = "INVENTORY_METRICS_FILE"
+# Rows per page of the filtered listing; longer listings are also written to a results file
+PAGE_SIZE_ENV = "INVENTORY_PAGE_SIZE"
+# Send live price requests to another priceoverview endpoint (e.g. the local stand-in server)
+PRICE_URL_ENV = "INVENTORY_PRICE_URL"
+# Most valuable holdings listed in the summary
+TOP_HOLDINGS = 5
+# The summary compares the value with the recorded prices from this many days ago
+TREND_DAYS = 7
 
 def run():
     info("Starting Steam Inventory Analyzer")
@@ -11,110 +26,103 @@ def run():
     # -----------------------------
     # Load Inventory JSON
     # -----------------------------
-    json_path = input("Enter path to your Steam inventory JSON: ").strip()
+    json_path = ask("Enter path to your Steam inventory JSON (or a folder of export pages): ").strip()
     if not json_path:
         warn("No file path provided. Exiting.")
         return
+    json_path = export_pages.describe_source(json_path)
 
-    try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            raw_inventory = json.load(f)
-    except Exception as e:
-        warn(f"Failed to load JSON: {e}")
-        return
+    # A previous run's state lets us re-analyze only the assets that changed
+    state_path = incremental.state_path_for(json_path)
+    previous_state = incremental.AnalysisState.load(state_path) if os.path.exists(state_path) else None
+    use_incremental = previous_state is not None and ask(
+        "Previous analysis found. Only re-analyze changed assets? [y/n]: "
+    ).strip().lower() == "y"
 
-    parsed_inventory = inventory_fetcher.parse_inventory(raw_inventory)
-    if not parsed_inventory:
-        warn("Inventory is empty after parsing. Exiting.")
-        return
-
-    info(f"Inventory loaded: {len(parsed_inventory)} items")
+    items = holdings = None
+    if not use_incremental:
+        items, holdings = load_holdings(json_path)
+        if not holdings:
+            return
 
     # -----------------------------
     # Price Options
     # -----------------------------
-    print("\nPrice Options:")
-    print("1) Use recommended prices from JSON (fast, no network)")
-    print("2) Fetch live Steam Market prices (requires internet)")
-    choice = input("Choice (1 or 2, default 1): ").strip()
-    live_fetch = choice == "2"
-
-    print("\nSelect currency:")
-    print("1) USD")
-    print("2) CAD")
-    currency_choice = input("Choice (1 or 2, default 1): ").strip()
-    currency_map = {"1": 1, "2": 20}  # 1=USD, 20=CAD
+    echo("\nPrice Options:")
+    echo("1) Use recommended prices from JSON (fast, no network)")
+    echo("2) Fetch live Steam Market prices (requires internet)")
+    echo("3) Use cached prices from earlier live runs (no network)")
+    echo("4) Use a bulk price dump file (no network)")
+    choice = ask("Choice (1-4, default 1): ").strip()
+
+    echo("\nSelect currency:")
+    echo("1) USD")
+    echo("2) CAD")
+    echo("3) USD, also valued in other currencies (one fetch, local exchange rates)")
+    currency_choice = ask("Choice (1-3, default 1): ").strip()
+    currency_map = {"1": 1, "2": 20, "3": 1}  # 1=USD, 20=CAD
     currency_id = currency_map.get(currency_choice, 1)
+    base_code = exchange_rates.currency_code(currency_id)
+    extra_currencies, exchange_rate_table = [], None
+    if currency_choice == "3":
+        extra_currencies, exchange_rate_table = prompt_extra_currencies(base_code)
 
-    if live_fetch:
-        print(f"Fetching live prices in {'CAD' if currency_id==20 else 'USD'}...")
+    provider = select_price_provider(choice)
+    if provider is None:
+        return
+    if provider.requires_network:
+        echo(f"Fetching {provider.name} prices in {base_code}...")
     else:
-        print("Using recommended prices from JSON.")
+        echo(f"Using {provider.name} prices.")
 
     # -----------------------------
-    # Fetch Prices (Batched + Throttled)
+    # Fetch Prices
     # -----------------------------
-    price_map = {}
-    MIN_DELAY = 1.5
-    BATCH_SIZE = 20
-    BATCH_DELAY = 5
-
-    marketable_items = [item for item in parsed_inventory if item.get("marketable", True)]
-    total_items = len(marketable_items)
-    info(f"Preparing to fetch prices for {total_items} marketable items")
-
-    for batch_start in range(0, total_items, BATCH_SIZE):
-        batch = marketable_items[batch_start:batch_start + BATCH_SIZE]
-        batch_number = (batch_start // BATCH_SIZE) + 1
-        info(f"Starting batch {batch_number} ({len(batch)} items)")
-
-        for item in batch:
-            name = item["market_hash_name"]
-            try:
-                if live_fetch:
-                    price_info = price_fetcher.fetch_live_price(item, currency=currency_id)
-                    price = price_info.get("lowest_price", 0.0)
-                else:
-                    price = item.get("recommended_price", 0.0)
-
-                price_map[name] = price
-                info(f"Fetched price for {name}: {price}")
-
-                # Throttle each request
-                time.sleep(MIN_DELAY)
+    if use_incremental and previous_state.currency != currency_id:
+        warn("Previous analysis used another currency; re-analyzing everything.")
+        use_incremental = False
+        items, holdings = load_holdings(json_path)
+        if not holdings:
+            provider.close()
+            return
 
-            except Exception as e:
-                warn(f"Failed to fetch price for {name}: {e}")
-                price_map[name] = item.get("recommended_price", 0.0)
+    with METRICS.stage("pricing"):
+        if use_incremental:
+            state = incremental.update_state(json_path, previous_state, provider, currency_id)
+            holdings = state.holdings()
+        else:
+            marketable_items = [item for item in holdings if item.get("marketable", True)]
+            info(f"Preparing prices for {len(marketable_items)} unique marketable items")
+            priced = price_providers.apply_prices_safely(provider, marketable_items, currency_id)
+            info(f"Priced {priced} of {len(marketable_items)} items from {provider.name}")
+            prices = {item.get("market_hash_name"): item.get("recommended_price") for item in holdings}
+            state = incremental.AnalysisState.from_items(items, currency_id, prices)
 
-        # Pause between batches
-        if batch_start + BATCH_SIZE < total_items:
-            info(f"Batch {batch_number} complete. Waiting {BATCH_DELAY}s before next batch...")
-            time.sleep(BATCH_DELAY)
+        try:
+            state.save(state_path)
+        except OSError as e:
+            warn(f"Could not save analysis state: {e}")
+        price_history.record_prices(holdings, currency_id)
 
-    # -----------------------------
-    # Merge fetched prices into inventory
-    # -----------------------------
-    for item in parsed_inventory:
-        market_name = item.get("market_hash_name")
-        if market_name in price_map:
-            item["recommended_price"] = price_map[market_name]
+    if not holdings:
+        warn("Inventory is empty after parsing. Exiting.")
+        return
 
     # -----------------------------
     # Item Filtering
     # -----------------------------
-    category_counts = {}
-    for item in parsed_inventory:
-        if item.get("marketable", True):
-            cat = filter_manager.detect_category(item)
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+    # Built once; filters, sorts and totals below are vectorized when NumPy is available.
+    # Category counts come from the analysis state, which keeps them up to date by delta.
+    with METRICS.stage("filtering"):
+        inventory_table = filter_manager.build_table(holdings)
+    category_counts = state.category_counts
 
-    info("Available categories:")
+    echo("Available categories:")
     for index, (category, count) in enumerate(sorted(category_counts.items()), start=1):
-        print(f"{index}) {category} ({count})")
-    print(f"{len(category_counts)+1}) All")
+        echo(f"{index}) {category} ({count})")
+    echo(f"{len(category_counts)+1}) All")
 
-    category_choice = input("Select category number: ").strip()
+    category_choice = ask("Select category number: ").strip()
     selected_categories = None
     if category_choice.isdigit():
         category_index = int(category_choice)
@@ -129,29 +137,226 @@ def run():
     # Only allow price or name sorting now
     sort_key = prompt_sort_key(allow_game=False)
 
-    filtered_items = filter_manager.apply_filters(parsed_inventory, selected_categories, min_price, max_price, sort_key)
+    with METRICS.stage("filtering"):
+        filtered_items, total_estimated_value, filtered_quantity = filter_manager.filter_with_totals(
+            inventory_table, selected_categories, min_price, max_price, sort_key
+        )
 
     if not filtered_items:
         warn("No items matched filters. Exiting.")
         return
 
     info(f"Filtered items: {len(filtered_items)}")
+    with METRICS.stage("filtering"):
+        price_stats = filter_manager.summarize(filtered_items)
+        most_valuable = stats.top_n(filtered_items, TOP_HOLDINGS)
 
     # -----------------------------
     # Print Summary
     # -----------------------------
-    total_estimated_value = sum(item.get("recommended_price", 0) for item in filtered_items)
+    echo("\n=== Inventory Summary ===")
+    echo(f"Total items: {state.total_quantity} ({len(holdings)} unique)")
+    echo(f"Filtered items: {filtered_quantity} ({len(filtered_items)} unique)")
+    echo(f"Total estimated value: ${total_estimated_value:.2f}")
+    report_value_trend(filtered_items, total_estimated_value, currency_id)
+    if extra_currencies:
+        with METRICS.stage("output"):
+            converted_totals = exchange_rates.convert_prices(filtered_items, base_code, extra_currencies,
+                                                             exchange_rate_table)
+        for code, total in converted_totals.items():
+            echo(f"                       {exchange_rates.format_money(total, code)} ({code})")
+
+    echo("\nBy category:              units       value     min  median     p90     max")
+    for category, category_stats in sorted(price_stats.by_category.items()):
+        echo(f"{category:<22} {category_stats.count:>8} {category_stats.total:>11.2f} "
+             f"{category_stats.min:>7.2f} {category_stats.percentile(50):>7.2f} "
+             f"{category_stats.percentile(90):>7.2f} {category_stats.max:>7.2f}")
+
+    echo("\nMost valuable holdings:")
+    for item in most_valuable:
+        echo(f"  {item['market_hash_name']} x{item.get('quantity', 1)} = ${stats.item_value(item):.2f}")
+    echo()
 
-    print("\n=== Inventory Summary ===")
-    print(f"Total items: {len(parsed_inventory)}")
-    print(f"Filtered items: {len(filtered_items)}")
-    print(f"Total estimated value: ${total_estimated_value:.2f}\n")
+    page_size = result_page_size()
+    if len(filtered_items) > page_size:
+        results_path = output.results_path_for(json_path)
+        with METRICS.stage("output"):
+            try:
+                output.write_results(filtered_items, results_path)
+                info(f"All {len(filtered_items)} filtered items written to {results_path}")
+            except OSError as e:
+                warn(f"Could not write results file: {e}")
 
-    print("Filtered Items:")
-    for item in filtered_items:
-        print(f"{item['market_hash_name']} - ${item.get('recommended_price', 0):.2f}")
+    echo("Filtered Items:")
+    output.page_results(filtered_items, page_size)
 
     info("Analysis complete!")
 
+def load_holdings(json_path):
+    """
+    Load parsed items and group them into holdings. `json_path` may also be a folder
+    or list of export pages. Returns (None, None) on failure.
+    """
+    with METRICS.stage("load"):
+        items = load_parsed_inventory(json_path)
+        if items is None:
+            return None, None
+        holdings = group_holdings(items)
+
+    if not holdings:
+        warn("Inventory is empty after parsing. Exiting.")
+        return None, None
+
+    asset_total = sum(item["asset_count"] for item in holdings)
+    info(f"Inventory loaded: {asset_total} assets, {len(holdings)} unique items")
+    return items, holdings
+
+
+def load_parsed_inventory(json_path):
+    """
+    Load parsed items from a valid binary snapshot of the export, or stream-parse
+    the JSON and write a fresh snapshot for the next run. Paged exports (a folder or
+    list of page files) are streamed page by page without a snapshot.
+    Returns None on failure.
+    """
+    if export_pages.is_paged(json_path):
+        try:
+            return list(export_pages.iter_export(json_path))
+        except Exception as e:
+            warn(f"Failed to load export pages: {e}")
+            return None
+
+    try:
+        items = snapshot.load_snapshot(json_path)
+    except Exception as e:
+        warn(f"Failed to read inventory snapshot: {e}")
+        items = None
+    if items is not None:
+        return items
+
+    try:
+        items = list(inventory_stream.iter_inventory_file(json_path))
+    except Exception as e:
+        warn(f"Failed to load JSON: {e}")
+        return None
+
+    # Written before pricing on purpose: the snapshot caches parsing and classification,
+    # while prices depend on the provider and currency picked for each run
+    try:
+        snapshot.write_snapshot(json_path, items)
+    except OSError as e:
+        warn(f"Could not write inventory snapshot: {e}")
+    return items
+
+
+def select_price_provider(choice):
+    """
+    Map the price menu choice to a PriceProvider. Only the live provider is throttled
+    or touches the network; the others price everything in a single pass.
+    """
+    if choice == "2":
+        rate = prompt_optional_float(f"Requests per second [{DEFAULT_RATE}]: ")
+        try:
+            session = cassette.session_from_env()
+        except (OSError, ValueError) as e:
+            warn(f"Cannot use price cassette: {e}")
+            return None
+        return price_providers.LiveSteamProvider(
+            rate=rate or DEFAULT_RATE, session=session, base_url=os.environ.get(PRICE_URL_ENV),
+            budget=prompt_fetch_budget(),
+        )
+    if choice == "3":
+        return price_providers.CachePriceProvider()
+    if choice == "4":
+        dump_path = ask("Enter path to the price dump file: ").strip()
+        if not dump_path:
+            warn("No dump file provided. Exiting.")
+            return None
+        return price_providers.DumpFilePriceProvider(dump_path)
+    return price_providers.JsonPriceProvider()
+
+def prompt_fetch_budget():
+    """Optional time/request limit for a live refresh; the most valuable items are fetched first."""
+    seconds = prompt_optional_float("Time budget in seconds (blank = no limit): ")
+    max_requests = prompt_optional_float("Request budget (blank = no limit): ")
+    if seconds is None and max_requests is None:
+        return None
+    # Imported here so offline runs never load requests
+    from market.fetch_scheduler import FetchBudget
+    return FetchBudget(seconds=seconds, max_requests=int(max_requests) if max_requests is not None else None)
+
+def prompt_extra_currencies(base_code):
+    """
+    Ask which other currencies to value in. Rates come from the local exchange-rate
+    table; missing ones are asked for once and saved with today's timestamp.
+    Returns (currency codes, ExchangeRateTable).
+    """
+    try:
+        exchange_rate_table = exchange_rates.ExchangeRateTable.load()
+    except (OSError, ValueError, KeyError) as e:
+        warn(f"Could not read exchange rates: {e}")
+        return [], None
+    if not exchange_rate_table.has_rate(base_code):
+        warn(f"Exchange rates are based on {exchange_rate_table.base} and have no {base_code} rate.")
+        return [], None
+
+    answer = ask("Other currencies, comma separated [CAD]: ").strip() or "CAD"
+    codes = []
+    for code in (part.strip().upper() for part in answer.split(",")):
+        if not code or code == base_code or code in codes:
+            continue
+        if not exchange_rate_table.has_rate(code):
+            rate = prompt_optional_float(f"{code} per 1 {exchange_rate_table.base}: ")
+            if not rate or rate <= 0:
+                warn(f"No rate for {code}; skipping it.")
+                continue
+            exchange_rate_table.set_rate(code, rate)
+            try:
+                exchange_rate_table.save()
+            except OSError as e:
+                warn(f"Could not save exchange rates: {e}")
+        codes.append(code)
+    exchange_rate_table.warn_if_stale(codes)
+    return codes, exchange_rate_table
+
+def report_value_trend(items, current_value, currency_id):
+    """Compare the value with the price history from TREND_DAYS ago and list the biggest movers."""
+    since = time.time() - TREND_DAYS * 24 * 60 * 60
+    try:
+        with price_history.PriceHistory() as history:
+            past_value, priced = history.value_at(items, currency_id, since)
+            movers = history.movers(since, currency_id, TOP_HOLDINGS,
+                                    {item["market_hash_name"]: item.get("quantity", 1) for item in items})
+    except (OSError, ValueError) as e:
+        warn(f"Could not read price history: {e}")
+        return
+    if not priced:
+        return
+    echo(f"Value {TREND_DAYS} days ago: ${past_value:.2f} ({current_value - past_value:+.2f}; "
+         f"{priced} of {len(items)} items had prices then)")
+    for move in movers:
+        echo(f"  {move['market_hash_name']}: ${move['then']:.2f} -> ${move['now']:.2f} "
+             f"({move['value_change']:+.2f} for x{move['quantity']})")
+
+def result_page_size():
+    try:
+        return max(1, int(os.environ.get(PAGE_SIZE_ENV, output.DEFAULT_PAGE_SIZE)))
+    except ValueError:
+        return output.DEFAULT_PAGE_SIZE
+
+def report_metrics():
+    """Print the run's stage timings and fetch metrics, and write them out if requested."""
+    METRICS.print_summary()
+    metrics_path = os.environ.get(METRICS_FILE_ENV)
+    if metrics_path:
+        try:
+            METRICS.write(metrics_path)
+            info(f"Metrics written to {metrics_path}")
+        except OSError as e:
+            warn(f"Could not write metrics: {e}")
+
 if __name__ == "__main__":
-    run()
+    try:
+        run()
+    finally:
+        report_metrics()
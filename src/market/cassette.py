@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.helpers import info, warn
+
+CASSETTE_VERSION = 1
+RECORDED_HEADERS = ("Retry-After", "Content-Type")
+
+# Live fetches record to / replay from a cassette when these are set
+CASSETTE_ENV = "INVENTORY_PRICE_CASSETTE"
+CASSETTE_MODE_ENV = "INVENTORY_PRICE_CASSETTE_MODE"
+CASSETTE_MODES = ("record", "replay")
+
+
+def _request_key(params: Optional[Dict[str, Any]]) -> Tuple[str, str, str]:
+    params = params or {}
+    return str(params.get("appid", "")), str(params.get("currency", "")), str(params.get("market_hash_name", ""))
+
+
+# -----------------------------
+# Cassette file
+# -----------------------------
+class Cassette:
+    """
+    Recorded priceoverview responses, keyed by (appid, currency, market_hash_name).
+    A name keeps every response in the order it was seen, so a recorded 429
+    followed by a 200 replays the same way. Once a name's responses are used up,
+    replay keeps returning the last one.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._interactions: Dict[Tuple[str, str, str], List[dict]] = {}
+        self._replay_positions: Dict[Tuple[str, str, str], int] = {}
+        if os.path.exists(path):
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {self.path}")
+        for entry in data.get("interactions", []):
+            key = _request_key(entry.get("request"))
+            self._interactions.setdefault(key, []).append(entry["response"])
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._interactions.values())
+
+    def record(self, params: Dict[str, Any], status: int, headers: Dict[str, str], body: str) -> None:
+        wanted = {name.lower(): name for name in RECORDED_HEADERS}
+        response = {
+            "status": status,
+            "headers": {wanted[name.lower()]: value for name, value in headers.items() if name.lower() in wanted},
+            "body": body,
+        }
+        with self._lock:
+            self._interactions.setdefault(_request_key(params), []).append(response)
+
+    def next_response(self, params: Dict[str, Any]) -> Optional[dict]:
+        """The next recorded response for this request, or None if it was never recorded."""
+        key = _request_key(params)
+        with self._lock:
+            responses = self._interactions.get(key)
+            if not responses:
+                return None
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            return responses[min(position, len(responses) - 1)]
+
+    def save(self) -> None:
+        with self._lock:
+            interactions = [
+                {"request": {"appid": appid, "currency": currency, "market_hash_name": name}, "response": response}
+                for (appid, currency, name), responses in self._interactions.items()
+                for response in responses
+            ]
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CASSETTE_VERSION, "interactions": interactions}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+class CassetteResponse:
+    """The parts of a requests.Response that PriceClient reads."""
+
+    def __init__(self, status_code: int, headers: Optional[Dict[str, str]] = None, text: str = ""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+# -----------------------------
+# Sessions
+# -----------------------------
+class RecordingSession:
+    """Wraps a real session and records every priceoverview response it returns."""
+
+    def __init__(self, cassette: Cassette, session=None):
+        if session is None:
+            from market.price_client import build_session
+            session = build_session()
+        self.cassette = cassette
+        self.session = session
+
+    def get(self, url, params=None, timeout=None):
+        response = self.session.get(url, params=params, timeout=timeout)
+        self.cassette.record(params, response.status_code, dict(response.headers), response.text)
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+        try:
+            self.cassette.save()
+            info(f"Recorded {len(self.cassette)} responses to {self.cassette.path}")
+        except OSError as e:
+            warn(f"Could not save cassette {self.cassette.path}: {e}")
+
+
+class ReplaySession:
+    """Serves recorded responses with no network. Unrecorded requests get a 404."""
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+        self.misses = 0
+
+    def get(self, url, params=None, timeout=None):
+        recorded = self.cassette.next_response(params)
+        if recorded is None:
+            self.misses += 1
+            return CassetteResponse(404, text="{}")
+        return CassetteResponse(recorded["status"], dict(recorded.get("headers", {})), recorded.get("body", ""))
+
+    def close(self) -> None:
+        if self.misses:
+            warn(f"{self.misses} requests were not in cassette {self.cassette.path}")
+
+
+def session_from_env():
+    """
+    Record/replay session configured by INVENTORY_PRICE_CASSETTE (path) and
+    INVENTORY_PRICE_CASSETTE_MODE (record or replay). Returns None when unset.
+    """
+    path = os.environ.get(CASSETTE_ENV)
+    if not path:
+        return None
+    mode = os.environ.get(CASSETTE_MODE_ENV, "replay").strip().lower()
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"{CASSETTE_MODE_ENV} must be one of {', '.join(CASSETTE_MODES)}")
+    if mode == "replay" and not os.path.exists(path):
+        raise FileNotFoundError(f"Cassette not found: {path}")
+
+    cassette = Cassette(path)
+    info(f"Price cassette {path}: {mode} mode ({len(cassette)} recorded responses)")
+    if mode == "record":
+        return RecordingSession(cassette)
+    return ReplaySession(cassette)
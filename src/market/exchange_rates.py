@@ -0,0 +1,114 @@
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.helpers import warn
+
+DEFAULT_RATES_PATH = "exchange_rates.json"
+MAX_RATE_AGE_SECONDS = 7 * 24 * 60 * 60  # older rates still convert, with a warning
+
+# Steam Market currency ids
+CURRENCY_CODES = {
+    1: "USD", 2: "GBP", 3: "EUR", 4: "CHF", 5: "RUB", 6: "PLN", 7: "BRL", 8: "JPY",
+    9: "NOK", 16: "KRW", 17: "TRY", 20: "CAD", 21: "AUD", 22: "NZD", 23: "CNY",
+}
+CURRENCY_IDS = {code: currency_id for currency_id, code in CURRENCY_CODES.items()}
+CURRENCY_SYMBOLS = {"USD": "$", "CAD": "CDN$ ", "EUR": "€", "GBP": "£", "AUD": "A$ ", "NZD": "NZ$ ",
+                    "JPY": "¥ ", "CNY": "¥ ", "BRL": "R$ ", "CHF": "CHF ", "PLN": "zł ", "KRW": "₩ "}
+
+
+def currency_code(currency_id: int) -> str:
+    return CURRENCY_CODES.get(currency_id, str(currency_id))
+
+
+def format_money(amount: float, code: str = "USD") -> str:
+    return f"{CURRENCY_SYMBOLS.get(code, code + ' ')}{amount:,.2f}"
+
+
+# -----------------------------
+# Exchange-rate table
+# -----------------------------
+class ExchangeRateTable:
+    """
+    Locally stored exchange rates against one base currency, each with the time it
+    was set. Stored as JSON:
+        {"base": "USD", "rates": {"CAD": {"rate": 1.37, "updated_at": 1760000000.0}, ...}}
+    `rate` is units of that currency per one unit of the base currency.
+    """
+
+    def __init__(self, base: str = "USD", path: str = DEFAULT_RATES_PATH):
+        self.base = base.upper()
+        self.path = path
+        self.rates: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_RATES_PATH) -> "ExchangeRateTable":
+        """Read the table at `path`; a missing file gives an empty USD table."""
+        if not os.path.exists(path):
+            return cls(path=path)
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        table = cls(data.get("base", "USD"), path)
+        for code, entry in data.get("rates", {}).items():
+            table.rates[code.upper()] = {"rate": float(entry["rate"]), "updated_at": float(entry["updated_at"])}
+        return table
+
+    def save(self) -> None:
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"base": self.base, "rates": self.rates}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def set_rate(self, code: str, rate: float, updated_at: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"Exchange rate for {code} must be positive")
+        self.rates[code.upper()] = {"rate": float(rate), "updated_at": updated_at or time.time()}
+
+    def has_rate(self, code: str) -> bool:
+        code = code.upper()
+        return code == self.base or code in self.rates
+
+    def rate(self, code: str) -> float:
+        """Units of `code` per one unit of the base currency."""
+        code = code.upper()
+        if code == self.base:
+            return 1.0
+        if code not in self.rates:
+            raise KeyError(f"No exchange rate for {code} (base {self.base}) in {self.path}")
+        return self.rates[code]["rate"]
+
+    def age(self, code: str) -> float:
+        code = code.upper()
+        if code == self.base:
+            return 0.0
+        return time.time() - self.rates[code]["updated_at"]
+
+    def convert(self, amount: float, from_code: str, to_code: str) -> float:
+        return amount * self.rate(to_code) / self.rate(from_code)
+
+    def warn_if_stale(self, codes: Iterable[str]) -> None:
+        for code in codes:
+            if self.has_rate(code) and self.age(code) > MAX_RATE_AGE_SECONDS:
+                warn(f"Exchange rate for {code.upper()} is {self.age(code) / 86400:.0f} days old")
+
+
+# -----------------------------
+# Multi-currency valuation
+# -----------------------------
+def convert_prices(items: Iterable[Dict[str, Any]], base: str, codes: List[str],
+                   table: ExchangeRateTable) -> Dict[str, float]:
+    """
+    One pass over priced items: sets item["converted_prices"] = {code: unit price}
+    from the base-currency recommended_price, and returns {code: total value}.
+    """
+    factors = {code: table.convert(1.0, base, code) for code in codes}
+    totals = {code: 0.0 for code in codes}
+    for item in items:
+        price = item.get("recommended_price") or 0.0
+        quantity = item.get("quantity", 1)
+        converted = {code: round(price * factor, 2) for code, factor in factors.items()}
+        item["converted_prices"] = converted
+        for code, factor in factors.items():
+            totals[code] += price * factor * quantity
+    return totals
@@ -0,0 +1,120 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from market import price_fetcher
+from market.price_cache import PriceCache
+from market.price_client import PriceClient
+from market.rate_limiter import DEFAULT_BURST, DEFAULT_RATE, AdaptiveRateLimiter
+from utils.helpers import Progress, info, warn
+
+DEFAULT_MAX_WORKERS = 4
+
+
+# -----------------------------
+# Concurrent fetch
+# -----------------------------
+def fetch_prices(
+        items: Iterable[Dict[str, Any]],
+        currency: int = 1,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_result: Optional[Callable[[str, float, int, int], None]] = None,
+        cache: Optional[PriceCache] = None,
+        client: Optional[PriceClient] = None,
+        fetch: Callable[..., Dict[str, Any]] = price_fetcher.fetch_live_price,
+        budget=None,
+) -> Dict[str, float]:
+    """
+    Fetch live prices for items on a bounded thread pool sharing one pooled
+    PriceClient and one AdaptiveRateLimiter (starting at `rate`, slowed by 429s).
+    A caller-supplied client keeps its own limiter and `rate`/`burst` are ignored.
+    Returns {market_hash_name: price} for the names that were fetched successfully;
+    failed fetches are left out so the caller can fall back to a cached or JSON price.
+    `on_result(name, price, done, total)` is called as each fetch finishes, with
+    price None on failure (default: one aggregated progress line, with per-item
+    lines in verbose mode).
+    With a PriceCache, fresh cached prices are served without taking a token.
+    Items are fetched in the order given. With a FetchBudget, no new fetches start
+    once it is exhausted; names that were never fetched are left out of the result.
+    """
+    pending = {}
+    for item in items:
+        name = item.get("market_hash_name")
+        if name and name not in pending:
+            pending[name] = item
+
+    total = len(pending)
+    price_map: Dict[str, float] = {}
+    if not total:
+        return price_map
+
+    progress = None
+    if on_result is None:
+        progress = Progress("Fetching prices", total)
+
+        def on_result(name, price, done, total):
+            progress.update(detail=f"Fetched price for {name}: {price}" if price is not None
+                            else f"No price for {name}")
+
+    owns_client = client is None
+    if owns_client:
+        client = PriceClient(AdaptiveRateLimiter(rate, burst), pool_size=max_workers)
+    limiter = client.limiter
+
+    workers = max(1, min(max_workers, total))
+    queue = iter(pending.items())
+    in_flight = {}
+    submitted = failed = 0
+    if budget is not None:
+        budget.start()
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            def submit_next() -> bool:
+                nonlocal submitted
+                if submitted == total:
+                    return False
+                # Submitted lazily (a couple per worker) so a budget can stop the run between items
+                if budget is not None and budget.exhausted(len(in_flight)):
+                    budget.stopped = True
+                    return False
+                name, item = next(queue)
+                future = pool.submit(fetch, item, currency=currency, limiter=limiter, cache=cache, client=client)
+                in_flight[future] = name
+                submitted += 1
+                return True
+
+            while len(in_flight) < workers * 2 and submit_next():
+                pass
+
+            done = 0
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = in_flight.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        warn(f"Failed to fetch price for {name}: {e}")
+                        result = None
+                    price = result.get("lowest_price") if result is not None else None
+                    if price is None:
+                        failed += 1
+                    else:
+                        price_map[name] = price
+                    done += 1
+                    on_result(name, price, done, total)
+                    submit_next()
+    finally:
+        if progress is not None:
+            progress.close()
+        if owns_client:
+            client.close()
+
+    if failed:
+        warn(f"No price fetched for {failed} of {total} items")
+    if budget is not None and budget.stopped:
+        info(f"Fetch budget ({budget.describe()}) exhausted after {submitted} of {total} items")
+    return price_map
+
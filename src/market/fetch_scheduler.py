@@ -0,0 +1,105 @@
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from market.price_client import DEFAULT_APPID
+from utils.helpers import info
+from utils.metrics import METRICS
+
+
+# -----------------------------
+# Budget
+# -----------------------------
+class FetchBudget:
+    """
+    Limits a live refresh by wall time and/or HTTP requests (retries included).
+    The fetch engine stops submitting new items once exhausted() is true and lets
+    in-flight fetches finish, so a partial run still ends cleanly.
+    """
+
+    def __init__(self, seconds: Optional[float] = None, max_requests: Optional[int] = None):
+        self.seconds = seconds
+        self.max_requests = max_requests
+        self._deadline = None
+        self._requests_at_start = 0
+        self.stopped = False  # set by the fetch engine when the budget cut a run short
+
+    def start(self) -> None:
+        self.stopped = False
+        if self.seconds is not None:
+            self._deadline = time.monotonic() + self.seconds
+        self._requests_at_start = METRICS.counter("http_requests")
+
+    def requests_used(self) -> int:
+        return METRICS.counter("http_requests") - self._requests_at_start
+
+    def exhausted(self, in_flight: int = 0) -> bool:
+        """In-flight fetches count against the request budget, as each needs at least one request."""
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return True
+        return self.max_requests is not None and self.requests_used() + in_flight >= self.max_requests
+
+    def describe(self) -> str:
+        parts = []
+        if self.seconds is not None:
+            parts.append(f"{self.seconds:g}s")
+        if self.max_requests is not None:
+            parts.append(f"{self.max_requests} requests")
+        return " / ".join(parts) or "unlimited"
+
+
+# -----------------------------
+# Prioritization
+# -----------------------------
+def expected_value(item: Dict[str, Any], last_known: Dict[Tuple[int, str], float]) -> float:
+    """Last known market price (any age) or recommended_price, times quantity held."""
+    name = item.get("market_hash_name")
+    price = last_known.get((int(item.get("appid") or DEFAULT_APPID), name))
+    if price is None:
+        price = item.get("recommended_price") or 0.0
+    return price * item.get("quantity", 1)
+
+
+def prioritize(items: Iterable[Dict[str, Any]], last_known: Dict[Tuple[int, str], float]) -> List[Dict[str, Any]]:
+    """Items ordered by expected value, highest first, so a cut-off run has priced what matters most."""
+    return sorted(items, key=lambda item: expected_value(item, last_known), reverse=True)
+
+
+# -----------------------------
+# Coverage report
+# -----------------------------
+class ValuationCoverage:
+    """How much of the inventory's value was priced by this run rather than by a fallback."""
+
+    def __init__(self, fresh_items: int, total_items: int, fresh_value: float, total_value: float,
+                 budget_exhausted: bool = False):
+        self.fresh_items = fresh_items
+        self.total_items = total_items
+        self.fresh_value = fresh_value
+        self.total_value = total_value
+        self.budget_exhausted = budget_exhausted
+
+    @property
+    def fresh_fraction(self) -> float:
+        return self.fresh_value / self.total_value if self.total_value else 1.0
+
+    @classmethod
+    def measure(cls, items: Iterable[Dict[str, Any]], fresh: Dict[str, float], prices: Dict[str, float],
+                budget_exhausted: bool = False) -> "ValuationCoverage":
+        """`fresh` holds the prices fetched this run; `prices` also holds the fallbacks."""
+        fresh_items = total_items = 0
+        fresh_value = total_value = 0.0
+        for item in items:
+            name = item.get("market_hash_name")
+            price = prices.get(name, item.get("recommended_price") or 0.0)
+            value = price * item.get("quantity", 1)
+            total_items += 1
+            total_value += value
+            if name in fresh:
+                fresh_items += 1
+                fresh_value += value
+        return cls(fresh_items, total_items, fresh_value, total_value, budget_exhausted)
+
+    def report(self) -> None:
+        reason = " (budget exhausted)" if self.budget_exhausted else ""
+        info(f"Fresh prices for {self.fresh_items}/{self.total_items} items{reason}, covering "
+             f"{self.fresh_fraction:.1%} of the {self.total_value:.2f} total value")
@@ -0,0 +1,117 @@
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from utils.helpers import info
+from utils.metrics import METRICS
+
+DEFAULT_APPID = 730  # CS2; assumed for items without an appid
+DEFAULT_CACHE_PATH = ".price_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 6 * 60 * 60
+DEFAULT_MAX_ENTRIES = 50_000
+EVICT_EVERY = 256  # puts between eviction sweeps
+
+
+# -----------------------------
+# Persistent price cache
+# -----------------------------
+class PriceCache:
+    """
+    SQLite-backed cache of Steam Market prices keyed by (appid, market_hash_name, currency).
+    Entries older than `ttl` seconds count as stale and are not returned.
+    When more than `max_entries` rows exist the oldest ones are evicted (checked
+    every EVICT_EVERY writes and on close).
+    Safe to share between fetch_engine worker threads.
+    """
+
+    def __init__(
+            self,
+            path: str = DEFAULT_CACHE_PATH,
+            ttl: float = DEFAULT_TTL_SECONDS,
+            max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS prices ("
+            " appid INTEGER NOT NULL,"
+            " market_hash_name TEXT NOT NULL,"
+            " currency INTEGER NOT NULL,"
+            " price REAL NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (appid, market_hash_name, currency))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS prices_age ON prices (fetched_at)")
+        self._conn.commit()
+
+    def get(self, appid: int, market_hash_name: str, currency: int) -> Optional[float]:
+        """Return the cached price if present and fresh, else None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT price, fetched_at FROM prices"
+                " WHERE appid = ? AND market_hash_name = ? AND currency = ?",
+                (int(appid), market_hash_name, int(currency)),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                METRICS.incr("cache_misses")
+                return None
+            price, fetched_at = row
+            if time.time() - fetched_at > self.ttl:
+                self.stale += 1
+                METRICS.incr("cache_stale")
+                return None
+            self.hits += 1
+            METRICS.incr("cache_hits")
+            return price
+
+    def last_known_prices(self, currency: int) -> Dict[Tuple[int, str], float]:
+        """Every cached price in `currency`, stale or not, as {(appid, market_hash_name): price}."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT appid, market_hash_name, price FROM prices WHERE currency = ?", (int(currency),)
+            ).fetchall()
+        return {(appid, name): price for appid, name, price in rows}
+
+    def put(self, appid: int, market_hash_name: str, currency: int, price: float) -> None:
+        """Store a freshly fetched price and evict the oldest rows if over capacity."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?, ?)",
+                (int(appid), market_hash_name, int(currency), float(price), time.time()),
+            )
+            self._puts += 1
+            if self._puts % EVICT_EVERY == 0:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM prices").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM prices WHERE rowid IN"
+                " (SELECT rowid FROM prices ORDER BY fetched_at LIMIT ?)",
+                (excess,),
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stale": self.stale}
+
+    def report(self) -> None:
+        stats = self.stats()
+        info(f"Price cache: {stats['hits']} hits, {stats['misses']} misses, {stats['stale']} stale")
+
+    def close(self) -> None:
+        with self._lock:
+            self._evict()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,138 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from market.price_cache import DEFAULT_APPID
+from market.rate_limiter import AdaptiveRateLimiter, TokenBucket
+from utils.helpers import warn
+from utils.metrics import METRICS
+
+PRICE_OVERVIEW_URL = "https://steamcommunity.com/market/priceoverview/"
+DEFAULT_POOL_SIZE = 8
+DEFAULT_TIMEOUT = 5
+MAX_ERROR_BACKOFF = 30.0
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+    Returns None when the header is missing or unreadable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def build_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Session with a keep-alive connection pool large enough for every fetch worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# -----------------------------
+# Price client
+# -----------------------------
+class PriceClient:
+    """
+    Steam Market priceoverview client on one pooled session.
+    All requests share `limiter`; a 429 is reported to it (with Retry-After) so the
+    global rate adapts, instead of each caller sleeping on its own.
+    """
+
+    def __init__(self, limiter: Optional[TokenBucket] = None, pool_size: int = DEFAULT_POOL_SIZE,
+                 timeout: float = DEFAULT_TIMEOUT, session: Optional[requests.Session] = None,
+                 base_url: str = PRICE_OVERVIEW_URL):
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.timeout = timeout
+        self.session = session or build_session(pool_size)
+        self.base_url = base_url
+
+    def fetch_overview(self, market_hash_name: str, appid: int = DEFAULT_APPID, currency: int = 1,
+                       max_retries: int = 5, delay: float = 1.0,
+                       limiter: Optional[TokenBucket] = None) -> Optional[dict]:
+        """
+        Return the decoded priceoverview JSON, or None once retries are exhausted.
+        `delay` is the base backoff for network errors and 5xx responses only.
+        """
+        limiter = limiter or self.limiter
+        params = {"appid": appid, "currency": currency, "market_hash_name": market_hash_name}
+
+        for attempt in range(1, max_retries + 1):
+            if attempt > 1:
+                METRICS.incr("http_retries")
+            limiter.acquire()
+            METRICS.incr("http_requests")
+            start = time.perf_counter()
+            try:
+                response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                METRICS.add_time("http_seconds", time.perf_counter() - start)
+                METRICS.incr("http_errors")
+                warn(f"Attempt {attempt} failed for {market_hash_name}: {e}")
+                self._backoff(delay, attempt)
+                continue
+            METRICS.add_time("http_seconds", time.perf_counter() - start)
+            METRICS.record_status(response.status_code)
+
+            if response.status_code == 429:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                warn(f"HTTP 429 rate limit for {market_hash_name}, retrying ({attempt}/{max_retries})...")
+                limiter.record_throttled(retry_after)
+                continue
+
+            if response.status_code >= 500:
+                warn(f"HTTP {response.status_code} for {market_hash_name} ({attempt}/{max_retries})")
+                self._backoff(delay, attempt)
+                continue
+
+            limiter.record_success()
+            if response.status_code != 200:
+                warn(f"HTTP {response.status_code} for {market_hash_name}, giving up")
+                return None
+            try:
+                return response.json()
+            except ValueError as e:
+                warn(f"Invalid JSON for {market_hash_name}: {e}")
+                return None
+
+        return None
+
+    @staticmethod
+    def _backoff(delay: float, attempt: int) -> None:
+        seconds = min(MAX_ERROR_BACKOFF, delay * 2 ** (attempt - 1))
+        METRICS.add_time("error_backoff_seconds", seconds)
+        time.sleep(seconds)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_default_client: Optional[PriceClient] = None
+_default_lock = threading.Lock()
+
+
+def get_default_client() -> PriceClient:
+    """Process-wide client so callers that don't pass one still reuse connections."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = PriceClient()
+        return _default_client
@@ -0,0 +1,131 @@
+import csv
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from inventory.inventory_stream import iter_top_level_members
+from market.exchange_rates import CURRENCY_IDS
+from utils.helpers import info, warn
+
+
+# -----------------------------
+# Price index
+# -----------------------------
+class PriceIndex:
+    """
+    Hash index over a price dump: (market_hash_name, currency id or None) -> price.
+    Rows without a currency match any requested currency.
+    """
+
+    def __init__(self):
+        self._prices: Dict[Tuple[str, Optional[int]], float] = {}
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def add(self, name: str, price: float, currency: Optional[int] = None) -> None:
+        self._prices[(name, currency)] = price
+
+    def lookup(self, name: str, currency: Optional[int] = None) -> Optional[float]:
+        price = self._prices.get((name, currency))
+        if price is None and currency is not None:
+            price = self._prices.get((name, None))
+        return price
+
+    def join(self, items: Iterable[Dict[str, Any]], currency: Optional[int] = None) -> int:
+        """
+        Set recommended_price on every item found in the index, in a single pass.
+        Returns the number of items priced.
+        """
+        matched = 0
+        for item in items:
+            name = item.get("market_hash_name")
+            if not name:
+                continue
+            price = self.lookup(name, currency)
+            if price is not None:
+                item["recommended_price"] = price
+                matched += 1
+        return matched
+
+
+# -----------------------------
+# Dump readers
+# -----------------------------
+def _currency_id(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text)
+    return CURRENCY_IDS.get(text.upper())
+
+
+def _iter_lines(path: str) -> Iterator[str]:
+    """Memory-map the dump and yield decoded lines without reading it into memory."""
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for raw_line in iter(mm.readline, b""):
+            yield raw_line.decode("utf-8-sig")
+
+
+def _iter_csv(path: str) -> Iterator[Tuple[str, Any, Any]]:
+    reader = csv.DictReader(_iter_lines(path))
+    for row in reader:
+        yield row.get("market_hash_name"), row.get("price"), row.get("currency")
+
+
+def _iter_jsonl(path: str) -> Iterator[Tuple[str, Any, Any]]:
+    for line in _iter_lines(path):
+        line = line.strip()
+        if line:
+            record = json.loads(line)
+            yield record.get("market_hash_name"), record.get("price"), record.get("currency")
+
+
+def _iter_json(path: str) -> Iterator[Tuple[str, Any, Any]]:
+    """A JSON object of name -> price, or name -> {currency: price}, streamed member by member."""
+    with open(path, "r", encoding="utf-8") as f:
+        for name, value in iter_top_level_members(f):
+            if isinstance(value, dict):
+                for currency, price in value.items():
+                    yield name, price, currency
+            else:
+                yield name, value, None
+
+
+_READERS = {".csv": _iter_csv, ".jsonl": _iter_jsonl, ".ndjson": _iter_jsonl, ".json": _iter_json}
+
+
+def load_price_index(path: str, wanted: Optional[Set[str]] = None,
+                     currency: Optional[int] = None) -> PriceIndex:
+    """
+    Stream a price dump (.csv, .jsonl/.ndjson or .json) into a PriceIndex.
+    Only rows whose name is in `wanted` (when given) and whose currency matches
+    `currency` (when given; rows without a currency always match) are kept, so a
+    market-wide dump costs memory proportional to the items actually owned.
+    CSV/JSONL dumps need `market_hash_name` and `price` columns, `currency` is optional.
+    """
+    reader = _READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"Unsupported price dump format: {path}")
+
+    index = PriceIndex()
+    skipped = 0
+    for name, price, row_currency in reader(path):
+        if not name or (wanted is not None and name not in wanted):
+            continue
+        row_currency = _currency_id(row_currency)
+        if currency is not None and row_currency not in (None, currency):
+            continue
+        try:
+            index.add(name, float(price), row_currency)
+        except (TypeError, ValueError):
+            skipped += 1
+
+    if skipped:
+        warn(f"Skipped {skipped} unreadable prices in {path}")
+    info(f"Indexed {len(index)} prices from {path}")
+    return index
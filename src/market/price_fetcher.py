@@ -1,7 +1,6 @@
-import requests
-import time
 import re
-from utils.helpers import warn, info
+from market.price_client import DEFAULT_APPID, get_default_client
+from utils.helpers import warn
 
 # -----------------------------
 # Helpers
@@ -9,16 +8,32 @@ from utils.helpers import warn, info
 def clean_steam_price(price_string):
     """
     Converts Steam Market price string to float safely.
-    Handles formats like "$0.03", "CDN$ 5.44", "$1,234.56" etc.
+    Handles formats like "$0.03", "CDN$ 5.44", "$1,234.56" and locale formats
+    such as "1.234,56€", "12,34€", "5,--€", "1 234,56 pуб." and "CHF 1'234.50".
+    The last separator is the decimal point and earlier ones group thousands, except:
+    - repeats of a single kind only group thousands ("1.234.567", "1,234,567");
+    - a lone "." or "," followed by exactly three digits groups thousands
+      ("12.345₫", "CLP$ 1.234", "¥ 1,234").
+    Steam shows two decimals or none, so three digits after a separator are never cents.
     """
     if not price_string:
         return 0.0
 
-    # Remove everything except digits, dot, comma, minus
-    cleaned = re.sub(r"[^\d.,\-]", "", str(price_string))
+    # Steam writes whole amounts in some locales as "5,--€"
+    text = str(price_string).replace("--", "00")
 
-    # Remove thousands separators
-    cleaned = cleaned.replace(",", "")
+    # Remove everything except digits, dot, comma, minus (and stray dots such as "pуб.")
+    cleaned = re.sub(r"[^\d.,\-]", "", text).strip(".,")
+
+    separators = [i for i, ch in enumerate(cleaned) if ch in ".,"]
+    if separators:
+        last = separators[-1]
+        same_kind = all(cleaned[i] == cleaned[last] for i in separators)
+        if same_kind and (len(separators) > 1 or len(cleaned) - last - 1 == 3):
+            # Only thousands separators
+            cleaned = cleaned.replace(cleaned[last], "")
+        else:
+            cleaned = re.sub(r"[.,]", "", cleaned[:last]) + "." + cleaned[last + 1:]
 
     try:
         return float(cleaned)
@@ -28,53 +43,44 @@ def clean_steam_price(price_string):
 # -----------------------------
 # Fetch live price with retries and parsing
 # -----------------------------
-def fetch_live_price(item, currency=1, max_retries=5, delay=1.0):
+def fetch_live_price(item, currency=1, max_retries=5, delay=1.0, limiter=None, cache=None, client=None):
     """
     Fetches the lowest Steam Market price for an item.
-    Handles CAD/USD conversion and HTTP 429 rate limiting with exponential backoff.
+    Requests go through a pooled PriceClient (the shared default one unless `client`
+    is given), which honors Retry-After and slows the shared limiter on HTTP 429.
+    If a PriceCache is given, a fresh cached price is returned without any request
+    and successfully fetched prices are written back to it.
+    Returns None when no price could be fetched (request failed, non-200 response,
+    invalid body, or no listing price), so callers can fall back instead of using 0.0.
     """
     market_name = item.get("market_hash_name")
     if not market_name:
-        return {"lowest_price": 0.0}
-
-    url = f"https://steamcommunity.com/market/priceoverview/?appid=730&currency={currency}&market_hash_name={market_name}"
-    
-    for attempt in range(1, max_retries + 1):
-        try:
-            response = requests.get(url, timeout=5)
-            if response.status_code == 429:
-                warn(f"HTTP 429 rate limit for {market_name}, retrying ({attempt}/{max_retries})...")
-                time.sleep(delay * (2 ** (attempt - 1)))  # exponential backoff: 1,2,4,8,16
-                continue
-
-            data = response.json()
-            lowest_price_raw = data.get("lowest_price") or data.get("median_price") or "0"
-
-            # Clean price string and convert to float
-            lowest_price = clean_steam_price(lowest_price_raw)
+        return None
 
-            return {"lowest_price": lowest_price}
+    appid = item.get("appid") or DEFAULT_APPID
+    if cache is not None:
+        cached = cache.get(appid, market_name, currency)
+        if cached is not None:
+            return {"lowest_price": cached}
 
-        except Exception as e:
-            warn(f"Attempt {attempt} failed for {market_name}: {e}")
-            time.sleep(delay)
+    client = client or get_default_client()
+    data = client.fetch_overview(
+        market_name, appid=appid, currency=currency,
+        max_retries=max_retries, delay=delay, limiter=limiter,
+    )
+    if data is None:
+        # The client has already said why (retries exhausted, HTTP status, bad JSON)
+        warn(f"No price fetched for {market_name}")
+        return None
 
-    warn(f"Failed to fetch price for {market_name} after {max_retries} retries")
-    return {"lowest_price": 0.0}
+    lowest_price_raw = data.get("lowest_price") or data.get("median_price")
+    if not lowest_price_raw:
+        warn(f"No listing price for {market_name}")
+        return None
 
+    # Clean price string and convert to float
+    lowest_price = clean_steam_price(lowest_price_raw)
 
-# -----------------------------
-# Merge fetched prices into inventory
-# -----------------------------
-def merge_prices_with_inventory(inventory, price_map):
-    """
-    Adds a 'computed_price' field to each item based on price_map.
-    """
-    for item in inventory:
-        market_name = item.get("market_hash_name")
-        if market_name in price_map:
-            item["computed_price"] = price_map[market_name]
-        else:
-            # fallback to recommended price if fetch failed
-            item["computed_price"] = item.get("recommended_price", 0.0)
-    return inventory
+    if cache is not None:
+        cache.put(appid, market_name, currency, lowest_price)
+    return {"lowest_price": lowest_price}
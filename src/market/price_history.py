@@ -0,0 +1,231 @@
+import heapq
+import json
+import mmap
+import os
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.helpers import info, warn
+
+DEFAULT_HISTORY_DIR = ".price_history"
+HISTORY_VERSION = 1
+INDEX_FILE = "index.json"
+NO_ROW = -1
+
+# One append-only file per column, one row per recorded price:
+#   times    float64  unix time the price was recorded
+#   prices   float64
+#   previous int64    row of the same series' previous price (NO_ROW for its first)
+COLUMNS = (("times", "d"), ("prices", "d"), ("previous", "q"))
+
+
+def series_key(market_hash_name: str, currency: int) -> str:
+    return f"{int(currency)}:{market_hash_name}"
+
+
+# -----------------------------
+# Append-only price history
+# -----------------------------
+class PriceHistory:
+    """
+    Price history of every market_hash_name (per currency) in a directory of column files.
+    Each series' rows are chained backwards through `previous`, and the JSON index maps
+    a series to its latest row, so "price at time T" walks back from the newest price
+    instead of scanning the history. A price is only appended when it differs from the
+    series' latest one. Columns are read through mmap, never loaded into Python objects.
+
+    The index is the commit point: it is replaced atomically after the columns are
+    written, and rows past its count (from an interrupted run) are cut off on open.
+    One writer at a time.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_DIR):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.rows = 0
+        self.series: Dict[str, int] = {}  # series key -> latest row
+        self._views: Optional[Dict[str, memoryview]] = None
+        self._maps: List[Tuple[mmap.mmap, memoryview]] = []
+
+        index_path = os.path.join(path, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") != HISTORY_VERSION:
+                raise ValueError(f"Unsupported price history version {index.get('version')} in {path}")
+            self.rows = index["rows"]
+            self.series = index["series"]
+        for column, typecode in COLUMNS:
+            column_path = self._column_path(column)
+            committed = self.rows * array(typecode).itemsize
+            if not os.path.exists(column_path) or os.path.getsize(column_path) < committed:
+                if self.rows:
+                    raise ValueError(f"Price history column {column_path} is missing rows")
+                open(column_path, "wb").close()
+            elif os.path.getsize(column_path) > committed:
+                os.truncate(column_path, committed)
+
+    def _column_path(self, column: str) -> str:
+        return os.path.join(self.path, column + ".bin")
+
+    # -----------------------------
+    # Writing
+    # -----------------------------
+    def record(self, prices: Dict[str, float], currency: int = 1, timestamp: Optional[float] = None) -> int:
+        """Append the prices that changed since their last recorded value. Returns rows appended."""
+        timestamp = time.time() if timestamp is None else timestamp
+        columns = {column: array(typecode) for column, typecode in COLUMNS}
+        latest = {}
+        for name, price in prices.items():
+            key = series_key(name, currency)
+            previous = latest.get(key, self.series.get(key, NO_ROW))
+            if previous != NO_ROW and self._price(previous) == price:
+                continue
+            latest[key] = self.rows + len(columns["times"])
+            columns["times"].append(timestamp)
+            columns["prices"].append(price)
+            columns["previous"].append(previous)
+        if not latest:
+            return 0
+
+        self._release()
+        for column, values in columns.items():
+            with open(self._column_path(column), "ab") as f:
+                values.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+        self.rows += len(columns["times"])
+        self.series.update(latest)
+        self._write_index()
+        return len(columns["times"])
+
+    def _write_index(self) -> None:
+        index_path = os.path.join(self.path, INDEX_FILE)
+        tmp_path = index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": HISTORY_VERSION, "rows": self.rows, "series": self.series}, f)
+        os.replace(tmp_path, index_path)
+
+    # -----------------------------
+    # Column access
+    # -----------------------------
+    def _column(self, column: str) -> memoryview:
+        if self._views is None:
+            self._views = {}
+            for name, typecode in COLUMNS:
+                size = self.rows * array(typecode).itemsize
+                if not size:
+                    self._views[name] = memoryview(array(typecode))
+                    continue
+                with open(self._column_path(name), "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+                base = memoryview(mapped)
+                self._maps.append((mapped, base))
+                self._views[name] = base.cast(typecode)
+        return self._views[column]
+
+    def _price(self, row: int) -> float:
+        return self._column("prices")[row]
+
+    def _release(self) -> None:
+        if self._views is not None:
+            for view in self._views.values():
+                view.release()
+            self._views = None
+        for mapped, base in self._maps:
+            base.release()
+            mapped.close()
+        self._maps = []
+
+    def close(self) -> None:
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -----------------------------
+    # Queries
+    # -----------------------------
+    def row_at(self, market_hash_name: str, currency: int, timestamp: float) -> int:
+        """Row of the latest price recorded at or before `timestamp`, or NO_ROW."""
+        row = self.series.get(series_key(market_hash_name, currency), NO_ROW)
+        times = self._column("times")
+        previous = self._column("previous")
+        while row != NO_ROW and times[row] > timestamp:
+            row = previous[row]
+        return row
+
+    def price_at(self, market_hash_name: str, currency: int = 1, timestamp: Optional[float] = None
+                 ) -> Optional[float]:
+        row = self.row_at(market_hash_name, currency, time.time() if timestamp is None else timestamp)
+        return None if row == NO_ROW else self._price(row)
+
+    def history(self, market_hash_name: str, currency: int = 1) -> List[Tuple[float, float]]:
+        """Every recorded (timestamp, price) of one series, oldest first."""
+        row = self.series.get(series_key(market_hash_name, currency), NO_ROW)
+        times, prices, previous = self._column("times"), self._column("prices"), self._column("previous")
+        points = []
+        while row != NO_ROW:
+            points.append((times[row], prices[row]))
+            row = previous[row]
+        points.reverse()
+        return points
+
+    def value_at(self, holdings: Iterable[Dict[str, Any]], currency: int = 1,
+                 timestamp: Optional[float] = None) -> Tuple[float, int]:
+        """(Value of the holdings at `timestamp` from the prices known then, holdings priced)."""
+        timestamp = time.time() if timestamp is None else timestamp
+        value = 0.0
+        priced = 0
+        for holding in holdings:
+            row = self.row_at(holding.get("market_hash_name") or "", currency, timestamp)
+            if row != NO_ROW:
+                value += self._price(row) * holding.get("quantity", 1)
+                priced += 1
+        return value, priced
+
+    def movers(self, since: float, currency: int = 1, limit: int = 10,
+               quantities: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+        """
+        The `limit` series whose price moved most between `since` and now, biggest first.
+        With `quantities` ({market_hash_name: units}) only those names are considered and
+        moves are ranked by value change (price change x units), else by relative change.
+        Names first priced after `since` have no starting point and are skipped.
+        """
+        prefix = f"{int(currency)}:"
+        names = (quantities.keys() if quantities is not None else
+                 (key[len(prefix):] for key in self.series if key.startswith(prefix)))
+        moves = []
+        for name in names:
+            latest = self.series.get(prefix + name, NO_ROW)
+            then_row = self.row_at(name, currency, since)
+            if then_row == NO_ROW or then_row == latest:
+                continue
+            then, now = self._price(then_row), self._price(latest)
+            units = quantities[name] if quantities is not None else 1
+            moves.append({
+                "market_hash_name": name, "then": then, "now": now, "change": now - then,
+                "percent": (now - then) / then * 100 if then else None, "quantity": units,
+                "value_change": (now - then) * units,
+            })
+        if quantities is not None:
+            return heapq.nlargest(limit, moves, key=lambda move: abs(move["value_change"]))
+        return heapq.nlargest(limit, moves, key=lambda move: abs(move["percent"] or 0.0))
+
+
+def record_prices(items: Iterable[Dict[str, Any]], currency: int = 1, path: str = DEFAULT_HISTORY_DIR) -> int:
+    """Record the priced items of a run in the history; failures only warn."""
+    prices = {item["market_hash_name"]: item["recommended_price"] for item in items
+              if item.get("market_hash_name") and item.get("recommended_price")}
+    try:
+        with PriceHistory(path) as history:
+            appended = history.record(prices, currency)
+    except (OSError, ValueError) as e:
+        warn(f"Could not record price history: {e}")
+        return 0
+    info(f"Price history: {appended} of {len(prices)} prices changed since they were last recorded")
+    return appended
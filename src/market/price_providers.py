@@ -0,0 +1,191 @@
+from typing import Any, Dict, Iterable, Optional
+
+from market.price_cache import DEFAULT_APPID, PriceCache
+from market.price_dump import load_price_index
+from market.rate_limiter import DEFAULT_RATE
+from utils.helpers import warn
+
+
+# -----------------------------
+# Provider interface
+# -----------------------------
+class PriceProvider:
+    """
+    Source of prices for a set of items. Each provider declares what it needs:
+    - requires_network: talks to Steam (imports requests lazily, only when used);
+      only such providers build a rate limiter, so offline providers never sleep
+    get_prices returns {market_hash_name: price} for the names it can price;
+    names it cannot price are left out so callers keep their recommended_price.
+    """
+
+    name = "base"
+    requires_network = False
+
+    def get_prices(self, items: Iterable[Dict[str, Any]], currency: int = 1) -> Dict[str, float]:
+        raise NotImplementedError
+
+    def apply_prices(self, items: Iterable[Dict[str, Any]], currency: int = 1) -> int:
+        """Set recommended_price on items this provider can price. Returns how many were priced."""
+        items = list(items)
+        price_map = self.get_prices(items, currency)
+        priced = 0
+        for item in items:
+            market_name = item.get("market_hash_name")
+            if market_name in price_map:
+                item["recommended_price"] = price_map[market_name]
+                priced += 1
+        return priced
+
+    def close(self) -> None:
+        pass
+
+
+# -----------------------------
+# Offline providers
+# -----------------------------
+class JsonPriceProvider(PriceProvider):
+    """Recommended prices already present in the inventory JSON."""
+
+    name = "recommended (JSON)"
+
+    def get_prices(self, items, currency=1):
+        return {
+            item["market_hash_name"]: item.get("recommended_price", 0.0)
+            for item in items
+            if item.get("market_hash_name")
+        }
+
+
+class CachePriceProvider(PriceProvider):
+    """Prices from the local PriceCache only; misses and stale entries are skipped."""
+
+    name = "cached"
+
+    def __init__(self, cache: Optional[PriceCache] = None):
+        self.cache = cache or PriceCache()
+
+    def get_prices(self, items, currency=1):
+        prices = {}
+        for item in items:
+            name = item.get("market_hash_name")
+            if not name or name in prices:
+                continue
+            price = self.cache.get(item.get("appid") or DEFAULT_APPID, name, currency)
+            if price is not None:
+                prices[name] = price
+        self.cache.report()
+        return prices
+
+    def close(self):
+        self.cache.close()
+
+
+class DumpFilePriceProvider(PriceProvider):
+    """
+    Prices from a bulk market-wide dump (.csv, .jsonl or .json, see price_dump).
+    Only owned names are indexed, and the index is joined against the items in one pass.
+    """
+
+    name = "bulk dump"
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _index(self, items, currency):
+        wanted = {item.get("market_hash_name") for item in items}
+        return load_price_index(self.path, wanted=wanted, currency=currency)
+
+    def get_prices(self, items, currency=1):
+        items = list(items)
+        index = self._index(items, currency)
+        prices = {}
+        for item in items:
+            name = item.get("market_hash_name")
+            price = index.lookup(name, currency) if name else None
+            if price is not None:
+                prices[name] = price
+        return prices
+
+    def apply_prices(self, items, currency=1):
+        items = list(items)
+        return self._index(items, currency).join(items, currency)
+
+
+# -----------------------------
+# Live provider
+# -----------------------------
+class LiveSteamProvider(PriceProvider):
+    """
+    Live Steam Market prices via the concurrent fetch engine, backed by the PriceCache.
+    Items are fetched highest expected value first; with a FetchBudget the refresh
+    stops when it runs out and the rest fall back to their last cached price (any age)
+    or, failing that, their recommended_price. `coverage` reports the fresh share.
+    `session` replaces the pooled HTTP session (e.g. a cassette Recording/ReplaySession)
+    and `base_url` points requests at another server such as the local stand-in.
+    """
+
+    name = "live Steam Market"
+    requires_network = True
+
+    def __init__(self, rate: float = DEFAULT_RATE, cache: Optional[PriceCache] = None,
+                 session=None, base_url: Optional[str] = None, budget=None):
+        self.rate = rate
+        self.cache = cache or PriceCache()
+        self.session = session
+        self.base_url = base_url
+        self.budget = budget
+        self.coverage = None
+
+    def get_prices(self, items, currency=1):
+        # Imported here so offline runs never load requests
+        from market import fetch_engine, fetch_scheduler
+
+        items = list(items)
+        last_known = self.cache.last_known_prices(currency)
+        ordered = fetch_scheduler.prioritize(items, last_known)
+
+        client = None
+        if self.session is not None or self.base_url:
+            from market.price_client import PRICE_OVERVIEW_URL, PriceClient
+            from market.rate_limiter import AdaptiveRateLimiter
+
+            client = PriceClient(AdaptiveRateLimiter(self.rate), pool_size=fetch_engine.DEFAULT_MAX_WORKERS,
+                                 session=self.session, base_url=self.base_url or PRICE_OVERVIEW_URL)
+        try:
+            fresh = fetch_engine.fetch_prices(ordered, currency=currency, rate=self.rate, cache=self.cache,
+                                              client=client, budget=self.budget)
+        finally:
+            if client is not None and self.session is None:
+                client.close()
+            self.cache.report()
+
+        # Only successful fetches are fresh; failed and unfetched names take a fallback
+        prices = dict(fresh)
+        for item in ordered:
+            name = item.get("market_hash_name")
+            if name not in prices:
+                stale_price = last_known.get((int(item.get("appid") or DEFAULT_APPID), name))
+                if stale_price is not None:
+                    prices[name] = stale_price
+
+        self.coverage = fetch_scheduler.ValuationCoverage.measure(
+            items, fresh, prices, budget_exhausted=self.budget is not None and self.budget.stopped
+        )
+        self.coverage.report()
+        return prices
+
+    def close(self):
+        self.cache.close()
+        if self.session is not None:
+            self.session.close()
+
+
+def apply_prices_safely(provider: PriceProvider, items, currency: int = 1) -> int:
+    """Run a provider over items, warning (and pricing nothing) if it fails outright."""
+    try:
+        return provider.apply_prices(items, currency)
+    except Exception as e:
+        warn(f"Failed to get {provider.name} prices: {e}")
+        return 0
+    finally:
+        provider.close()
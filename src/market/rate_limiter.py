@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from utils.metrics import METRICS
+
+DEFAULT_RATE = 0.5        # requests per second shared by all workers
+DEFAULT_BURST = 3         # tokens that may be spent back-to-back
+
+DEFAULT_BACKOFF = 10.0    # global pause after a 429 without Retry-After
+MAX_BACKOFF = 120.0
+WINDOW_SIZE = 20          # recent responses used to judge the 429 rate
+
+
+# -----------------------------
+# Token bucket
+# -----------------------------
+class TokenBucket:
+    """
+    Thread-safe token bucket. Every request (including retries) takes one token,
+    so the global request rate stays at `rate` no matter how many workers run.
+    record_success/record_throttled are no-op hooks that adaptive limiters override.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _blocked_for(self, now: float) -> float:
+        return 0.0
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` are available, then consume them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait_for = self._blocked_for(now)
+                if wait_for <= 0:
+                    self._refill()
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    wait_for = (tokens - self._tokens) / self.rate
+            METRICS.add_time("rate_limit_wait_seconds", wait_for)
+            time.sleep(wait_for)
+
+    def record_success(self) -> None:
+        pass
+
+    def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        pass
+
+
+# -----------------------------
+# Adaptive limiter
+# -----------------------------
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket whose rate follows Steam's feedback (AIMD):
+    - a 429 halves the rate and pauses every worker for Retry-After seconds
+      (or an escalating default backoff when the header is missing)
+    - while no 429 is seen in the last WINDOW_SIZE responses the rate creeps
+      back up by `increase` per success, never above `max_rate`
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: Optional[float] = None,
+                 min_rate: Optional[float] = None, max_rate: Optional[float] = None,
+                 increase: float = 0.02):
+        super().__init__(rate, capacity)
+        self.min_rate = min_rate if min_rate is not None else self.rate / 8
+        self.max_rate = max_rate if max_rate is not None else self.rate
+        self.increase = increase
+        self._recent = deque(maxlen=WINDOW_SIZE)
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+
+    def _blocked_for(self, now: float) -> float:
+        return self._paused_until - now
+
+    def throttle_ratio(self) -> float:
+        with self._lock:
+            return sum(self._recent) / len(self._recent) if self._recent else 0.0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._recent.append(0)
+            self._consecutive_throttles = 0
+            if not any(self._recent):
+                self._refill()
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_throttled(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            self._recent.append(1)
+            self._consecutive_throttles += 1
+            # 429s from requests already in flight during a pause count once
+            if time.monotonic() >= self._paused_until:
+                self._refill()
+                self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after is None:
+                retry_after = min(MAX_BACKOFF, DEFAULT_BACKOFF * 2 ** (self._consecutive_throttles - 1))
+            METRICS.add_time("throttle_pause_seconds", retry_after)
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            # No tokens accrue during the pause, so workers don't burst right after it
+            self._tokens = 0.0
+            self._updated = self._paused_until
@@ -0,0 +1,176 @@
+import json
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from market.cassette import Cassette
+
+PRICE_PATH = "/market/priceoverview/"
+CURRENCY_FORMATS = {1: "${:.2f}", 20: "CDN$ {:.2f}"}
+
+
+# -----------------------------
+# Behaviour
+# -----------------------------
+class StandInConfig:
+    """
+    How the stand-in priceoverview endpoint behaves:
+    - latency / jitter: seconds added to every response (jitter is uniform, seeded)
+    - burst_every / burst_length: of every `burst_every` requests, the first
+      `burst_length` get HTTP 429 (0 disables bursts)
+    - max_per_second: server-side limit; requests above it get HTTP 429 (0 disables)
+    - retry_after: Retry-After seconds sent with each 429 (None sends no header)
+    - prices: {market_hash_name: price}; other names get a stable price from a hash
+    - cassette: serve recorded responses (bodies and statuses) where available
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, burst_every: int = 0,
+                 burst_length: int = 0, max_per_second: float = 0.0, retry_after: Optional[float] = 1.0,
+                 prices: Optional[Dict[str, float]] = None, cassette: Optional[Cassette] = None, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.max_per_second = max_per_second
+        self.retry_after = retry_after
+        self.prices = prices or {}
+        self.cassette = cassette
+        self.seed = seed
+
+
+def stable_price(market_hash_name: str) -> float:
+    """Deterministic pseudo price in 0.03..500 so repeated runs see the same values."""
+    return round(0.03 + (zlib.crc32(market_hash_name.encode("utf-8")) % 50000) / 100, 2)
+
+
+class StandInState:
+    """Request counters and the throttling decision, shared by handler threads."""
+
+    def __init__(self, config: StandInConfig):
+        self.config = config
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(config.seed)
+        self._window = []
+
+    def next_request(self):
+        """Returns (delay seconds, throttle?) for the next request."""
+        config = self.config
+        with self._lock:
+            index = self.requests
+            self.requests += 1
+            delay = config.latency + (self._rng.uniform(0, config.jitter) if config.jitter else 0.0)
+
+            throttle = bool(config.burst_every and index % config.burst_every < config.burst_length)
+            if config.max_per_second:
+                now = time.monotonic()
+                self._window = [t for t in self._window if now - t < 1.0]
+                if len(self._window) >= config.max_per_second:
+                    throttle = True
+                else:
+                    self._window.append(now)
+            if throttle:
+                self.throttled += 1
+            return delay, throttle
+
+
+# -----------------------------
+# HTTP server
+# -----------------------------
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "StandInMarket/1.0"
+
+    def do_GET(self):
+        state: StandInState = self.server.state
+        url = urlparse(self.path)
+        if url.path != PRICE_PATH:
+            self._send(404, {"success": False})
+            return
+
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        delay, throttle = state.next_request()
+        if delay:
+            time.sleep(delay)
+
+        if throttle:
+            headers = {}
+            if state.config.retry_after is not None:
+                headers["Retry-After"] = f"{state.config.retry_after:g}"
+            self._send(429, None, headers)
+            return
+
+        if state.config.cassette is not None:
+            recorded = state.config.cassette.next_response(query)
+            if recorded is not None:
+                self._send_raw(recorded["status"], recorded.get("body", "").encode("utf-8"),
+                               recorded.get("headers", {}))
+                return
+
+        name = query.get("market_hash_name", "")
+        price = state.config.prices.get(name, stable_price(name))
+        price_format = CURRENCY_FORMATS.get(int(query.get("currency", 1) or 1), "${:.2f}")
+        self._send(200, {
+            "success": True,
+            "lowest_price": price_format.format(price),
+            "volume": str(zlib.crc32(name.encode("utf-8")) % 1000),
+            "median_price": price_format.format(price),
+        })
+
+    def _send(self, status, payload, headers=None):
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self._send_raw(status, body, {"Content-Type": "application/json", **(headers or {})})
+
+    def _send_raw(self, status, body, headers):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer:
+    """
+    Local stand-in for the Steam Market priceoverview endpoint, for benchmarking
+    fetch concurrency and backoff with no network. Runs on a background thread:
+
+        with StandInServer(StandInConfig(latency=0.05, burst_every=20, burst_length=3)) as server:
+            client = PriceClient(base_url=server.url)
+    """
+
+    def __init__(self, config: Optional[StandInConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.state = StandInState(config or StandInConfig())
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self.state
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{PRICE_PATH}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
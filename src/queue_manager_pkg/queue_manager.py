@@ -1,45 +1,70 @@
+import csv
+import io
 import json
+import os
 import urllib.parse
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+from inventory import categories
 from utils.helpers import info, warn
+from utils.metrics import METRICS
 
 STEAM_SELL_URL = "https://steamcommunity.com/market/sellitem"
+EXPORT_CHUNK_SIZE = 1000  # entries per write
+CSV_FIELDS = ("market_hash_name", "appid", "contextid", "assetid", "assetids", "quantity",
+              "recommended_price", "category", "sell_url")
 
 CATEGORY_PRICE_RULES = {
-    "weapon skin": {"undercut": 0.02},
-    "sticker": {"undercut": 0.01},
-    "case": {"undercut": 0.00},
-    "key": {"undercut": 0.01},
-    "gloves": {"undercut": 0.02},
-    "knife": {"undercut": 0.02},
+    categories.WEAPON_SKIN: {"undercut": 0.02},
+    categories.STICKER: {"undercut": 0.01},
+    categories.CASE: {"undercut": 0.00},
+    categories.KEY: {"undercut": 0.01},
+    categories.GLOVES: {"undercut": 0.02},
+    categories.KNIFE: {"undercut": 0.02},
 }
 
-def build_listing_queue(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    queue = []
+def build_listing_queue(items: Iterable[Dict[str, Any]],
+                        categories_filter: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """The whole queue as a list. Prefer iter_listing_queue + export_queue for large inventories."""
+    with METRICS.stage("build_listing_queue"):
+        queue = list(iter_listing_queue(items, categories_filter))
+    METRICS.incr("queue_entries", len(queue))
+    info(f"Built listing queue with {len(queue)} items")
+    return queue
+
+def iter_listing_queue(items: Iterable[Dict[str, Any]],
+                       categories_filter: Optional[Iterable[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one queue entry per listable item, lazily. The price is computed once and
+    used for both the entry and its sell URL. With `categories_filter`, only items in
+    those categories are yielded.
+    """
+    wanted = set(categories_filter) if categories_filter is not None else None
     for item in items:
         if not item.get("marketable", True):
             continue
+        category = item.get("category") or categories.classify_type(item.get("type", ""))
+        if wanted is not None and category not in wanted:
+            continue
         price = calculate_recommended_price(item)
         if price is None:
             continue
-        entry = {
+        yield {
             "market_hash_name": item.get("market_hash_name"),
             "appid": item.get("appid"),
             "contextid": item.get("contextid", "2"),
             "assetid": item.get("assetid"),
+            "assetids": item.get("assetids", [item.get("assetid")]),
+            "quantity": item.get("quantity", 1),
             "recommended_price": price,
-            "category": item.get("category"),
-            "sell_url": build_sell_url(item),
+            "category": category,
+            "sell_url": build_sell_url(item, price),
         }
-        queue.append(entry)
-    info(f"Built listing queue with {len(queue)} items")
-    return queue
 
 def calculate_recommended_price(item: Dict[str, Any]) -> Optional[float]:
     if item.get("recommended_price") is not None:
         return item["recommended_price"]
     lowest = item.get("lowest_price")
-    category = item.get("category", "other").lower()
+    category = item.get("category") or categories.classify_type(item.get("type", ""))
     if lowest is None:
         return None
     rule = CATEGORY_PRICE_RULES.get(category, {"undercut": 0.01})
@@ -50,21 +75,125 @@ def calculate_recommended_price(item: Dict[str, Any]) -> Optional[float]:
         return None
     return recommended
 
-def build_sell_url(item: Dict[str, Any]) -> str:
+def build_sell_url(item: Dict[str, Any], price: Optional[float] = None) -> str:
+    """Sell page URL at `price` (default: the item's calculated recommended price)."""
     name_encoded = urllib.parse.quote(item.get("market_hash_name", "UNKNOWN"))
     appid = item.get("appid")
     contextid = item.get("contextid", "2")
     assetid = item.get("assetid")
-    price = item.get("recommended_price", 0)
+    if price is None:
+        price = calculate_recommended_price(item) or 0
     price_cents = int(round(price * 100))
     return f"{STEAM_SELL_URL}?appid={appid}&contextid={contextid}&assetid={assetid}&price={price_cents}&market_hash_name={name_encoded}"
 
-def export_queue(queue: List[Dict[str, Any]], filepath: Optional[str] = None) -> None:
+# -----------------------------
+# Streaming export
+# -----------------------------
+def export_queue(queue: Iterable[Dict[str, Any]], filepath: Optional[str] = None,
+                 chunk_size: int = EXPORT_CHUNK_SIZE) -> int:
+    """
+    Stream queue entries to `filepath` in chunks of `chunk_size` entries.
+    The format follows the extension: .jsonl (JSON Lines), .csv, otherwise a JSON array.
+    `queue` may be a generator; it is consumed once. Returns the number of entries written.
+    """
     if not filepath:
-        return
+        return 0
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(queue, f, indent=4)
-        info(f"Queue exported to {filepath}")
+        with METRICS.stage("export_queue"), open(filepath, "w", encoding="utf-8", newline="") as f:
+            writer = _QueueWriter(f, _export_format(filepath), chunk_size)
+            for entry in queue:
+                writer.write(entry)
+            writer.close()
+        info(f"Queue exported to {filepath} ({writer.count} entries)")
+        return writer.count
     except Exception as e:
         warn(f"Failed to export queue: {e}")
+        return 0
+
+def export_queue_by_category(queue: Iterable[Dict[str, Any]], filepath: str,
+                             chunk_size: int = EXPORT_CHUNK_SIZE) -> Dict[str, int]:
+    """
+    Shard the queue into one file per category in a single pass, e.g.
+    queue.jsonl -> queue.case.jsonl, queue.weapon_skin.jsonl, ...
+    Returns {category: entries written}, or {} if the export failed.
+    """
+    base, extension = os.path.splitext(filepath)
+    export_format = _export_format(filepath)
+    files, writers = [], {}
+    try:
+        with METRICS.stage("export_queue"):
+            for entry in queue:
+                category = entry.get("category") or categories.OTHER
+                writer = writers.get(category)
+                if writer is None:
+                    shard_path = f"{base}.{category.replace(' ', '_')}{extension}"
+                    f = open(shard_path, "w", encoding="utf-8", newline="")
+                    files.append(f)
+                    writer = writers[category] = _QueueWriter(f, export_format, chunk_size)
+                writer.write(entry)
+            for writer in writers.values():
+                writer.close()
+    except Exception as e:
+        warn(f"Failed to export queue shards: {e}")
+        return {}
+    finally:
+        for f in files:
+            f.close()
+
+    counts = {category: writer.count for category, writer in writers.items()}
+    info(f"Queue exported to {len(counts)} category files ({sum(counts.values())} entries)")
+    return counts
+
+def _export_format(filepath: str) -> str:
+    if filepath.endswith(".jsonl"):
+        return "jsonl"
+    if filepath.endswith(".csv"):
+        return "csv"
+    return "json"
+
+class _QueueWriter:
+    """Buffers formatted entries and writes them `chunk_size` at a time."""
+
+    def __init__(self, f: TextIO, export_format: str, chunk_size: int):
+        self.f = f
+        self.format = export_format
+        self.chunk_size = max(1, chunk_size)
+        self.count = 0
+        self._chunk: List[str] = []
+        if export_format == "csv":
+            self._csv_buffer = io.StringIO()
+            self._csv = csv.writer(self._csv_buffer)
+            self._csv.writerow(CSV_FIELDS)
+            self._chunk.append(self._take_csv())
+        elif export_format == "json":
+            self._chunk.append("[\n")
+
+    def _take_csv(self) -> str:
+        text = self._csv_buffer.getvalue()
+        self._csv_buffer.seek(0)
+        self._csv_buffer.truncate()
+        return text
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        if self.format == "csv":
+            row = [entry.get(field) for field in CSV_FIELDS]
+            row[CSV_FIELDS.index("assetids")] = ";".join(str(a) for a in entry.get("assetids") or [])
+            self._csv.writerow(row)
+            self._chunk.append(self._take_csv())
+        elif self.format == "jsonl":
+            self._chunk.append(json.dumps(entry) + "\n")
+        else:
+            self._chunk.append(("    " if self.count == 0 else ",\n    ") + json.dumps(entry))
+        self.count += 1
+        if len(self._chunk) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._chunk:
+            self.f.write("".join(self._chunk))
+            self._chunk.clear()
+
+    def close(self) -> None:
+        if self.format == "json":
+            self._chunk.append("\n]\n" if self.count else "]\n")
+        self.flush()
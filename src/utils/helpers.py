@@ -1,42 +1,203 @@
-# -----------------------------
-# Logging helpers
-# -----------------------------
-def info(message):
-    """Prints an informational message."""
-    print(f"[INFO] {message}")
-
-def warn(message):
-    """Prints a warning message."""
-    print(f"[WARN] {message}")
-
-# -----------------------------
-# Prompt helpers
-# -----------------------------
-def prompt_optional_float(prompt_text):
-    """
-    Prompts the user for a float. Empty input returns None.
-    Re-prompts if invalid input.
-    """
-    while True:
-        value = input(prompt_text).strip()
-        if value == "":
-            return None
-        try:
-            return float(value)
-        except ValueError:
-            warn("Invalid number, please enter a valid float or leave blank.")
-
-def prompt_sort_key(allow_game=False):
-    """
-    Prompts the user for a sort key.
-    Returns 'price' or 'name' (and 'game' if allow_game=True).
-    Defaults to 'price'.
-    """
-    valid_keys = ["price", "name"]
-    if allow_game:
-        valid_keys.append("game")
-
-    key = input(f"Sort by ({'/'.join(valid_keys)}) [price]: ").strip().lower()
-    if key not in valid_keys:
-        return "price"
-    return key
+import atexit
+import os
+import sys
+import threading
+import time
+
+# -----------------------------
+# Log levels
+# -----------------------------
+DEBUG = 10
+INFO = 20
+WARN = 30
+
+# quiet: warnings only, normal: info + warnings, verbose: also per-item debug lines
+VERBOSITY = {"quiet": WARN, "normal": INFO, "verbose": DEBUG}
+LOG_LEVEL_ENV = "INVENTORY_LOG_LEVEL"
+
+# Log lines are written in one batch once this many are pending or the interval passes
+BUFFER_LINES = 256
+FLUSH_INTERVAL = 0.5
+
+_log_level = VERBOSITY.get(os.environ.get(LOG_LEVEL_ENV, "normal").strip().lower(), INFO)
+_buffer = []
+_buffer_lock = threading.RLock()
+_last_flush = time.monotonic()
+_progress_line_open = False
+_stream = None  # None: sys.stdout at write time
+
+
+def set_log_level(level):
+    """Set the log level from DEBUG/INFO/WARN or a VERBOSITY name ('quiet', 'normal', 'verbose')."""
+    global _log_level
+    if isinstance(level, str):
+        if level.lower() not in VERBOSITY:
+            raise ValueError(f"Unknown log level: {level}")
+        level = VERBOSITY[level.lower()]
+    _log_level = level
+
+def get_log_level():
+    return _log_level
+
+def is_enabled(level):
+    return level >= _log_level
+
+def set_output_stream(stream):
+    """Send log, echo and progress output to `stream` (e.g. sys.stderr); None restores stdout."""
+    global _stream
+    flush_logs()
+    _stream = stream
+
+def _out():
+    return _stream or sys.stdout
+
+# -----------------------------
+# Buffered output
+# -----------------------------
+def _write(line, urgent=False):
+    with _buffer_lock:
+        _buffer.append(line)
+        now = time.monotonic()
+        if urgent or len(_buffer) >= BUFFER_LINES or now - _last_flush >= FLUSH_INTERVAL:
+            _flush_locked(now)
+
+def _flush_locked(now=None):
+    global _last_flush, _progress_line_open
+    out = _out()
+    if _progress_line_open:
+        out.write("\n")
+        _progress_line_open = False
+    if _buffer:
+        out.write("\n".join(_buffer) + "\n")
+        _buffer.clear()
+    out.flush()
+    _last_flush = now if now is not None else time.monotonic()
+
+def flush_logs():
+    """Write out any buffered log lines. Called before prompts and at exit."""
+    with _buffer_lock:
+        _flush_locked()
+
+atexit.register(flush_logs)
+
+# -----------------------------
+# Logging helpers
+# -----------------------------
+def debug(message):
+    """Buffers a detail message, shown only in verbose mode."""
+    if is_enabled(DEBUG):
+        _write(f"[DEBUG] {message}")
+
+def info(message):
+    """Buffers an informational message."""
+    if is_enabled(INFO):
+        _write(f"[INFO] {message}")
+
+def warn(message):
+    """Prints a warning message (flushing anything buffered before it)."""
+    if is_enabled(WARN):
+        _write(f"[WARN] {message}", urgent=True)
+
+def echo(message=""):
+    """Buffers plain program output (menus, summaries). Shown at every log level."""
+    _write(str(message))
+
+def wait(seconds):
+    """Sleep between interactive steps, flushing buffered output first so it shows meanwhile."""
+    flush_logs()
+    if seconds and seconds > 0:
+        time.sleep(seconds)
+
+# -----------------------------
+# Progress aggregation
+# -----------------------------
+class Progress:
+    """
+    One progress line for a long batch instead of one log line per item.
+    On a terminal the bar is redrawn in place at most every `interval` seconds;
+    otherwise an info line is logged every 10%. Per-item details passed to
+    update() are logged with debug(), so they only show in verbose mode.
+    """
+
+    def __init__(self, label, total, interval=0.2):
+        self.label = label
+        self.total = max(0, total)
+        self.done = 0
+        self.interval = interval
+        self._last_render = 0.0
+        self._drawn = 0
+        self._next_percent = 10
+        self._live = _out().isatty() and _log_level == INFO
+
+    def update(self, count=1, detail=None):
+        self.done += count
+        if detail:
+            debug(f"[{self.done}/{self.total}] {detail}")
+
+        if self._live:
+            now = time.monotonic()
+            if self.done >= self.total or now - self._last_render >= self.interval:
+                self._last_render = now
+                self._draw()
+        elif self.total and self.done * 100 >= self._next_percent * self.total:
+            info(f"{self.label}: {self.done}/{self.total} ({self.done * 100 // self.total}%)")
+            self._next_percent = (self.done * 100 // self.total) // 10 * 10 + 10
+
+    def _draw(self, width=30):
+        global _progress_line_open
+        filled = width * self.done // self.total if self.total else width
+        bar = "#" * filled + "-" * (width - filled)
+        self._drawn = self.done
+        with _buffer_lock:
+            _flush_locked()
+            _out().write(f"\r[INFO] {self.label} [{bar}] {self.done}/{self.total}")
+            _out().flush()
+            _progress_line_open = True
+
+    def close(self):
+        if self._live and self.done != self._drawn:
+            self._draw()
+        flush_logs()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# -----------------------------
+# Prompt helpers
+# -----------------------------
+def ask(prompt_text):
+    """input() that flushes buffered output first so the prompt appears in order."""
+    flush_logs()
+    return input(prompt_text)
+
+def prompt_optional_float(prompt_text):
+    """
+    Prompts the user for a float. Empty input returns None.
+    Re-prompts if invalid input.
+    """
+    while True:
+        value = ask(prompt_text).strip()
+        if value == "":
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            warn("Invalid number, please enter a valid float or leave blank.")
+
+def prompt_sort_key(allow_game=False):
+    """
+    Prompts the user for a sort key.
+    Returns 'price' or 'name' (and 'game' if allow_game=True).
+    Defaults to 'price'.
+    """
+    valid_keys = ["price", "name"]
+    if allow_game:
+        valid_keys.append("game")
+
+    key = ask(f"Sort by ({'/'.join(valid_keys)}) [price]: ").strip().lower()
+    if key not in valid_keys:
+        return "price"
+    return key
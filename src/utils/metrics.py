@@ -0,0 +1,112 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+from utils.helpers import echo
+
+METRIC_PREFIX = "steam_inventory"
+
+
+# -----------------------------
+# Metrics registry
+# -----------------------------
+class Metrics:
+    """
+    Thread-safe run metrics:
+    - stages: wall time per pipeline stage (load, pricing, filtering, ...)
+    - counters: event counts (HTTP requests, retries, cache hits, ...)
+    - durations: accumulated seconds that are not stages (backoff, rate-limit waits, ...)
+    - http_status: histogram of HTTP status codes
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages: Dict[str, float] = {}
+            self.counters: Dict[str, int] = {}
+            self.durations: Dict[str, float] = {}
+            self.http_status: Dict[int, int] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self.counters.get(name, 0)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    def record_status(self, status: int) -> None:
+        with self._lock:
+            self.http_status[status] = self.http_status.get(status, 0) + 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "stages_seconds": dict(self.stages),
+                "counters": dict(self.counters),
+                "durations_seconds": dict(self.durations),
+                "http_status": {str(k): v for k, v in sorted(self.http_status.items())},
+            }
+
+    # -----------------------------
+    # Reporting
+    # -----------------------------
+    def print_summary(self) -> None:
+        data = self.as_dict()
+        lines = ["\n=== Run Metrics ==="]
+        lines += [f"{name:<24} {seconds:9.3f}s" for name, seconds in data["stages_seconds"].items()]
+        lines += [f"{name:<24} {seconds:9.3f}s" for name, seconds in sorted(data["durations_seconds"].items())]
+        lines += [f"{name:<24} {count:9d}" for name, count in sorted(data["counters"].items())]
+        if data["http_status"]:
+            statuses = ", ".join(f"{code}: {count}" for code, count in data["http_status"].items())
+            lines.append(f"{'http_status':<24} {statuses}")
+        echo("\n".join(lines))
+
+    def to_prometheus(self) -> str:
+        data = self.as_dict()
+        lines = [
+            f"# TYPE {METRIC_PREFIX}_stage_seconds gauge",
+            *(f'{METRIC_PREFIX}_stage_seconds{{stage="{name}"}} {value:.6f}'
+              for name, value in data["stages_seconds"].items()),
+            f"# TYPE {METRIC_PREFIX}_duration_seconds counter",
+            *(f'{METRIC_PREFIX}_duration_seconds{{kind="{name}"}} {value:.6f}'
+              for name, value in sorted(data["durations_seconds"].items())),
+            f"# TYPE {METRIC_PREFIX}_events_total counter",
+            *(f'{METRIC_PREFIX}_events_total{{event="{name}"}} {value}'
+              for name, value in sorted(data["counters"].items())),
+            f"# TYPE {METRIC_PREFIX}_http_responses_total counter",
+            *(f'{METRIC_PREFIX}_http_responses_total{{code="{code}"}} {value}'
+              for code, value in data["http_status"].items()),
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write JSON, or Prometheus text format when the path ends in .prom or .txt."""
+        with open(path, "w", encoding="utf-8") as f:
+            if path.endswith((".prom", ".txt")):
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.as_dict(), f, indent=2)
+
+
+# Process-wide registry that main, market and queue code report into
+METRICS = Metrics()
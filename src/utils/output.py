@@ -0,0 +1,78 @@
+import csv
+from typing import Any, Dict, List
+
+from market.exchange_rates import format_money
+from utils.helpers import ask, echo, flush_logs
+
+DEFAULT_PAGE_SIZE = 25
+RESULT_FIELDS = ("market_hash_name", "category", "quantity", "recommended_price")
+
+
+# -----------------------------
+# Formatting
+# -----------------------------
+def format_item_line(item: Dict[str, Any]) -> str:
+    line = f"{item['market_hash_name']} x{item.get('quantity', 1)} - ${item.get('recommended_price', 0):.2f}"
+    converted = item.get("converted_prices")
+    if converted:
+        line += "".join(f" / {format_money(price, code)}" for code, price in converted.items())
+    return line
+
+
+def results_path_for(source_path: str) -> str:
+    """Full result listings are written next to the export they came from."""
+    return source_path + ".results.csv"
+
+
+# -----------------------------
+# Bulk file output
+# -----------------------------
+def write_results(items: List[Dict[str, Any]], path: str) -> None:
+    """
+    Write every result row in one pass: CSV for .csv paths, the terminal line format otherwise.
+    Prices converted to other currencies get one extra CSV column each (price_CAD, ...).
+    """
+    converted_codes = list(items[0].get("converted_prices") or {}) if items else []
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            writer = csv.writer(f)
+            writer.writerow(RESULT_FIELDS + tuple(f"price_{code}" for code in converted_codes))
+            writer.writerows(
+                (item.get("market_hash_name"), item.get("category"), item.get("quantity", 1),
+                 f"{item.get('recommended_price', 0) or 0:.2f}",
+                 *(f"{item['converted_prices'][code]:.2f}" for code in converted_codes))
+                for item in items
+            )
+        else:
+            f.write("\n".join(format_item_line(item) for item in items) + "\n")
+
+
+# -----------------------------
+# Paged terminal output
+# -----------------------------
+def page_results(items: List[Dict[str, Any]], page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    """
+    Print results a page at a time (top-N first, in the order given).
+    After each page the user can show the next page, the rest, or stop.
+    Returns how many rows were shown.
+    """
+    total = len(items)
+    page_size = max(1, page_size)
+    shown = 0
+    while shown < total:
+        end = min(total, shown + page_size)
+        echo("\n".join(format_item_line(item) for item in items[shown:end]))
+        shown = end
+        if shown >= total:
+            break
+
+        try:
+            answer = ask(f"-- {shown}/{total} shown. [Enter] next page, [a]ll, [q]uit: ").strip().lower()
+        except EOFError:
+            break
+        if answer == "q":
+            break
+        if answer == "a":
+            page_size = total
+    flush_logs()
+    return shown
@@ -1,12 +1,147 @@
+import hashlib
+import json
+import os
+import threading
+import time
 import webbrowser
 import platform
 import subprocess
 import urllib.parse
-from typing import List, Dict, Any
-from utils.helpers import info, warn, wait
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+from filtering.stats import RunningStats, item_price, top_n
+from utils.helpers import ask, echo, info, warn, wait
 
 DEFAULT_PAUSE_SECONDS = 1
+PREFLIGHT_TOP = 3
 STEAM_SELL_URL = "https://steamcommunity.com/market/sellitem"
+CHECKPOINT_PREFIX = "workflow_"  # + a digest of the queue's assetids + ".jsonl"
+DEFAULT_BATCH_SIZE = 10
+DISPATCH_WORKERS = 4  # URLs opened at once in batch mode
+SYNC_EVERY = 25  # checkpoint lines between fsyncs
+
+
+# -----------------------------
+# Checkpoint
+# -----------------------------
+def item_keys(item: Dict[str, Any]) -> List[str]:
+    """
+    The assets a queue entry stands for: every assetid of a holding (entry["assetids"]),
+    else its single assetid, else its name.
+    """
+    assetids = [str(assetid) for assetid in item.get("assetids") or [item.get("assetid")] if assetid is not None]
+    return assetids or [f"name:{item.get('market_hash_name')}"]
+
+
+def checkpoint_path_for(queue: List[Dict[str, Any]], directory: str = ".") -> str:
+    """
+    One checkpoint file per queue, named after a digest of its assets, so decisions made
+    on one queue never skip items of another; re-running the same queue resumes it.
+    """
+    digest = hashlib.sha1()
+    for key in sorted(key for item in queue for key in item_keys(item)):
+        digest.update(key.encode("utf-8") + b"\n")
+    return os.path.join(directory, f"{CHECKPOINT_PREFIX}{digest.hexdigest()[:16]}.jsonl")
+
+
+class WorkflowCheckpoint:
+    """
+    Append-only record of the queue items already handled, one JSON line each:
+        {"keys": ["<assetid>", ...], "action": "opened" | "skipped", "at": <unix time>}
+    Reopening the same file resumes the workflow where it stopped. A line cut short
+    by a crash is ignored. Safe to mark from dispatcher threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    for key in entry["keys"]:
+                        self.done[key] = entry["action"]
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.done
+
+    def __len__(self) -> int:
+        return len(self.done)
+
+    def handled(self, item: Dict[str, Any]) -> bool:
+        """True once every asset of the entry has been opened or skipped."""
+        return all(key in self.done for key in item_keys(item))
+
+    def mark(self, item: Dict[str, Any], action: str) -> None:
+        keys = item_keys(item)
+        with self._lock:
+            for key in keys:
+                self.done[key] = action
+            self._file.write(json.dumps({"keys": keys, "action": action, "at": round(time.time(), 3)}) + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= SYNC_EVERY:
+                self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._sync_locked()
+                self._file.close()
+
+
+# -----------------------------
+# Non-blocking URL dispatch
+# -----------------------------
+class UrlDispatcher:
+    """
+    Opens URLs on a few background threads so the operator can review the next batch
+    while the browser (or explorer.exe) is still starting up for the previous one.
+    """
+
+    def __init__(self, open_url: Optional[Callable[[str], None]] = None, workers: int = DISPATCH_WORKERS):
+        self.open_url = open_url or open_url_in_browser
+        self.opened = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="open-url")
+        self._futures: List[Future] = []
+
+    def dispatch(self, url: str, on_opened: Optional[Callable[[], None]] = None) -> None:
+        self._futures.append(self._pool.submit(self._open, url, on_opened))
+
+    def _open(self, url: str, on_opened: Optional[Callable[[], None]]) -> None:
+        try:
+            self.open_url(url)
+        except Exception as e:
+            warn(f"Could not open {url}: {e}")
+            with self._lock:
+                self.failed += 1
+            return
+        with self._lock:
+            self.opened += 1
+        if on_opened is not None:
+            on_opened()
+
+    def drain(self) -> None:
+        """Wait for every dispatched URL."""
+        for future in self._futures:
+            future.result()
+        self._futures = []
+
+    def close(self) -> None:
+        self.drain()
+        self._pool.shutdown()
 
 
 # -----------------------------
@@ -18,17 +153,25 @@ def show_preflight_summary(queue: List[Dict[str, Any]]) -> bool:
     Returns True if user confirms
     """
     total = len(queue)
-    prices = [item.get("recommended_price", 0) for item in queue if item.get("recommended_price")]
+    price_stats = RunningStats()
+    for item in queue:
+        if item.get("recommended_price"):
+            price_stats.add(item["recommended_price"])
 
-    print("\n=== Listing Summary ===")
-    print(f"Total items: {total}")
+    echo("\n=== Listing Summary ===")
+    echo(f"Total items: {total}")
 
-    if prices:
-        print(f"Lowest price: ${min(prices):.2f}")
-        print(f"Highest price: ${max(prices):.2f}")
-        print(f"Average price: ${sum(prices)/len(prices):.2f}")
-    
-    response = input("Proceed with assisted workflow? [y/n]: ").strip().lower()
+    if price_stats.count:
+        echo(f"Lowest price: ${price_stats.min:.2f}")
+        echo(f"Highest price: ${price_stats.max:.2f}")
+        echo(f"Average price: ${price_stats.mean:.2f}")
+        echo(f"Median price: ${price_stats.percentile(50):.2f}")
+        echo("Most expensive: " + ", ".join(
+            f"{item.get('market_hash_name')} (${item_price(item):.2f})"
+            for item in top_n(queue, PREFLIGHT_TOP, key=item_price)
+        ))
+
+    response = ask("Proceed with assisted workflow? [y/n]: ").strip().lower()
     return response == "y"
 
 
@@ -38,22 +181,57 @@ def show_preflight_summary(queue: List[Dict[str, Any]]) -> bool:
 def run_assisted_workflow(
         queue: List[Dict[str, Any]],
         dry_run: bool = False,
-        pause_seconds: int = DEFAULT_PAUSE_SECONDS
+        pause_seconds: int = DEFAULT_PAUSE_SECONDS,
+        batch_size: int = 1,
+        resume: bool = True,
+        checkpoint_path: Optional[str] = None,
 ) -> None:
     """
     Walk through each inventory item in the queue, optionally opening the Steam Market sell page
     using the market_hash_name, category, and appid from JSON data.
+    With `resume`, every decision is checkpointed (to `checkpoint_path`, by default a file
+    named after this queue's assets, see checkpoint_path_for), so a later run on the same
+    queue skips what was already opened or skipped. With batch_size > 1 the items are
+    reviewed a batch at a time and the approved URLs are opened in the background.
+    Dry runs neither read nor write the checkpoint.
     """
 
     total = len(queue)
-    opened = 0
-    skipped = 0
+    checkpoint = None
+    pending = queue
+    if resume and not dry_run:
+        checkpoint_path = checkpoint_path or checkpoint_path_for(queue)
+        checkpoint = WorkflowCheckpoint(checkpoint_path)
+        pending = [item for item in queue if not checkpoint.handled(item)]
+        if len(pending) < total:
+            info(f"Resuming from {checkpoint_path}: {total - len(pending)} of {total} items already processed")
 
-    info(f"Starting assisted workflow ({total} items)")
+    info(f"Starting assisted workflow ({len(pending)} items)")
     if dry_run:
         warn("Dry run mode enabled - no browser tabs will be opened.")
 
-    for index, item in enumerate(queue, start=1):
+    try:
+        if batch_size > 1:
+            opened, skipped = _run_batches(pending, total - len(pending), total, dry_run, batch_size, checkpoint)
+        else:
+            opened, skipped = _run_one_by_one(pending, total - len(pending), total, dry_run, pause_seconds,
+                                              checkpoint)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    info("Workflow complete")
+    info(f"Opened: {opened}")
+    info(f"Skipped: {skipped}")
+    info(f"Remaining: {len(pending) - opened - skipped}")
+    if checkpoint is not None and len(pending) == opened + skipped:
+        info(f"Queue finished; delete {checkpoint_path} to start over")
+
+
+def _run_one_by_one(pending, done_before, total, dry_run, pause_seconds, checkpoint):
+    opened = 0
+    skipped = 0
+    for index, item in enumerate(pending, start=done_before + 1):
         display_progress(index, total, item)
         user_action = prompt_user(item)
         if user_action == "q":
@@ -61,6 +239,8 @@ def run_assisted_workflow(
             break
         if user_action == "n":
             skipped += 1
+            if checkpoint is not None:
+                checkpoint.mark(item, "skipped")
             continue
 
         sell_url = generate_sell_url(item)
@@ -68,20 +248,57 @@ def run_assisted_workflow(
         if dry_run:
             info(f"[Dry Run] URL: {sell_url}")
             # Print clickable link for supported terminals
-            print(f"\033]8;;{sell_url}\a[Dry Run: {item.get('market_hash_name')} | "
-                  f"{item.get('category', 'unknown')} | ${item.get('recommended_price',0):.2f}]\033]8;;\a")
+            echo(f"\033]8;;{sell_url}\a[Dry Run: {item.get('market_hash_name')} | "
+                 f"{item.get('category', 'unknown')} | ${item.get('recommended_price',0):.2f}]\033]8;;\a")
             wait(pause_seconds)
         else:
             info(f"Opening sell page for: {item.get('market_hash_name')}")
             open_url_in_browser(sell_url)
+            if checkpoint is not None:
+                checkpoint.mark(item, "opened")
             wait(pause_seconds)
 
         opened += 1
+    return opened, skipped
 
-    info("Workflow complete")
-    info(f"Opened: {opened}")
-    info(f"Skipped: {skipped}")
-    info(f"Remaining: {total - opened - skipped}")
+
+def _run_batches(pending, done_before, total, dry_run, batch_size, checkpoint):
+    """Review `batch_size` items per prompt; approved sell pages open without blocking the next prompt."""
+    opened = 0
+    skipped = 0
+    dispatcher = None if dry_run else UrlDispatcher()
+    try:
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            echo(f"\n-- Items {done_before + start + 1}-{done_before + start + len(batch)} of {total} --")
+            for number, item in enumerate(batch, start=1):
+                echo(f"{number:>3}) {item.get('market_hash_name', 'UNKNOWN')} | {item.get('category', 'unknown')}"
+                     f" - ${item.get('recommended_price', 0.0):.2f}")
+            selection = prompt_batch(len(batch))
+            if selection is None:
+                warn("Workflow aborted by user")
+                break
+
+            for number, item in enumerate(batch, start=1):
+                if number not in selection:
+                    skipped += 1
+                    if checkpoint is not None:
+                        checkpoint.mark(item, "skipped")
+                    continue
+                sell_url = generate_sell_url(item)
+                opened += 1
+                if dry_run:
+                    info(f"[Dry Run] URL: {sell_url}")
+                    continue
+                on_opened = (lambda item=item: checkpoint.mark(item, "opened")) if checkpoint is not None else None
+                dispatcher.dispatch(sell_url, on_opened)
+            if selection and not dry_run:
+                info(f"Opening {len(selection)} sell pages in the background")
+    finally:
+        if dispatcher is not None:
+            dispatcher.close()
+            opened -= dispatcher.failed
+    return opened, skipped
 
 
 # -----------------------------
@@ -94,7 +311,7 @@ def display_progress(index: int, total: int, item: Dict[str, Any]) -> None:
     name = item.get("market_hash_name", "UNKNOWN")
     price = item.get("recommended_price", 0.0)
     category = item.get("category", "unknown")
-    print(f"\n[{index}/{total}] {name} | {category} - ${price:.2f}")
+    echo(f"\n[{index}/{total}] {name} | {category} - ${price:.2f}")
 
 
 def prompt_user(item: Dict[str, Any]) -> str:
@@ -105,7 +322,7 @@ def prompt_user(item: Dict[str, Any]) -> str:
     name = item.get("market_hash_name", "UNKNOWN")
 
     while True:
-        choice = input(
+        choice = ask(
             f"Process '{name}'? [y = open, n = skip, q = quit]: "
         ).strip().lower()
 
@@ -115,6 +332,39 @@ def prompt_user(item: Dict[str, Any]) -> str:
         warn("Invalid input. Please enter 'y', 'n', or 'q'.")
 
 
+def prompt_batch(count: int) -> Optional[Set[int]]:
+    """
+    Ask which items of a batch to open: 'a' all, 'n' none, a selection such as '1,3-5'
+    (the rest are skipped), or 'q' to quit (returns None).
+    """
+    while True:
+        choice = ask("Open which? [a = all, n = none, 1,3-5 = these, q = quit]: ").strip().lower()
+        if choice == "q":
+            return None
+        if choice == "a":
+            return set(range(1, count + 1))
+        if choice == "n":
+            return set()
+        selection = parse_selection(choice, count)
+        if selection is not None:
+            return selection
+        warn(f"Invalid selection. Use numbers 1-{count}, ranges like 2-4, 'a', 'n' or 'q'.")
+
+
+def parse_selection(text: str, count: int) -> Optional[Set[int]]:
+    """Parse '1,3-5' into {1, 3, 4, 5}; None if malformed or out of 1..count."""
+    selection = set()
+    for part in text.replace(" ", "").split(","):
+        low, separator, high = part.partition("-")
+        if not low.isdigit() or (separator and not high.isdigit()):
+            return None
+        first, last = int(low), int(high) if separator else int(low)
+        if not 1 <= first <= last <= count:
+            return None
+        selection.update(range(first, last + 1))
+    return selection
+
+
 def generate_sell_url(item: Dict[str, Any]) -> str:
     """
     Generate Steam Market sell URL from item.
@@ -137,17 +387,15 @@ def generate_sell_url(item: Dict[str, Any]) -> str:
 
 def open_url_in_browser(url: str) -> None:
     """
-    Open a URL in the default browser.
+    Open a URL in the default browser without waiting for it.
     Uses explorer.exe if running in WSL.
     """
     try:
-        import platform
-        import subprocess
         if platform.system() == "Linux":
-            subprocess.run(["explorer.exe", url.replace("&", "^&")], check=False)
+            subprocess.Popen(["explorer.exe", url.replace("&", "^&")],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return
     except Exception:
         pass
 
-    import webbrowser
     webbrowser.open_new_tab(url)
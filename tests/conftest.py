@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The package modules import each other from src/ (e.g. `from utils.helpers import ...`)
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
@@ -0,0 +1,27 @@
+import json
+
+from batch import expand_exports
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+def test_expand_exports_skips_json_that_is_not_an_export(tmp_path):
+    write(tmp_path / "alice.json", {"assets": [], "descriptions": []})
+    write(tmp_path / "bob" / "page_1.json", {"more_items": 1, "assets": [{"assetid": "1"}]})
+    write(tmp_path / "exchange_rates.json", {"base": "USD", "rates": {"CAD": 1.37}})
+    write(tmp_path / "cassette.json", {"version": 1, "interactions": []})
+    write(tmp_path / "prices.json", {"Recoil Case": 0.4})
+    write(tmp_path / "alice.json.state.json", {"version": 2, "assets": {}})
+    write(tmp_path / "notes" / "todo.json", ["sell cases"])
+    (tmp_path / "broken.json").write_text("{not json")
+
+    assert expand_exports([str(tmp_path)]) == [str(tmp_path / "alice.json"), str(tmp_path / "bob") + "/"]
+
+
+def test_expand_exports_keeps_files_given_explicitly(tmp_path):
+    path = tmp_path / "odd.json"
+    write(path, {"base": "USD"})
+    assert expand_exports([str(path)]) == [str(path)]
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from inventory.categories import CASE, KNIFE, OTHER, WEAPON_SKIN, classify_type
+from inventory.inventory_stream import iter_inventory_file
+
+
+@pytest.mark.parametrize("type_name, expected", [
+    ("Base Grade Container", CASE),
+    ("Weapon Case", CASE),
+    ("Covert Knife", KNIFE),
+    ("Classified Rifle", WEAPON_SKIN),
+    ("Extraordinary Collectible", OTHER),
+    ("", OTHER),
+    (None, OTHER),
+])
+def test_classify_type(type_name, expected):
+    assert classify_type(type_name) == expected
+
+
+def test_null_type_does_not_stop_the_load(tmp_path):
+    path = tmp_path / "inventory.json"
+    path.write_text(json.dumps({
+        "assets": [{"appid": 730, "contextid": "2", "assetid": "1", "classid": "1", "instanceid": "0",
+                    "amount": "1"}],
+        "descriptions": [{"classid": "1", "instanceid": "0", "market_hash_name": "Odd Item", "type": None,
+                          "marketable": 1}],
+    }))
+
+    items = list(iter_inventory_file(str(path)))
+    assert [(item["type"], item["category"]) for item in items] == [("", OTHER)]
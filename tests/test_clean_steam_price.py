@@ -0,0 +1,54 @@
+import pytest
+
+from market.price_fetcher import clean_steam_price
+
+
+@pytest.mark.parametrize("text, expected", [
+    # USD
+    ("$0.03", 0.03),
+    ("$5", 5.0),
+    ("$1,234.56", 1234.56),
+    ("$1,234,567.89", 1234567.89),
+    # CAD
+    ("CDN$ 5.44", 5.44),
+    ("CDN$ 1,234.56", 1234.56),
+    # EUR and other comma-decimal currencies
+    ("12,34€", 12.34),
+    ("1.234,56€", 1234.56),
+    ("5,--€", 5.0),
+    ("1 234,56 pуб.", 1234.56),
+    ("CHF 1'234.50", 1234.5),
+    ("¥ 1,234", 1234.0),
+    # VND and CLP have no decimals and group thousands with "."
+    ("12.345₫", 12345.0),
+    ("1.234.567₫", 1234567.0),
+    ("CLP$ 1.234", 1234.0),
+    ("CLP$ 999", 999.0),
+])
+def test_currency_formats(text, expected):
+    assert clean_steam_price(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text, expected", [
+    # A lone separator followed by exactly three digits groups thousands,
+    # otherwise it is the decimal point; "." and "," are treated alike
+    ("1.234", 1234.0),
+    ("1,234", 1234.0),
+    ("1.23", 1.23),
+    ("1,23", 1.23),
+    ("1.2345", 1.2345),
+    ("1,2345", 1.2345),
+    # Repeats of one kind only group thousands
+    ("1.234.567", 1234567.0),
+    ("1,234,567", 1234567.0),
+    # Mixed separators: the last one is the decimal point
+    ("1,234.5", 1234.5),
+    ("1.234,5", 1234.5),
+])
+def test_ambiguous_separators(text, expected):
+    assert clean_steam_price(text) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("text", ["", None, "N/A", "--", "$", ".,"])
+def test_unparseable_input_is_zero(text):
+    assert clean_steam_price(text) == 0.0
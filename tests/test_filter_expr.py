@@ -0,0 +1,113 @@
+import pytest
+
+from filtering.filter_expr import FilterSyntaxError, compile_filter
+from filtering.filter_manager import evaluate_views
+
+# Rows as evaluate_views builds them: text fields lowercased
+KNIFE = {"category": "knife", "name": "★ karambit | doppler", "type": "covert knife",
+         "price": 900.0, "quantity": 1, "value": 900.0}
+CASE = {"category": "case", "name": "recoil case", "type": "base grade container",
+        "price": 0.4, "quantity": 30, "value": 12.0}
+STICKER = {"category": "sticker", "name": "sticker | \"quoted\" team", "type": "high grade sticker",
+           "price": 2.0, "quantity": 3, "value": 6.0}
+ROWS = [KNIFE, CASE, STICKER]
+
+
+def matching(text):
+    predicate = compile_filter(text)
+    return [row for row in ROWS if predicate(row)]
+
+
+@pytest.mark.parametrize("text, expected", [
+    # "and" binds tighter than "or"
+    ("category == case or category == knife and price < 100", [CASE]),
+    ("(category == case or category == knife) and price < 100", [CASE]),
+    ("category == sticker and price > 1 or quantity >= 30", [CASE, STICKER]),
+    # "not" binds tighter than "and", and can be stacked
+    ("not category == case and price < 100", [STICKER]),
+    ("not (category == case and price < 100)", [KNIFE, STICKER]),
+    ("not not category == knife", [KNIFE]),
+])
+def test_precedence(text, expected):
+    assert matching(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('name ~ "doppler"', [KNIFE]),
+    ("name ~ 'recoil case'", [CASE]),
+    (r'name ~ "\"quoted\""', [STICKER]),
+    (r"name ~ 'karambit | doppler'", [KNIFE]),
+    ("type ~ container", [CASE]),
+    # Text values are lowercased, so comparisons ignore case
+    ('name ~ "DOPPLER"', [KNIFE]),
+    ("CATEGORY == Knife", [KNIFE]),
+    ("category IN (Case, STICKER)", [CASE, STICKER]),
+])
+def test_quoting_and_case(text, expected):
+    assert matching(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("category in (knife, case)", [KNIFE, CASE]),
+    ("category not in (knife, case)", [STICKER]),
+    ("quantity in (1, 3)", [KNIFE, STICKER]),
+    ("category = case", [CASE]),
+    ("category != case", [KNIFE, STICKER]),
+    ("value >= 12 and value <= 900", [KNIFE, CASE]),
+    ("price > -1", ROWS),
+    ("price == 0.4", [CASE]),
+])
+def test_comparisons(text, expected):
+    assert matching(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "   ", None])
+def test_blank_expression_matches_everything(text):
+    compiled = compile_filter(text)
+    assert compiled.fields == frozenset()
+    assert all(compiled(row) for row in ROWS)
+
+
+def test_fields_lists_what_the_predicate_reads():
+    compiled = compile_filter("category in (knife) or (name ~ case and not value < 5)")
+    assert compiled.fields == {"category", "name", "value"}
+
+
+def test_evaluate_views_matches_case_insensitively():
+    items = [
+        {"market_hash_name": "★ Karambit | Doppler", "type": "Covert Knife", "recommended_price": 900.0},
+        {"market_hash_name": "Recoil Case", "type": "Base Grade Container", "recommended_price": 0.4,
+         "quantity": 30},
+    ]
+    results = evaluate_views(items, {"knives": "name ~ DOPPLER", "cheap": "category == CASE and value < 20"})
+    assert [item["market_hash_name"] for item in results["knives"].items] == ["★ Karambit | Doppler"]
+    assert [item["market_hash_name"] for item in results["cheap"].items] == ["Recoil Case"]
+
+
+@pytest.mark.parametrize("text, message", [
+    ("color == red", "Unknown field 'color' at 0; use one of category, price, name"),
+    ("price > 5 and rarity == covert", "Unknown field 'rarity' at 14"),
+    ("price > 5 $", "Unexpected character at 10: '$'"),
+    ('name ~ "unterminated', "Unexpected character at 7"),
+    ("price >", "Expected a value at 7"),
+    ("price 5", "Expected 'op' at 6"),
+    ("(price > 5", "Expected ')' at 10"),
+    ("price > 5)", "Expected 'end' at 9"),
+    ("price > 5 and", "Expected 'word' at 13"),
+    ("category in (knife case)", "Expected ')' at 19"),
+    ("category not (knife)", "Expected 'in' at 13"),
+    ("== 5", "Expected 'word' at 0"),
+    ("price > cheap", "price needs a number at 8"),
+    ("quantity in (1, many)", "quantity needs a number at 16"),
+    ("price ~ 5", "'~' (contains) needs a text field, not price"),
+    ("name > abc", "'>' needs a numeric field (price, quantity, value), not name"),
+])
+def test_syntax_errors(text, message):
+    with pytest.raises(FilterSyntaxError) as error:
+        compile_filter(text)
+    assert message in str(error.value)
+
+
+def test_syntax_error_is_a_value_error():
+    with pytest.raises(ValueError):
+        compile_filter("price >")
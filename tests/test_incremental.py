@@ -0,0 +1,77 @@
+import json
+
+from filtering import filter_manager
+from inventory import incremental
+from inventory.inventory_stream import iter_inventory_file
+from market.price_cache import PriceCache
+from market.price_providers import CachePriceProvider
+from utils.output import format_item_line
+
+
+def write_export(path, assets, descriptions):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"assets": assets, "descriptions": descriptions}, f)
+
+
+def asset(assetid, classid, amount=1):
+    return {"appid": 730, "contextid": "2", "assetid": assetid, "classid": classid, "instanceid": "0",
+            "amount": str(amount)}
+
+
+DESCRIPTIONS = [
+    {"classid": "1", "instanceid": "0", "market_hash_name": "Priced Case", "type": "Base Grade Container",
+     "marketable": 1, "recommended_price": 2.5},
+    # No recommended_price, and the empty cache below cannot price it either
+    {"classid": "2", "instanceid": "0", "market_hash_name": "Unpriced Sticker", "type": "High Grade Sticker",
+     "marketable": 1},
+]
+
+
+def test_incremental_pass_with_undescribed_asset_and_unpriced_name(tmp_path):
+    export = str(tmp_path / "inventory.json")
+    write_export(export, [asset("10", "1", 3)], DESCRIPTIONS)
+    state = incremental.AnalysisState.from_items(list(iter_inventory_file(export)))
+    state_path = incremental.state_path_for(export)
+    state.save(state_path)
+
+    # Next export: one unpriced name and one asset whose description is missing
+    write_export(export, [asset("10", "1", 3), asset("11", "2", 2), asset("12", "999")], DESCRIPTIONS)
+    provider = CachePriceProvider(PriceCache(str(tmp_path / "prices.sqlite3")))
+    state = incremental.update_state(export, incremental.AnalysisState.load(state_path), provider)
+    state.save(state_path)
+    state = incremental.AnalysisState.load(state_path)
+
+    assert all(value is not None for row in state.assets.values() for value in row.values())
+    assert state.total_quantity == 6
+    assert state.total_value == 7.5
+    # The undescribed asset counts as held but, like any non-marketable item, not per category
+    assert state.category_counts == {"case": 3, "sticker": 2}
+
+    holdings = state.holdings()
+    for inventory in (holdings, filter_manager.build_table(holdings)):
+        items, total_value, total_quantity = filter_manager.filter_with_totals(inventory, min_price=0.0)
+        assert total_value == 7.5
+        assert total_quantity == 5
+        assert sorted(format_item_line(item) for item in items) == [
+            "Priced Case x3 - $2.50", "Unpriced Sticker x2 - $0.00"]
+        assert filter_manager.count_categories(inventory) == state.category_counts
+
+
+def test_value_leaves_out_non_marketable_assets(tmp_path):
+    descriptions = DESCRIPTIONS + [
+        {"classid": "3", "instanceid": "0", "market_hash_name": "Service Medal", "type": "Extraordinary Collectible",
+         "marketable": 0, "recommended_price": 40.0},
+    ]
+    export = str(tmp_path / "inventory.json")
+    write_export(export, [asset("10", "1", 3), asset("13", "3")], descriptions)
+    state = incremental.AnalysisState.from_items(list(iter_inventory_file(export)))
+    assert state.total_value == 7.5
+
+    write_export(export, [asset("10", "1", 3), asset("13", "3"), asset("14", "3")], descriptions)
+    provider = CachePriceProvider(PriceCache(str(tmp_path / "prices.sqlite3")))
+    state = incremental.update_state(export, state, provider)
+
+    # Matches the summary's total, which only values marketable holdings
+    _, total_value, _ = filter_manager.filter_with_totals(state.holdings())
+    assert state.total_value == total_value == 7.5
+    assert state.total_quantity == 5
@@ -0,0 +1,46 @@
+import time
+
+from market.cassette import Cassette, ReplaySession
+from market.fetch_scheduler import FetchBudget
+from market.price_cache import PriceCache
+from market.price_providers import LiveSteamProvider
+
+
+def make_provider(tmp_path, budget=None):
+    cache = PriceCache(str(tmp_path / "prices.sqlite3"), ttl=0.01)
+    session = ReplaySession(Cassette(str(tmp_path / "empty_cassette.json")))  # every request misses: 404
+    return LiveSteamProvider(rate=100, cache=cache, session=session, budget=budget), cache
+
+
+def test_failed_fetches_keep_json_and_last_known_prices(tmp_path):
+    provider, cache = make_provider(tmp_path)
+    cache.put(730, "Stale Item", 1, 3.5)
+    time.sleep(0.02)
+    items = [
+        {"market_hash_name": "JSON Item", "appid": 730, "recommended_price": 12.0, "quantity": 1},
+        {"market_hash_name": "Stale Item", "appid": 730, "recommended_price": 1.0, "quantity": 2},
+    ]
+
+    provider.apply_prices(items)
+    provider.close()
+
+    assert items[0]["recommended_price"] == 12.0
+    assert items[1]["recommended_price"] == 3.5
+    coverage = provider.coverage
+    assert coverage.fresh_items == 0
+    assert coverage.total_value == 12.0 + 3.5 * 2
+    assert coverage.fresh_fraction == 0.0
+    assert not coverage.budget_exhausted
+
+
+def test_budget_flag_only_when_the_budget_cut_the_run(tmp_path):
+    budget = FetchBudget(max_requests=1)
+    provider, _ = make_provider(tmp_path, budget)
+    items = [{"market_hash_name": f"Item {i}", "appid": 730, "recommended_price": 1.0} for i in range(10)]
+
+    provider.apply_prices(items)
+    provider.close()
+
+    assert budget.stopped
+    assert provider.coverage.budget_exhausted
+    assert all(item["recommended_price"] == 1.0 for item in items)
@@ -0,0 +1,34 @@
+import json
+
+from inventory import snapshot
+from inventory.inventory_stream import iter_inventory_file
+
+
+def write_export(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "assets": [{"appid": 730, "contextid": "2", "assetid": "1", "classid": "1", "instanceid": "0",
+                        "amount": "2"}],
+            "descriptions": [{"classid": "1", "instanceid": "0", "market_hash_name": "Recoil Case",
+                              "type": "Base Grade Container", "marketable": 1, "recommended_price": 0.4}],
+        }, f)
+    return path
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = write_export(tmp_path)
+    items = list(iter_inventory_file(path))
+    snapshot.write_snapshot(path, items)
+
+    loaded = snapshot.load_snapshot(path)
+    assert [item.to_dict() for item in loaded] == [item.to_dict() for item in items]
+    assert loaded[0]["category"] == "case"
+
+
+def test_snapshot_is_ignored_after_category_rules_change(tmp_path, monkeypatch):
+    path = write_export(tmp_path)
+    snapshot.write_snapshot(path, list(iter_inventory_file(path)))
+
+    monkeypatch.setattr(snapshot, "RULES_DIGEST", b"\0" * 8)
+    assert snapshot.load_snapshot(path) is None
@@ -0,0 +1,42 @@
+import json
+
+from workflow import workflow_runner
+
+
+def make_queue():
+    return [
+        {"market_hash_name": "Holding", "appid": 730, "assetid": "1", "assetids": ["1", "2", "3"], "quantity": 3},
+        {"market_hash_name": "Single", "appid": 730, "assetid": "4"},
+    ]
+
+
+def run(monkeypatch, queue, answers, tmp_path):
+    opened = []
+    replies = iter(answers)
+    monkeypatch.setattr(workflow_runner, "open_url_in_browser", opened.append)
+    monkeypatch.setattr("builtins.input", lambda *args: next(replies))
+    monkeypatch.chdir(tmp_path)
+    workflow_runner.run_assisted_workflow(queue, pause_seconds=0)
+    return opened
+
+
+def test_checkpoint_records_every_asset_of_a_holding(monkeypatch, tmp_path):
+    queue = make_queue()
+    assert len(run(monkeypatch, queue, ["y", "q"], tmp_path)) == 1
+
+    path = tmp_path / workflow_runner.checkpoint_path_for(queue)
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["keys"] for line in lines] == [["1", "2", "3"]]
+
+    # Running the same queue again resumes after the holding
+    opened = run(monkeypatch, queue, ["y"], tmp_path)
+    assert len(opened) == 1 and "Single" in opened[0]
+
+
+def test_checkpoint_is_kept_per_queue(monkeypatch, tmp_path):
+    queue = make_queue()
+    run(monkeypatch, queue, ["n", "n"], tmp_path)
+
+    other = [dict(queue[1]), {"market_hash_name": "Other", "appid": 730, "assetid": "5"}]
+    assert workflow_runner.checkpoint_path_for(other) != workflow_runner.checkpoint_path_for(queue)
+    assert len(run(monkeypatch, other, ["y", "y"], tmp_path)) == 2